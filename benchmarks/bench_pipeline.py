@@ -0,0 +1,358 @@
+"""
+Offline benchmarks for the LBA pipeline.
+
+Usage
+─────
+    python benchmarks/bench_pipeline.py                     # quick suite
+    python benchmarks/bench_pipeline.py --suite full --out bench.json
+    python benchmarks/bench_pipeline.py --compare bench.json --threshold 0.2
+
+Every case is timed `--repeat` times and reported by median/min seconds as
+JSON. With `--compare`, cases slower than the baseline median by more than
+`--threshold` are listed and the exit code is 1.
+"""
+
+from __future__ import annotations
+import argparse
+import itertools
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import numpy as np
+import pandas as pd
+import scipy
+
+from yassa_bio.core.registry import get
+from yassa_bio.evaluation.run import run
+from yassa_bio.evaluation.context import LBAContext
+from yassa_bio.evaluation.analysis.engine.select import select_model
+from yassa_bio.evaluation.analysis.step.preprocess import LoadData, MaskOutliers
+from yassa_bio.evaluation.acceptance.engine.analytical.calibration import (
+    eval_calibration,
+)
+from yassa_bio.evaluation.acceptance.engine.analytical.qc import eval_qc
+from yassa_bio.schema.analysis.config import LBAAnalysisConfig
+from yassa_bio.schema.analysis.enum import CurveModel, OutlierRule, Weighting
+from yassa_bio.schema.analysis.fit import ModelSelection
+from yassa_bio.schema.acceptance.analytical.spec import LBAAnalyticalAcceptanceCriteria
+from yassa_bio.schema.layout.enum import PlateFormat
+from yassa_bio.utils.category import as_categorical
+from yassa_bio.utils.standard import series_concentration_map
+from yassa_bio.utils.synthetic import SyntheticDesign, generate_batch
+
+Case = tuple[str, dict[str, Any], Callable[[], Callable[[], Any]]]
+
+SUITES = {
+    "quick": {
+        "formats": [PlateFormat.FMT_96, PlateFormat.FMT_384],
+        "batch_sizes": [1, 10],
+        "models": [CurveModel.FOUR_PL],
+        "outliers": [OutlierRule.NONE, OutlierRule.GRUBBS],
+        "weightings": [Weighting.ONE],
+        "acceptance_wells": [10_000],
+    },
+    "full": {
+        "formats": [PlateFormat.FMT_96, PlateFormat.FMT_384, PlateFormat.FMT_1536],
+        "batch_sizes": [1, 10, 100, 500],
+        "models": list(CurveModel),
+        "outliers": list(OutlierRule),
+        "weightings": list(Weighting),
+        "acceptance_wells": [10_000, 100_000, 1_000_000],
+    },
+}
+
+
+def _config(model, outlier, weighting) -> LBAAnalysisConfig:
+    return LBAAnalysisConfig(
+        preprocess={"outliers": {"rule": outlier}},
+        curve_fit={"model": model, "weighting": weighting},
+    )
+
+
+def _cold(batch) -> None:
+    batch._df = None
+    for p in batch.plates:
+        p._df = None
+
+
+def _acceptance_ctx(batch, n_wells: int) -> LBAContext:
+    """
+    Context holding `n_wells` wells, half standards over eight levels and half
+    QCs over low/mid/high, with an identity curve and 5% signal noise.
+    """
+    rng = np.random.default_rng(0)
+    half = n_wells // 2
+    cal_x = np.repeat(np.linspace(1.0, 8.0, 8), -(-half // 8))[:half]
+    qc_x = np.repeat([2.0, 4.0, 6.0], -(-half // 3))[:half]
+    x = np.concatenate([cal_x, qc_x])
+    df = as_categorical(
+        pd.DataFrame(
+            {
+                "sample_type": ["calibration_standard"] * half
+                + ["quality_control"] * half,
+                "qc_level": [None] * half
+                + list(np.repeat(["low", "mid", "high"], -(-half // 3))[:half]),
+                "concentration": x,
+                "x": x,
+                "y": x * (1 + 0.05 * rng.standard_normal(x.size)),
+            }
+        )
+    )
+    ctx = LBAContext(
+        batch_data=batch,
+        analysis_config=_config(CurveModel.FOUR_PL, OutlierRule.NONE, Weighting.ONE),
+        acceptance_criteria=LBAAnalyticalAcceptanceCriteria(),
+        data=df,
+        calib_df=df.iloc[:half],
+    )
+    ctx.curve_back = np.asarray
+    return ctx
+
+
+def iter_cases(suite: dict, work: Path) -> Iterator[Case]:
+    batches = {}
+
+    def batch(fmt, n):
+        if (fmt, n) not in batches:
+            design = SyntheticDesign(plate_format=fmt, noise_cv=0.02)
+            out = work / f"{fmt.value}x{n}"
+            batches[fmt, n] = generate_batch(design, out, n, seed=0).batch
+        return batches[fmt, n]
+
+    for fmt in suite["formats"]:
+
+        def plate_df(fmt=fmt):
+            plate = batch(fmt, 1).plates[0]
+
+            def fn():
+                plate._df = None
+                return plate.df
+
+            return fn
+
+        yield "plate_df", {"format": fmt.value}, plate_df
+
+    for n in suite["batch_sizes"]:
+
+        def batch_df(n=n):
+            b = batch(PlateFormat.FMT_96, n)
+
+            def fn():
+                _cold(b)
+                return b.df
+
+            return fn
+
+        yield "batch_df", {"format": 96, "plates": n}, batch_df
+
+    design = SyntheticDesign()
+    x = np.repeat(list(series_concentration_map(design.standards).values()), 2)
+    y = design.signal(x) * (1 + 0.03 * np.random.default_rng(1).standard_normal(x.size))
+    for model, weighting in itertools.product(suite["models"], suite["weightings"]):
+
+        def fit(model=model, weighting=weighting):
+            w = get("weighting", weighting)(x, y)
+            if model is CurveModel.AUTO:
+                return lambda: select_model(x, y, w, ModelSelection())
+            fit_fn = get("curve_model", model)
+            return lambda: fit_fn(x, y, weights=w)
+
+        yield "curve_fit", {"model": model.value, "weighting": weighting.value}, fit
+
+    for fmt, rule in itertools.product(suite["formats"], suite["outliers"]):
+
+        def mask(fmt=fmt, rule=rule):
+            ctx = LoadData().run(
+                LBAContext(
+                    batch_data=batch(fmt, 1),
+                    analysis_config=_config(CurveModel.FOUR_PL, rule, Weighting.ONE),
+                    acceptance_criteria=LBAAnalyticalAcceptanceCriteria(),
+                )
+            )
+            data = ctx.data.copy()
+
+            def fn():
+                ctx.data = data.copy()
+                return MaskOutliers().run(ctx)
+
+            return fn
+
+        yield "mask_outliers", {"format": fmt.value, "rule": rule.value}, mask
+
+    for n in suite["batch_sizes"]:
+
+        def acceptance(n=n):
+            ctx = run(
+                batch(PlateFormat.FMT_96, n),
+                _config(CurveModel.FOUR_PL, OutlierRule.NONE, Weighting.ONE),
+                LBAAnalyticalAcceptanceCriteria(),
+            )
+            crit = ctx.acceptance_criteria
+
+            def fn():
+                eval_calibration(ctx, crit.calibration)
+                eval_qc(ctx, crit.qc)
+
+            return fn
+
+        yield "acceptance", {"format": 96, "plates": n}, acceptance
+
+    for n in suite["acceptance_wells"]:
+
+        def acceptance_wells(n=n):
+            ctx = _acceptance_ctx(batch(PlateFormat.FMT_96, 1), n)
+            crit = ctx.acceptance_criteria
+
+            def fn():
+                eval_calibration(ctx, crit.calibration)
+                eval_qc(ctx, crit.qc)
+
+            return fn
+
+        yield "acceptance_wells", {"wells": n}, acceptance_wells
+
+    combos = itertools.product(
+        suite["formats"], suite["models"], suite["outliers"], suite["weightings"]
+    )
+    for fmt, model, rule, weighting in combos:
+
+        def pipeline(fmt=fmt, model=model, rule=rule, weighting=weighting):
+            b = batch(fmt, 1)
+            cfg = _config(model, rule, weighting)
+            crit = LBAAnalyticalAcceptanceCriteria()
+
+            def fn():
+                _cold(b)
+                return run(b, cfg, crit)
+
+            return fn
+
+        params = {
+            "format": fmt.value,
+            "model": model.value,
+            "rule": rule.value,
+            "weighting": weighting.value,
+        }
+        yield "pipeline", params, pipeline
+
+    for n in suite["batch_sizes"]:
+
+        def pipeline_batch(n=n):
+            b = batch(PlateFormat.FMT_96, n)
+            cfg = _config(CurveModel.FOUR_PL, OutlierRule.NONE, Weighting.ONE)
+            crit = LBAAnalyticalAcceptanceCriteria()
+
+            def fn():
+                _cold(b)
+                return run(b, cfg, crit)
+
+            return fn
+
+        yield "pipeline_batch", {"format": 96, "plates": n}, pipeline_batch
+
+
+def time_case(fn: Callable[[], Any], repeat: int) -> list[float]:
+    fn()  # warm-up
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def case_id(name: str, params: dict[str, Any]) -> str:
+    return name + "".join(f"[{k}={v}]" for k, v in sorted(params.items()))
+
+
+def run_suite(suite: str, repeat: int) -> dict[str, Any]:
+    results = []
+    with tempfile.TemporaryDirectory(prefix="yassa_bench_") as tmp:
+        for name, params, setup in iter_cases(SUITES[suite], Path(tmp)):
+            rec: dict[str, Any] = {"id": case_id(name, params), "name": name}
+            rec["params"] = params
+            try:
+                times = time_case(setup(), repeat)
+                rec.update(
+                    status="ok",
+                    median_s=statistics.median(times),
+                    min_s=min(times),
+                    repeat=repeat,
+                )
+            except Exception as exc:
+                rec.update(status="error", error=f"{type(exc).__name__}: {exc}")
+            print(_fmt(rec), file=sys.stderr)
+            results.append(rec)
+
+    return {
+        "meta": {
+            "suite": suite,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "scipy": scipy.__version__,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[dict]:
+    base = {r["id"]: r for r in baseline["results"] if r["status"] == "ok"}
+    regressions = []
+    for rec in current["results"]:
+        old = base.get(rec["id"])
+        if rec["status"] != "ok" or old is None:
+            continue
+        rec["baseline_median_s"] = old["median_s"]
+        rec["ratio"] = rec["median_s"] / old["median_s"]
+        if rec["ratio"] > 1 + threshold:
+            regressions.append(rec)
+    return regressions
+
+
+def _fmt(rec: dict) -> str:
+    if rec["status"] != "ok":
+        return f"{rec['id']:<70} {rec['error']}"
+    return f"{rec['id']:<70} {rec['median_s'] * 1e3:10.3f} ms"
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--suite", choices=sorted(SUITES), default="quick")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--out", type=Path, help="Write JSON results here.")
+    ap.add_argument("--compare", type=Path, help="Baseline JSON to compare with.")
+    ap.add_argument("--threshold", type=float, default=0.2)
+    args = ap.parse_args(argv)
+
+    logging.disable(logging.INFO)
+    report = run_suite(args.suite, args.repeat)
+
+    regressions: list[dict] = []
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(report, baseline, args.threshold)
+        report["meta"]["baseline"] = str(args.compare)
+        for rec in regressions:
+            print(f"REGRESSION {rec['id']}: x{rec['ratio']:.2f}", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        args.out.write_text(text)
+    else:
+        print(text)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,23 @@
 from __future__ import annotations
+import numpy as np
+
 from yassa_bio.core.registry import register
 from yassa_bio.evaluation.context import LBAContext
+from yassa_bio.evaluation.roles import role_index
 from yassa_bio.schema.acceptance.analytical.calibration import AnalyticalCalibrationSpec
 from yassa_bio.evaluation.acceptance.engine.utils import (
     check_required_well_patterns,
     pattern_error_dict,
-    compute_relative_pct_vectorized,
+    relative_pct,
+    back_calculate,
 )
+from yassa_bio.schema.layout.enum import SampleType
+from yassa_bio.utils.group import group_codes, group_stat
 
 
 @register("acceptance", AnalyticalCalibrationSpec.__name__)
 def eval_calibration(ctx: LBAContext, spec: AnalyticalCalibrationSpec) -> dict:
-    cal = ctx.calib_df.copy()
+    cal = ctx.calib_df
 
     # Ensure required well patterns are present
     missing = check_required_well_patterns(cal, spec.required_well_patterns)
@@ -20,36 +26,38 @@ def eval_calibration(ctx: LBAContext, spec: AnalyticalCalibrationSpec) -> dict:
             missing, "Missing {n} required calibration pattern(s)"
         )
 
-    # Back-calculate concentrations
-    cal["back_calc"] = ctx.curve_back(cal["y"].to_numpy(float))
+    # Back-calculate concentrations and average them per level
+    codes, levels = group_codes(cal["concentration"])
+    n_levels = len(levels)
+    every = np.ones(len(cal), dtype=bool)
+    # calib_df is ctx.data at the calibration rows (SelectCalibrationData)
+    cal_rows = role_index(ctx).rows(SampleType.CALIBRATION_STANDARD)
+    back = back_calculate(ctx, cal, cal_rows)
+    back_mean = group_stat(back, every, codes, n_levels, "mean")
+    x_mean = group_stat(cal["x"].to_numpy(float), every, codes, n_levels, "mean")
+    acc_pct = relative_pct(np.abs(back_mean - x_mean), x_mean)
 
-    # Group by level and calculate bias
-    by_lvl = cal.groupby("concentration")
-    summary = (
-        by_lvl[["x", "back_calc"]].mean().rename(columns={"back_calc": "back_mean"})
-    )
-    summary["acc_pct"] = compute_relative_pct_vectorized(
-        (summary["back_mean"] - summary["x"]).abs(), summary["x"]
-    )
+    # A level with any NaN back-calculation (e.g. from a failed fit) fails
+    leveled = codes >= 0
+    missing_back = np.bincount(
+        codes[leveled & np.isnan(back)], minlength=n_levels
+    ).astype(bool)
 
-    # Flag edge levels and assess tolerance
-    edge_levels = {summary.index.min(), summary.index.max()}
-    summary["is_edge"] = summary.index.isin(edge_levels)
-    summary["pass"] = summary.apply(
-        lambda r: r["acc_pct"]
-        <= (spec.acc_tol_pct_edge if r["is_edge"] else spec.acc_tol_pct_mid),
-        axis=1,
-    )
+    # Edge levels (lowest and highest) get their own tolerance; NaN fails
+    rank = np.arange(n_levels)
+    is_edge = (rank == 0) | (rank == n_levels - 1)
+    tol = np.where(is_edge, spec.acc_tol_pct_edge, spec.acc_tol_pct_mid)
+    passed = (acc_pct <= tol) & ~missing_back
 
     # Compute overall pass/fail
-    n_levels = len(summary)
-    n_pass = int(summary["pass"].sum())
+    n_pass = int(passed.sum())
     frac_pass = n_pass / n_levels if n_levels else 0.0
-    failing_levels = summary[~summary["pass"]].index
+    failing_levels = levels[~passed].tolist()
     n_retained = n_levels - len(failing_levels)
     can_refit = n_retained >= spec.min_retained_levels
     overall_pass = (
-        can_refit
+        not ctx.fit_failures
+        and can_refit
         and frac_pass >= spec.pass_fraction
         and len(failing_levels) == 0
         and n_levels >= spec.min_levels
@@ -59,8 +67,12 @@ def eval_calibration(ctx: LBAContext, spec: AnalyticalCalibrationSpec) -> dict:
         "num_levels": n_levels,
         "num_pass": n_pass,
         "pass_fraction": frac_pass,
-        "failing_levels": failing_levels.tolist(),
-        "per_level": summary[["acc_pct", "pass"]].to_dict(orient="index"),
+        "failing_levels": failing_levels,
+        "per_level": {
+            lvl: {"acc_pct": float(a), "pass": bool(p)}
+            for lvl, a, p in zip(levels.tolist(), acc_pct, passed)
+        },
         "can_refit": can_refit,
+        "fit_failures": dict(ctx.fit_failures),
         "pass": overall_pass,
     }
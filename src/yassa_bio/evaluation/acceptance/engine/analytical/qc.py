@@ -1,56 +1,124 @@
 from __future__ import annotations
+import numpy as np
+import pandas as pd
+
 from yassa_bio.core.registry import register
 from yassa_bio.evaluation.context import LBAContext
 from yassa_bio.schema.acceptance.analytical.qc import AnalyticalQCSpec
-from yassa_bio.schema.layout.enum import SampleType, QCLevel
+from yassa_bio.schema.layout.enum import QCLevel, SampleType
+from yassa_bio.evaluation.roles import role_index
 from yassa_bio.evaluation.acceptance.engine.utils import (
     check_required_well_patterns,
     pattern_error_dict,
-    compute_relative_pct_vectorized,
+    relative_pct,
+    back_calculate,
 )
+from yassa_bio.utils.category import as_categorical
+from yassa_bio.utils.group import group_moments, group_stat
+
+
+def _level_codes(qc_df: pd.DataFrame) -> tuple[np.ndarray, list[str]]:
+    """
+    QC level code per row (-1 without a level) and the level of each code,
+    in `QCLevel` order with custom levels after. Levels may have no rows.
+    """
+    if "qc_level" not in qc_df:
+        return np.full(len(qc_df), -1, dtype=np.intp), []
+    col = qc_df["qc_level"]
+    if not isinstance(col.dtype, pd.CategoricalDtype):
+        col = as_categorical(col.to_frame())["qc_level"]
+    return col.cat.codes.to_numpy(np.intp), [str(c) for c in col.cat.categories]
+
+
+def _within(
+    values: np.ndarray,
+    is_edge: np.ndarray,
+    tol: float | None,
+    tol_edge: float | None,
+) -> np.ndarray:
+    """
+    `values <= tol` per level, with `tol_edge` at LLOQ/ULOQ. NaN values (fewer
+    than two replicates) and a disabled check (`tol` None) pass.
+    """
+    if tol is None:
+        return np.ones(len(values), dtype=bool)
+    limit = np.where(is_edge, tol if tol_edge is None else tol_edge, tol)
+    return np.isnan(values) | (values <= limit)
 
 
 @register("acceptance", AnalyticalQCSpec.__name__)
 def eval_qc(ctx: LBAContext, spec: AnalyticalQCSpec) -> dict:
     df = ctx.data
-    qc_df = df[df["sample_type"] == SampleType.QUALITY_CONTROL.value].copy()
+    roles = role_index(ctx)
+    qc_rows = roles.rows(SampleType.QUALITY_CONTROL)
+    qc_df = df.iloc[qc_rows]
 
     # Check required QC well patterns
     missing = check_required_well_patterns(qc_df, spec.required_well_patterns)
     if missing:
         return pattern_error_dict(missing, "Missing {n} required QC pattern(s)")
 
-    # Compute per-well accuracy
-    qc_df["back_calc"] = ctx.curve_back(qc_df["y"].to_numpy(float))
-    qc_df["acc_pct"] = compute_relative_pct_vectorized(
-        (qc_df["back_calc"] - qc_df["x"]).abs(), qc_df["x"]
+    # Compute per-well accuracy; NaN (no back-calculation) fails
+    x = qc_df["x"].to_numpy(float)
+    back = back_calculate(ctx, qc_df, qc_rows)
+    acc_pct = relative_pct(np.abs(back - x), x)
+    ok = acc_pct <= spec.acc_tol_pct
+
+    # Summarize every QC level present in one bincount pass
+    codes, levels = _level_codes(qc_df)
+    n_levels = len(levels)
+    leveled = codes >= 0
+    n_lvl = np.bincount(codes[leveled], minlength=n_levels)
+    n_pass_lvl = np.bincount(codes[leveled & ok], minlength=n_levels)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        frac_lvl = np.where(n_lvl > 0, n_pass_lvl / n_lvl, 0.0)
+    meets = frac_lvl >= spec.pass_fraction_each_level
+
+    # Precision and total error from the same back-calculated values
+    _, back_mean, back_sd = group_moments(back, codes, n_levels)
+    x_mean = group_stat(x, leveled, codes, n_levels, "mean")
+    bias_pct = relative_pct(back_mean - x_mean, x_mean)
+    cv_pct = relative_pct(back_sd, np.abs(back_mean))
+    te_pct = np.abs(bias_pct) + cv_pct
+    is_edge = np.isin(levels, [QCLevel.LLOQ.value, QCLevel.ULOQ.value])
+    meets_cv = _within(cv_pct, is_edge, spec.cv_tol_pct, spec.cv_tol_pct_edge)
+    meets_te = _within(
+        te_pct, is_edge, spec.total_error_tol_pct, spec.total_error_tol_pct_edge
     )
-    qc_df["ok"] = qc_df["acc_pct"] <= spec.acc_tol_pct
 
-    # Summarize by QC level
     n_total = len(qc_df)
-    n_pass_total = int(qc_df["ok"].sum())
+    n_pass_total = int(ok.sum())
     frac_pass_total = n_pass_total / n_total if n_total else 0.0
-    per_level: dict[str, dict] = {}
-    failing_idxs: list[int] = []
-
-    for lvl in (QCLevel.LOW, QCLevel.MID, QCLevel.HIGH):
-        sub = qc_df[qc_df["qc_level"] == lvl.value]
-        n_lvl = len(sub)
-        n_pass_lvl = int(sub["ok"].sum())
-        frac_lvl = n_pass_lvl / n_lvl if n_lvl else 0.0
-
-        per_level[lvl.value] = {
-            "n": n_lvl,
-            "num_pass": n_pass_lvl,
-            "pass_frac": frac_lvl,
-            "meets_level_fraction": frac_lvl >= spec.pass_fraction_each_level,
+    per_level = {
+        levels[i]: {
+            "n": int(n_lvl[i]),
+            "num_pass": int(n_pass_lvl[i]),
+            "pass_frac": float(frac_lvl[i]),
+            "meets_level_fraction": bool(meets[i]),
+            "mean_bias_pct": float(bias_pct[i]),
+            "cv_pct": float(cv_pct[i]),
+            "total_error_pct": float(te_pct[i]),
+            "meets_precision": bool(meets_cv[i]),
+            "meets_total_error": bool(meets_te[i]),
         }
-        failing_idxs.extend(sub[~sub["ok"]].index.tolist())
+        for i in np.flatnonzero(n_lvl)
+    }
+
+    # Failing wells (by frame label), grouped by level in level order
+    failing = np.flatnonzero(leveled & ~ok)
+    failing = failing[np.argsort(codes[failing], kind="stable")]
+    failing_idxs = qc_df.index.to_numpy()[failing].tolist()
 
-    # Determine overall result
-    overall_pass = frac_pass_total >= spec.pass_fraction_total and all(
-        v["meets_level_fraction"] for v in per_level.values()
+    # Determine overall result; any failed curve fit fails QC
+    overall_pass = (
+        not ctx.fit_failures
+        and frac_pass_total >= spec.pass_fraction_total
+        and all(
+            v["meets_level_fraction"]
+            and v["meets_precision"]
+            and v["meets_total_error"]
+            for v in per_level.values()
+        )
     )
 
     return {
@@ -59,5 +127,6 @@ def eval_qc(ctx: LBAContext, spec: AnalyticalQCSpec) -> dict:
         "pass_fraction": frac_pass_total,
         "per_level": per_level,
         "failing_wells": failing_idxs,
+        "fit_failures": dict(ctx.fit_failures),
         "pass": overall_pass,
     }
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 
+from yassa_bio.evaluation.backcalc import back_calc
 from yassa_bio.schema.acceptance.pattern import RequiredWellPattern
 from yassa_bio.schema.layout.enum import QCLevel, CalibrationLevel
 
@@ -56,12 +57,52 @@ def get_calibration_concentration_for_level(
         raise ValueError(f"Unsupported level for calibration lookup: {level}")
 
 
+def back_calculate(ctx, df: pd.DataFrame, rows: np.ndarray | None = None) -> np.ndarray:
+    """
+    Back-calculated x for every row of `df`. When `df` is `ctx.data.iloc[rows]`
+    (`rows` being positions into `ctx.data`, e.g. from `role_index(ctx)`) the
+    values are read from its shared `back_calc` column (see
+    `yassa_bio.evaluation.backcalc`). Without `rows`, `df` is back-calculated
+    directly, dispatched to each row's group curve when the fit is per group
+    (`curve_fit.fit_by`).
+    """
+    if rows is not None:
+        if len(rows) != len(df):
+            raise ValueError(f"{len(rows)} row positions given for {len(df)} rows")
+        return back_calc(ctx)[rows]
+
+    y = df["y"].to_numpy(float)
+    by = ctx.analysis_config.curve_fit.fit_by
+    if by is None:
+        return ctx.curve_back(y)
+    return ctx.curve_back(y, df[by])
+
+
 def compute_relative_pct_scalar(
     numerator: float, denominator: float | None
 ) -> float | None:
     return (numerator / denominator * 100.0) if denominator else None
 
 
+def relative_pct(
+    numerator: pd.Series | np.ndarray,
+    denominator: pd.Series | np.ndarray,
+    *,
+    masked: bool = False,
+) -> np.ndarray | np.ma.MaskedArray:
+    """
+    Element-wise (numerator / denominator * 100) as float64, NaN where the
+    denominator is 0 or null. With `masked=True` the NaN entries are masked
+    instead, returning a `np.ma.MaskedArray`.
+    """
+    num = np.asarray(numerator, dtype=float)
+    den = np.asarray(denominator, dtype=float)
+    out = np.full(np.broadcast(num, den).shape, np.nan)
+    np.divide(num, den, out=out, where=(den != 0) & ~np.isnan(den))
+    out *= 100.0
+    return np.ma.masked_invalid(out, copy=False) if masked else out
+
+
 def compute_relative_pct_vectorized(
     numerator: pd.Series | np.ndarray,
     denominator: pd.Series | np.ndarray,
@@ -69,13 +110,10 @@ def compute_relative_pct_vectorized(
     """
     Element-wise compute (numerator / denominator * 100),
     with None if denominator is 0 or null.
-    Returns a NumPy array of dtype=object containing floats or None.
+    Returns a NumPy array of dtype=object containing floats or None; the
+    acceptance engines use the float-typed `relative_pct` instead.
     """
-    numerator = np.asarray(numerator)
-    denominator = np.asarray(denominator)
-
-    result = np.empty_like(numerator, dtype=object)
-    mask_valid = (denominator != 0) & ~pd.isna(denominator)
-    result[mask_valid] = (numerator[mask_valid] / denominator[mask_valid]) * 100.0
-    result[~mask_valid] = None
+    den = np.asarray(denominator, dtype=float)
+    result = relative_pct(numerator, den).astype(object)
+    result[(den == 0) | np.isnan(den)] = None
     return result
@@ -1,15 +1,17 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 import logging
 
-from lilpipe.step import Step
+from yassa_bio.evaluation.instrument import InstrumentedStep
 from yassa_bio.evaluation.acceptance.step.dispatcher import EvaluateSpecs
 from yassa_bio.evaluation.context import LBAContext
+from yassa_bio.evaluation.roles import role_index
 
 log = logging.getLogger(__name__)
 
 
-class CheckRerun(Step):
+class CheckRerun(InstrumentedStep):
     """
     Drop failing calibration levels (when refit is allowed) and trigger a pipeline
     rerun, which skips the remaining Analytical steps.
@@ -37,12 +39,19 @@ class CheckRerun(Step):
             )
 
             df: pd.DataFrame = ctx.data
-            mask_fail = df["sample_type"].eq("calibration_standard") & df[
-                "concentration"
-            ].isin(failing_levels)
-            ctx.dropped_cal_wells = df.loc[mask_fail].copy()
+            roles = role_index(ctx)
+            rows = np.sort(np.concatenate([roles.cal_rows(c) for c in failing_levels]))
+
+            dropped = df.iloc[rows].copy()
+            if ctx.dropped_cal_wells is not None:
+                dropped = pd.concat([ctx.dropped_cal_wells, dropped], ignore_index=True)
+            ctx.dropped_cal_wells = dropped
+            # Remembered so ExcludeData drops them again when the next pass reloads.
+            ctx.dropped_cal_levels = sorted(
+                set(ctx.dropped_cal_levels) | failing_levels
+            )
 
-            ctx.data = df.loc[~mask_fail].reset_index(drop=True)
+            ctx.data = df.drop(index=df.index[rows]).reset_index(drop=True)
             ctx.calib_df = None
 
             ctx.abort_pass()
@@ -50,7 +59,7 @@ class CheckRerun(Step):
         return ctx
 
 
-class Analytical(Step):
+class Analytical(InstrumentedStep):
     name = "analytical"
 
     def __init__(self) -> None:
@@ -1,4 +1,4 @@
-from lilpipe.step import Step
+from yassa_bio.evaluation.instrument import InstrumentedStep
 from yassa_bio.core.registry import get
 from yassa_bio.evaluation.context import LBAContext
 from yassa_bio.schema.acceptance.analytical.spec import (
@@ -6,7 +6,7 @@ from yassa_bio.schema.acceptance.analytical.spec import (
 )
 
 
-class EvaluateSpecs(Step):
+class EvaluateSpecs(InstrumentedStep):
     name = "evaluate_specs"
 
     def __init__(self) -> None:
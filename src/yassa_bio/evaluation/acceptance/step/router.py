@@ -2,9 +2,10 @@ from pydantic import BaseModel
 
 from lilpipe.step import Step
 from lilpipe.models import PipelineContext
+from yassa_bio.evaluation.instrument import InstrumentedStep
 
 
-class Acceptance(Step):
+class Acceptance(InstrumentedStep):
     name = "acceptance_criteria"
 
     def __init__(self, criteria: dict[BaseModel, Step]):
@@ -1,27 +1,46 @@
+from __future__ import annotations
+
 import numpy as np
 
 from yassa_bio.schema.analysis.enum import BlankRule
 from yassa_bio.core.registry import register
+from yassa_bio.utils.group import group_stat
+
+
+def _blank(
+    vals: np.ndarray, mask: np.ndarray, groups: np.ndarray | None, how: str
+) -> float | np.ndarray | None:
+    """`how` of the finite blank signals; None (NaN per group) without any."""
+    if groups is None:
+        stat = group_stat(vals, mask, np.zeros(len(vals), dtype=np.intp), 1, how)
+        return None if np.isnan(stat[0]) else float(stat[0])
+    n = int(groups.max()) + 1 if len(groups) else 0
+    return group_stat(vals, mask, groups, n, how)
 
 
 @register("blank_rule", BlankRule.MEAN)
-def _blank_mean(vals: np.ndarray, mask: np.ndarray) -> float | None:
-    m = vals[mask]
-    return float(m.mean()) if m.size else None
+def _blank_mean(
+    vals: np.ndarray, mask: np.ndarray, groups: np.ndarray | None = None
+) -> float | np.ndarray | None:
+    return _blank(vals, mask, groups, "mean")
 
 
 @register("blank_rule", BlankRule.MEDIAN)
-def _blank_median(vals: np.ndarray, mask: np.ndarray) -> float | None:
-    m = vals[mask]
-    return float(np.median(m)) if m.size else None
+def _blank_median(
+    vals: np.ndarray, mask: np.ndarray, groups: np.ndarray | None = None
+) -> float | np.ndarray | None:
+    return _blank(vals, mask, groups, "median")
 
 
 @register("blank_rule", BlankRule.MINIMUM)
-def _blank_min(vals: np.ndarray, mask: np.ndarray) -> float | None:
-    m = vals[mask]
-    return float(m.min()) if m.size else None
+def _blank_min(
+    vals: np.ndarray, mask: np.ndarray, groups: np.ndarray | None = None
+) -> float | np.ndarray | None:
+    return _blank(vals, mask, groups, "min")
 
 
 @register("blank_rule", BlankRule.NONE)
-def _blank_none(vals: np.ndarray, mask: np.ndarray) -> None:
+def _blank_none(
+    vals: np.ndarray, mask: np.ndarray, groups: np.ndarray | None = None
+) -> None:
     return None
@@ -1,8 +1,81 @@
-from scipy.optimize import curve_fit
+from __future__ import annotations
+import warnings
+from functools import partial
+from typing import Any, Callable, NamedTuple, Optional, Protocol, runtime_checkable
+
+from scipy.optimize import OptimizeWarning, curve_fit
 import numpy as np
 
 from yassa_bio.core.registry import register
-from yassa_bio.schema.analysis.enum import CurveModel
+from yassa_bio.schema.analysis.enum import CurveModel, SolverMethod
+from yassa_bio.schema.analysis.fit import SolverOptions
+
+
+class FitDiagnostics(NamedTuple):
+    """
+    Goodness-of-fit and convergence figures taken from the fit itself.
+
+    `residuals` are weighted (sqrt(w) * (y - fitted)); `r_squared` is the
+    weighted coefficient of determination; `aic`/`bic` use the Gaussian
+    likelihood of the weighted residuals. `nfev` is None for closed-form fits.
+    """
+
+    covariance: np.ndarray
+    std_errors: np.ndarray
+    residuals: np.ndarray
+    r_squared: float
+    aic: float
+    bic: float
+    nfev: Optional[int]
+    solver_message: str
+
+
+class FitResult(NamedTuple):
+    """Fitted forward curve and parameters, or ok=False with the reason."""
+
+    fwd: Optional[Callable[[np.ndarray], np.ndarray]]
+    params: Optional[np.ndarray]
+    ok: bool = True
+    message: str = ""
+    diagnostics: Optional[FitDiagnostics] = None
+
+
+@runtime_checkable
+class Curve(Protocol):
+    """
+    Fitted curve as stored on the context. Curves fitted per group (see
+    `curve_fit.fit_by`) need each value's group in `groups`; a single curve
+    ignores it.
+    """
+
+    def __call__(self, values: Any, groups: Any = None) -> np.ndarray: ...
+
+
+def _diagnostics(
+    residuals: np.ndarray,
+    y: np.ndarray,
+    weights: Optional[np.ndarray],
+    covariance: np.ndarray,
+    nfev: Optional[int],
+    solver_message: str,
+) -> FitDiagnostics:
+    w = np.ones_like(y) if weights is None else weights
+    n, k = len(y), len(covariance)
+    ssr = float(residuals @ residuals)
+    sst = float(w @ (y - np.average(y, weights=w)) ** 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        loglik_term = n * np.log(ssr / n)
+        std_errors = np.sqrt(np.diag(covariance))
+    return FitDiagnostics(
+        covariance=covariance,
+        std_errors=std_errors,
+        residuals=residuals,
+        r_squared=1.0 - ssr / sst if sst else float("nan"),
+        aic=float(loglik_term + 2 * k),
+        bic=float(loglik_term + k * np.log(n)),
+        nfev=nfev,
+        solver_message=solver_message,
+    )
 
 
 def _4pl(x, a, b, c, d):
@@ -17,6 +90,10 @@ def _linear(x, m, b):
     return m * x + b
 
 
+def _bind(f, params, x):
+    return f(x, *params)
+
+
 def _inv_4pl(y, a, b, c, d):
     y = np.clip(y, min(a, d) + 1e-10, max(a, d) - 1e-10)
     denom = (a - d) / (y - d) - 1
@@ -34,44 +111,142 @@ def _inv_linear(y, m, b):
     return (y - b) / m
 
 
+def _p0_asymptotes(x: np.ndarray, y: np.ndarray) -> tuple[float, float]:
+    """(a, d) start values: the response at the low and the high end of x."""
+    lo, hi = float(np.min(y)), float(np.max(y))
+    return (lo, hi) if y[np.argmax(x)] >= y[np.argmin(x)] else (hi, lo)
+
+
+def _bounds(
+    x: np.ndarray, y: np.ndarray, n_params: int, bounded: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Bounds for (a, b, c, d[, g]). Unbounded keeps only c > 0; bounded adds
+    0 < b, g <= 50, c within 1000x of the positive x range and a, d within
+    10 signal spans of the observed responses.
+    """
+    lower = np.full(n_params, -np.inf)
+    upper = np.full(n_params, np.inf)
+    lower[2] = 1e-12
+    if not bounded:
+        return lower, upper
+
+    span = float(np.ptp(y)) or max(abs(float(np.max(y))), 1.0)
+    ylo, yhi = float(np.min(y)) - 10 * span, float(np.max(y)) + 10 * span
+    xpos = x[x > 0]
+    xlo, xhi = (xpos.min() / 1e3, xpos.max() * 1e3) if xpos.size else (1e-12, np.inf)
+
+    lower[[0, 3]], upper[[0, 3]] = ylo, yhi
+    lower[1], upper[1] = 1e-3, 50.0
+    lower[2], upper[2] = max(xlo, 1e-12), xhi
+    if n_params > 4:
+        lower[4], upper[4] = 1e-3, 50.0
+    return lower, upper
+
+
+def _solve(
+    f: Callable,
+    x: np.ndarray,
+    y: np.ndarray,
+    p0: list[float],
+    weights: Optional[np.ndarray],
+    solver: Optional[SolverOptions],
+) -> FitResult:
+    if len(x) < len(p0):
+        return FitResult(
+            None, None, ok=False, message=f"{len(x)} points for {len(p0)} parameters"
+        )
+
+    solver = solver or SolverOptions()
+    kwargs: dict = {
+        "method": solver.method.value,
+        "ftol": solver.ftol,
+        "xtol": solver.xtol,
+        "gtol": solver.gtol,
+    }
+    if solver.method is SolverMethod.LM:
+        if solver.max_nfev is not None:
+            kwargs["maxfev"] = solver.max_nfev
+    else:
+        lower, upper = _bounds(x, y, len(p0), solver.bounded)
+        p0 = np.clip(np.nan_to_num(p0), lower, upper)
+        kwargs.update(
+            bounds=(lower, upper),
+            loss=solver.loss.value,
+            f_scale=solver.f_scale,
+            max_nfev=solver.max_nfev,
+        )
+
+    sigma = None if weights is None else 1 / np.sqrt(weights)
+    try:
+        with warnings.catch_warnings(), np.errstate(all="ignore"):
+            warnings.simplefilter("ignore", OptimizeWarning)
+            popt, pcov, info, mesg, _ = curve_fit(
+                f,
+                x,
+                y,
+                p0=p0,
+                sigma=sigma,
+                absolute_sigma=False,
+                full_output=True,
+                **kwargs,
+            )
+    except (RuntimeError, ValueError, TypeError, np.linalg.LinAlgError) as exc:
+        return FitResult(None, None, ok=False, message=f"{type(exc).__name__}: {exc}")
+    if not np.all(np.isfinite(popt)):
+        return FitResult(None, None, ok=False, message="non-finite parameters")
+
+    # `fvec` is the solver's final weighted residual vector (fitted - y).
+    diag = _diagnostics(-info["fvec"], y, weights, pcov, int(info["nfev"]), mesg)
+    return FitResult(partial(_bind, f, popt), popt, diagnostics=diag)
+
+
 @register("curve_model", CurveModel.FOUR_PL)
-def fit_4pl(x: np.ndarray, y: np.ndarray, weights: np.ndarray = None):
-    lower = [-np.inf, -np.inf, 1e-12, -np.inf]
-    upper = [np.inf, np.inf, np.inf, np.inf]
-    popt, _ = curve_fit(
-        _4pl,
-        x,
-        y,
-        p0=[min(y), 1.0, np.median(x), max(y)],
-        bounds=(lower, upper),
-        sigma=1 / np.sqrt(weights),
-        absolute_sigma=True,
-    )
-    return lambda x: _4pl(x, *popt), popt
+def fit_4pl(
+    x: np.ndarray,
+    y: np.ndarray,
+    weights: np.ndarray = None,
+    solver: Optional[SolverOptions] = None,
+) -> FitResult:
+    a0, d0 = _p0_asymptotes(x, y)
+    return _solve(_4pl, x, y, [a0, 1.0, np.median(x), d0], weights, solver)
 
 
 @register("curve_model", CurveModel.FIVE_PL)
-def fit_5pl(x: np.ndarray, y: np.ndarray, weights: np.ndarray = None):
-    lower = [-np.inf, -np.inf, 1e-12, -np.inf, -np.inf]
-    upper = [np.inf, np.inf, np.inf, np.inf, np.inf]
-    popt, _ = curve_fit(
-        _5pl,
-        x,
-        y,
-        p0=[min(y), 1.0, np.median(x), max(y), 1.0],
-        bounds=(lower, upper),
-        sigma=1 / np.sqrt(weights),
-        absolute_sigma=True,
-    )
-    return lambda x: _5pl(x, *popt), popt
+def fit_5pl(
+    x: np.ndarray,
+    y: np.ndarray,
+    weights: np.ndarray = None,
+    solver: Optional[SolverOptions] = None,
+) -> FitResult:
+    a0, d0 = _p0_asymptotes(x, y)
+    return _solve(_5pl, x, y, [a0, 1.0, np.median(x), d0, 1.0], weights, solver)
 
 
 @register("curve_model", CurveModel.LINEAR)
-def fit_linear(x: np.ndarray, y: np.ndarray, weights: np.ndarray = None):
+def fit_linear(
+    x: np.ndarray,
+    y: np.ndarray,
+    weights: np.ndarray = None,
+    solver: Optional[SolverOptions] = None,
+) -> FitResult:
+    """Closed-form weighted least squares; `solver` is accepted and ignored."""
     w = np.sqrt(weights) if weights is not None else np.ones_like(x)
-    A = np.vstack([x, np.ones_like(x)]).T
-    coef, _, _, _ = np.linalg.lstsq(A * w[:, None], y * w, rcond=None)
-    return lambda x: _linear(x, *coef), coef
+    A = np.vstack([x, np.ones_like(x)]).T * w[:, None]
+    try:
+        coef, _, _, _ = np.linalg.lstsq(A, y * w, rcond=None)
+    except np.linalg.LinAlgError as exc:
+        return FitResult(None, None, ok=False, message=f"LinAlgError: {exc}")
+    if not np.all(np.isfinite(coef)):
+        return FitResult(None, None, ok=False, message="non-finite parameters")
+
+    # Weights are relative, so scale by the residual variance as curve_fit does.
+    residuals = w * y - A @ coef
+    dof = len(y) - len(coef)
+    s2 = float(residuals @ residuals) / dof if dof > 0 else np.inf
+    covariance = np.linalg.pinv(A.T @ A) * s2
+    diag = _diagnostics(residuals, y, weights, covariance, None, "closed form")
+    return FitResult(partial(_bind, _linear, coef), coef, diagnostics=diag)
 
 
 @register("curve_model_back", CurveModel.FOUR_PL)
@@ -1,33 +1,97 @@
-import pandas as pd
+from __future__ import annotations
+
+import numpy as np
 
 from yassa_bio.schema.analysis.enum import NormRule
 from yassa_bio.core.registry import register
+from yassa_bio.utils.group import group_stat
+
+
+def _codes(signal: np.ndarray, groups: np.ndarray | None) -> tuple[np.ndarray, int]:
+    if groups is None:
+        return np.zeros(len(signal), dtype=np.intp), 1
+    return groups, int(groups.max()) + 1 if len(groups) else 0
+
+
+def _rescale(
+    signal: np.ndarray,
+    offset: np.ndarray,
+    scale: np.ndarray,
+    codes: np.ndarray,
+    groups: np.ndarray | None,
+    unit: float = 1.0,
+) -> tuple[np.ndarray, float | np.ndarray | None]:
+    scale = np.where(np.isfinite(scale) & (scale != 0), scale, np.nan)
+    rows = codes >= 0
+    rows[rows] = np.isfinite(scale[codes[rows]])
+
+    out = np.array(signal, dtype=float)
+    out[rows] = (out[rows] - offset[codes[rows]]) / scale[codes[rows]] * unit
+    if groups is not None:
+        return out, scale
+    return out, None if np.isnan(scale[0]) else float(scale[0])
 
 
 @register("norm_rule", NormRule.SPAN)
-def _norm_span(df: pd.DataFrame) -> tuple[pd.Series, float | None]:
-    cal = df.query("sample_type == 'calibration_standard'")
-    if cal.empty:
-        return df["signal"], None
-    low = cal["concentration"].min()
-    high = cal["concentration"].max()
-    span = high - low
-    if not span:
-        return df["signal"], None
-    return (df["signal"] - low) / span, span
+def _norm_span(
+    signal: np.ndarray,
+    concentration: np.ndarray,
+    cal_mask: np.ndarray,
+    zero_mask: np.ndarray,
+    groups: np.ndarray | None = None,
+) -> tuple[np.ndarray, float | np.ndarray | None]:
+    codes, n = _codes(signal, groups)
+    low = group_stat(concentration, cal_mask, codes, n, "min")
+    high = group_stat(concentration, cal_mask, codes, n, "max")
+    return _rescale(signal, low, high - low, codes, groups)
 
 
 @register("norm_rule", NormRule.MAX)
-def _norm_max(df: pd.DataFrame) -> tuple[pd.Series, float | None]:
-    cal = df.query("sample_type == 'calibration_standard'")
-    if cal.empty:
-        return df["signal"], None
-    maxv = cal["concentration"].max()
-    if not maxv:
-        return df["signal"], None
-    return df["signal"] / maxv, maxv
+def _norm_max(
+    signal: np.ndarray,
+    concentration: np.ndarray,
+    cal_mask: np.ndarray,
+    zero_mask: np.ndarray,
+    groups: np.ndarray | None = None,
+) -> tuple[np.ndarray, float | np.ndarray | None]:
+    codes, n = _codes(signal, groups)
+    maxv = group_stat(concentration, cal_mask, codes, n, "max")
+    return _rescale(signal, np.zeros(n), maxv, codes, groups)
+
+
+@register("norm_rule", NormRule.PERCENT_MAX)
+def _norm_percent_max(
+    signal: np.ndarray,
+    concentration: np.ndarray,
+    cal_mask: np.ndarray,
+    zero_mask: np.ndarray,
+    groups: np.ndarray | None = None,
+) -> tuple[np.ndarray, float | np.ndarray | None]:
+    codes, n = _codes(signal, groups)
+    maxv = group_stat(signal, cal_mask, codes, n, "max")
+    return _rescale(signal, np.zeros(n), maxv, codes, groups, unit=100.0)
+
+
+@register("norm_rule", NormRule.B_B0)
+def _norm_b_b0(
+    signal: np.ndarray,
+    concentration: np.ndarray,
+    cal_mask: np.ndarray,
+    zero_mask: np.ndarray,
+    groups: np.ndarray | None = None,
+) -> tuple[np.ndarray, float | np.ndarray | None]:
+    """Competitive assays: B/B0, with B0 the mean zero-standard signal."""
+    codes, n = _codes(signal, groups)
+    b0 = group_stat(signal, zero_mask, codes, n, "mean")
+    return _rescale(signal, np.zeros(n), b0, codes, groups)
 
 
 @register("norm_rule", NormRule.NONE)
-def _norm_none(df: pd.DataFrame) -> tuple[pd.Series, None]:
-    return df["signal"], None
+def _norm_none(
+    signal: np.ndarray,
+    concentration: np.ndarray,
+    cal_mask: np.ndarray,
+    zero_mask: np.ndarray,
+    groups: np.ndarray | None = None,
+) -> tuple[np.ndarray, None]:
+    return signal, None
@@ -0,0 +1,117 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+from scipy.stats import f as f_dist
+
+from yassa_bio.core.registry import get
+from yassa_bio.evaluation.analysis.engine.model import FitResult
+from yassa_bio.schema.analysis.enum import CurveModel, SelectionCriterion
+from yassa_bio.schema.analysis.fit import ModelSelection, SolverOptions
+
+
+class Selection(NamedTuple):
+    """Chosen model and its fit, plus the per-candidate comparison."""
+
+    model: Optional[CurveModel]
+    result: FitResult
+    comparison: dict[str, Any]
+
+
+def lack_of_fit_p(
+    residuals: np.ndarray, y: np.ndarray, x: np.ndarray, n_params: int
+) -> float:
+    """
+    P-value of the lack-of-fit F-test, with replicates of the same `x` as the
+    pure-error estimate. `residuals` are the weighted residuals of the fit and
+    `y` the correspondingly weighted responses. NaN when there are too few
+    levels or replicates to run the test.
+    """
+    levels, codes = np.unique(x, return_inverse=True)
+    df_pe = len(y) - len(levels)
+    df_lof = len(levels) - n_params
+    if df_pe <= 0 or df_lof <= 0:
+        return float("nan")
+
+    means = np.bincount(codes, weights=y) / np.bincount(codes)
+    ss_pe = float(np.sum((y - means[codes]) ** 2))
+    ss_lof = max(float(np.sum(residuals**2)) - ss_pe, 0.0)
+    if ss_pe <= 0:
+        return 0.0 if ss_lof > 0 else 1.0
+    return float(f_dist.sf((ss_lof / df_lof) / (ss_pe / df_pe), df_lof, df_pe))
+
+
+def _score(res: FitResult, criterion: SelectionCriterion) -> float:
+    diag = res.diagnostics
+    if criterion is SelectionCriterion.AIC:
+        return diag.aic
+    if criterion is SelectionCriterion.BIC:
+        return diag.bic
+    dof = len(diag.residuals) - len(res.params)
+    if dof <= 0:
+        return float("inf")
+    return float(np.sqrt(np.sum(diag.residuals**2) / dof))
+
+
+def select_model(
+    x: np.ndarray,
+    y: np.ndarray,
+    weights: np.ndarray,
+    selection: ModelSelection,
+    solver: Optional[SolverOptions] = None,
+) -> Selection:
+    """
+    Fit each of `selection.candidates` on (x, y, weights) and pick one.
+
+    Candidates are fitted concurrently when `selection.max_workers > 1`. Fits
+    that fail are never chosen; fits that fail the lack-of-fit test at
+    `selection.lack_of_fit_alpha` are chosen only when no candidate passes.
+    If every fit fails, `model` is None and `result` is a failed `FitResult`.
+    """
+
+    def fit(model: CurveModel) -> FitResult:
+        return get("curve_model", model)(x, y, weights=weights, solver=solver)
+
+    models = list(selection.candidates)
+    workers = min(selection.max_workers, len(models))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(fit, models))
+    else:
+        results = [fit(m) for m in models]
+
+    sw_y = np.sqrt(weights) * y
+    candidates: dict[str, dict[str, Any]] = {}
+    scored = []
+    for model, res in zip(models, results):
+        if not res.ok:
+            candidates[model.value] = {"ok": False, "message": res.message}
+            continue
+        diag = res.diagnostics
+        p = lack_of_fit_p(diag.residuals, sw_y, x, len(res.params))
+        score = _score(res, selection.criterion)
+        passes = bool(np.isnan(p) or p >= selection.lack_of_fit_alpha)
+        candidates[model.value] = {
+            "ok": True,
+            "score": score,
+            "aic": diag.aic,
+            "bic": diag.bic,
+            "r_squared": diag.r_squared,
+            "lack_of_fit_p": p,
+            "lack_of_fit_pass": passes,
+        }
+        scored.append((not passes, score, model, res))
+
+    comparison = {
+        "criterion": selection.criterion.value,
+        "selected": None,
+        "candidates": candidates,
+    }
+    if not scored:
+        messages = "; ".join(f"{m}: {c['message']}" for m, c in candidates.items())
+        return Selection(None, FitResult(None, None, False, messages), comparison)
+
+    _, _, model, res = min(scored, key=lambda s: (s[0], s[1]))
+    comparison["selected"] = model.value
+    return Selection(model, res, comparison)
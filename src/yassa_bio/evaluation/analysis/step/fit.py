@@ -1,14 +1,31 @@
 from __future__ import annotations
+import logging
+from functools import partial
+from typing import Callable
+
+import numpy as np
+import pandas as pd
 
 from yassa_bio.core.registry import get
-from lilpipe.step import Step
+from yassa_bio.evaluation.backcalc import back_calc
+from yassa_bio.evaluation.analysis.engine.model import FitResult
+from yassa_bio.evaluation.analysis.engine.select import select_model
+from yassa_bio.evaluation.instrument import InstrumentedStep
 from yassa_bio.evaluation.context import LBAContext
 from yassa_bio.schema.analysis.config import LBAAnalysisConfig
 from yassa_bio.schema.analysis.enum import CurveModel
+from yassa_bio.schema.analysis.fit import CurveFit as CurveFitConfig
 from yassa_bio.schema.layout.enum import SampleType
+from yassa_bio.evaluation.roles import role_index
+from yassa_bio.utils.group import group_codes, group_rows
+
+log = logging.getLogger(__name__)
+
+# `ctx.fit_failures` / `ctx.fit_diagnostics` key for a batch-wide fit.
+BATCH_FIT = "batch"
 
 
-class ApplyTransforms(Step):
+class ApplyTransforms(InstrumentedStep):
     name = "apply_transforms"
 
     def __init__(self) -> None:
@@ -27,7 +44,7 @@ class ApplyTransforms(Step):
         return ctx
 
 
-class ComputeWeights(Step):
+class ComputeWeights(InstrumentedStep):
     name = "compute_weights"
 
     def __init__(self) -> None:
@@ -47,7 +64,7 @@ class ComputeWeights(Step):
         return ctx
 
 
-class SelectCalibrationData(Step):
+class SelectCalibrationData(InstrumentedStep):
     name = "select_calibration"
 
     def __init__(self) -> None:
@@ -55,14 +72,77 @@ class SelectCalibrationData(Step):
 
     def logic(self, ctx: LBAContext) -> LBAContext:
         df = ctx.data
-        cal_df = df[df["sample_type"] == SampleType.CALIBRATION_STANDARD.value].copy()
+        cal_rows = role_index(ctx).rows(SampleType.CALIBRATION_STANDARD)
+        cal_df = df.iloc[cal_rows].copy()
         if cal_df.empty:
             raise ValueError("No calibration-standard wells found for curve fitting.")
         ctx.calib_df = cal_df
         return ctx
 
 
-class FitCalibrationData(Step):
+def _fwd(fwd_fn, values, groups=None):
+    return fwd_fn(values)
+
+
+def _back(back_fn, params, y_val, groups=None):
+    return back_fn(y_val, params)
+
+
+def _nan_curve(values, groups=None) -> np.ndarray:
+    """Stand-in curve after a failed fit: every value maps to NaN."""
+    return np.full(len(values), np.nan)
+
+
+class GroupedCurve:
+    """
+    One fitted curve per group key. Called with the values and each value's
+    group; rows are dispatched to their group's curve with one stable sort,
+    and rows whose group has no curve come back NaN.
+    """
+
+    def __init__(self, curves: dict[str, Callable[[np.ndarray], np.ndarray]]):
+        self.curves = curves
+        self.keys = pd.Index(list(curves))
+
+    def _codes(self, groups) -> np.ndarray:
+        groups = groups if isinstance(groups, pd.Series) else pd.Series(groups)
+        if isinstance(groups.dtype, pd.CategoricalDtype):
+            lookup = self.keys.get_indexer(groups.cat.categories.astype(str))
+            codes = groups.cat.codes.to_numpy()
+            return np.where(codes >= 0, lookup[codes], -1)
+        return self.keys.get_indexer(groups.astype(str))
+
+    def __call__(self, values, groups=None) -> np.ndarray:
+        if groups is None:
+            raise ValueError(
+                "This curve was fitted per group (curve_fit.fit_by); call it "
+                "as curve(values, groups) with each value's group."
+            )
+        values = np.asarray(values, dtype=float)
+        out = np.full(len(values), np.nan)
+        for key, rows in zip(
+            self.keys, group_rows(self._codes(groups), len(self.keys))
+        ):
+            if len(rows):
+                out[rows] = self.curves[key](values[rows])
+        return out
+
+
+def _fit(
+    cfg: CurveFitConfig, x: np.ndarray, y: np.ndarray, w: np.ndarray
+) -> tuple[CurveModel | None, FitResult, dict | None]:
+    """
+    Fit `cfg.model`, or with `model="auto"` every selection candidate, and
+    return the model used, its result and the candidate comparison (if any).
+    """
+    if cfg.model is not CurveModel.AUTO:
+        res = get("curve_model", cfg.model)(x, y, weights=w, solver=cfg.solver)
+        return cfg.model, res, None
+    sel = select_model(x, y, w, cfg.selection, solver=cfg.solver)
+    return sel.model, sel.result, sel.comparison
+
+
+class FitCalibrationData(InstrumentedStep):
     name = "fit_calibration_data"
 
     def __init__(self) -> None:
@@ -70,24 +150,64 @@ class FitCalibrationData(Step):
 
     def logic(self, ctx: LBAContext) -> LBAContext:
         cfg: LBAAnalysisConfig = ctx.analysis_config
-        model: CurveModel = cfg.curve_fit.model
-
-        fit_fn = get("curve_model", model)
-        back_fn = get("curve_model_back", model)
-
-        x = ctx.calib_df["x"].to_numpy(float)
-        y = ctx.calib_df["y"].to_numpy(float)
-        w = ctx.calib_df["w"].to_numpy(float)
-
-        fwd_func, params = fit_fn(x, y, weights=w)
 
-        ctx.curve_fwd = fwd_func
-        ctx.curve_back = lambda y_val: back_fn(y_val, params)
-        ctx.curve_params = params
+        cal = ctx.calib_df
+        x = cal["x"].to_numpy(float)
+        y = cal["y"].to_numpy(float)
+        w = cal["w"].to_numpy(float)
+
+        by = cfg.curve_fit.fit_by
+        if by is None:
+            model, res, comparison = _fit(cfg.curve_fit, x, y, w)
+            ctx.model_selection = {BATCH_FIT: comparison} if comparison else {}
+            ctx.curve_params_by_group = {}
+            ctx.fit_diagnostics = {BATCH_FIT: res.diagnostics} if res.ok else {}
+            if not res.ok:
+                log.warning("⚠️  Curve fit failed: %s", res.message)
+                ctx.fit_failures = {BATCH_FIT: res.message}
+                ctx.curve_fwd = ctx.curve_back = _nan_curve
+                ctx.curve_params = None
+            else:
+                ctx.fit_failures = {}
+                ctx.curve_fwd = partial(_fwd, res.fwd)
+                back_fn = get("curve_model_back", model)
+                ctx.curve_back = partial(_back, back_fn, res.params)
+                ctx.curve_params = res.params
+            back_calc(ctx)
+            return ctx
+
+        if by not in cal:
+            raise ValueError(f"fit_by column '{by}' is not in the data")
+
+        codes, keys = group_codes(cal[by])
+        fwd: dict[str, Callable[[np.ndarray], np.ndarray]] = {}
+        back: dict[str, Callable[[np.ndarray], np.ndarray]] = {}
+        params, failures, diagnostics = {}, {}, {}
+        selection = {}
+        for key, rows in zip(keys.astype(str), group_rows(codes, len(keys))):
+            model, res, comparison = _fit(cfg.curve_fit, x[rows], y[rows], w[rows])
+            if comparison:
+                selection[key] = comparison
+            if not res.ok or res.fwd is None:
+                log.warning("⚠️  Curve fit failed for %s=%s: %s", by, key, res.message)
+                failures[key] = res.message
+                continue
+            fwd[key], params[key] = res.fwd, res.params
+            diagnostics[key] = res.diagnostics
+            back[key] = partial(_back, get("curve_model_back", model), res.params)
+
+        ctx.fit_failures = failures
+        ctx.fit_diagnostics = diagnostics
+        ctx.model_selection = selection
+        ctx.curve_fwd = GroupedCurve(fwd)
+        ctx.curve_back = GroupedCurve(back)
+        ctx.curve_params = None
+        ctx.curve_params_by_group = params
+        back_calc(ctx)
         return ctx
 
 
-class CurveFit(Step):
+class CurveFit(InstrumentedStep):
     name = "curve_fit"
 
     def __init__(self) -> None:
@@ -1,13 +1,18 @@
+import numpy as np
 import pandas as pd
 from typing import Iterable
 
 from yassa_bio.core.registry import get
-from lilpipe.step import Step
+from yassa_bio.evaluation.instrument import InstrumentedStep
 from yassa_bio.evaluation.context import LBAContext
 from yassa_bio.schema.analysis.config import LBAAnalysisConfig
+from yassa_bio.schema.layout.enum import SampleType
+from yassa_bio.evaluation.roles import RoleIndex, role_index
+from yassa_bio.utils.category import as_categorical, eq_mask
+from yassa_bio.utils.group import group_codes
 
 
-class LoadData(Step):
+class LoadData(InstrumentedStep):
     name = "load_data"
 
     def __init__(self) -> None:
@@ -15,11 +20,11 @@ class LoadData(Step):
 
     def logic(self, ctx: LBAContext) -> LBAContext:
         obj = ctx.batch_data
-        ctx.data = obj.df  # validated in LBAContext
+        ctx.data = as_categorical(obj.df)  # validated in LBAContext
         return ctx
 
 
-class CheckData(Step):
+class CheckData(InstrumentedStep):
     name = "check_data"
 
     def __init__(self) -> None:
@@ -42,7 +47,7 @@ class CheckData(Step):
         return ctx
 
 
-class ExcludeData(Step):
+class ExcludeData(InstrumentedStep):
     name = "exclude_data"
 
     def __init__(self) -> None:
@@ -51,14 +56,43 @@ class ExcludeData(Step):
     def logic(self, ctx: LBAContext) -> LBAContext:
         df: pd.DataFrame = ctx.data
 
-        mask = df["exclude"].astype(bool).fillna(False)
+        mask = df["exclude"].astype(bool).fillna(False).to_numpy()
         ctx.excluded_data = df[mask].copy()
-        ctx.data = df[~mask].copy()
+
+        # Calibration levels dropped by CheckRerun stay dropped on later passes.
+        keep = ~mask
+        if ctx.dropped_cal_levels:
+            keep &= ~(
+                eq_mask(df["sample_type"], SampleType.CALIBRATION_STANDARD)
+                & df["concentration"].isin(ctx.dropped_cal_levels).to_numpy()
+            )
+        ctx.data = df[keep].copy()
+        ctx.role_index = RoleIndex.build(ctx.data)
 
         return ctx
 
 
-class SubtractBlank(Step):
+def _groups(ctx: LBAContext, option: str) -> tuple[np.ndarray | None, pd.Index | None]:
+    """
+    Group codes and keys for the column named by `preprocess.<option>`,
+    falling back to `ctx.group_by`; (None, None) when neither is set.
+    """
+    df: pd.DataFrame = ctx.data
+    by = getattr(ctx.analysis_config.preprocess, option)
+    if by is None:
+        by, option = ctx.group_by, "group_by"
+    if by is None:
+        return None, None
+    if by not in df:
+        raise ValueError(f"{option} column '{by}' is not in the data")
+    return group_codes(df[by])
+
+
+def _by_key(keys: pd.Index, values: np.ndarray) -> dict[str, float]:
+    return {str(k): float(v) for k, v in zip(keys, values) if np.isfinite(v)}
+
+
+class SubtractBlank(InstrumentedStep):
     name = "subtract_blank"
 
     def __init__(self) -> None:
@@ -68,21 +102,33 @@ class SubtractBlank(Step):
         df: pd.DataFrame = ctx.data
         cfg: LBAAnalysisConfig = ctx.analysis_config
 
-        blank_mask = df["sample_type"].eq("blank")
+        blank_mask = role_index(ctx).mask(SampleType.BLANK)
         blank_fn = get("blank_rule", cfg.preprocess.blank_rule)
-
-        blank_val = blank_fn(df["signal"].to_numpy(float), blank_mask.to_numpy())
-        clean = df["signal"].astype(float)
-        if blank_val is not None:
-            clean -= blank_val
+        codes, keys = _groups(ctx, "blank_by")
+
+        signal = df["signal"].to_numpy(float)
+        blank_val = blank_fn(signal, blank_mask, groups=codes)
+        clean = signal.copy()
+        if codes is None:
+            if blank_val is not None:
+                clean -= blank_val
+            ctx.blank_used = blank_val
+            ctx.blank_values = {}
+        else:
+            blanks = np.full(len(keys), np.nan) if blank_val is None else blank_val
+            rows = codes >= 0
+            per_row = np.zeros(len(clean))
+            per_row[rows] = np.nan_to_num(blanks[codes[rows]])
+            clean -= per_row
+            ctx.blank_used = None
+            ctx.blank_values = _by_key(keys, blanks)
 
         df["signal"] = clean
-        ctx.blank_used = blank_val
         ctx.data = df
         return ctx
 
 
-class NormalizeSignal(Step):
+class NormalizeSignal(InstrumentedStep):
     name = "normalize_signal"
 
     def __init__(self) -> None:
@@ -94,15 +140,30 @@ class NormalizeSignal(Step):
 
         norm_fn = get("norm_rule", cfg.preprocess.norm_rule)
 
-        clean, span = norm_fn(df)
+        codes, keys = _groups(ctx, "norm_by")
+
+        roles = role_index(ctx)
+        clean, scale = norm_fn(
+            df["signal"].to_numpy(float),
+            df["concentration"].to_numpy(float),
+            roles.mask(SampleType.CALIBRATION_STANDARD),
+            roles.mask(SampleType.ZERO_STANDARD),
+            groups=codes,
+        )
         df["signal"] = clean
 
-        ctx.norm_span = span
+        if codes is None:
+            ctx.norm_span = scale
+            ctx.norm_scales = {}
+        else:
+            ctx.norm_span = None
+            scales = np.full(len(keys), np.nan) if scale is None else scale
+            ctx.norm_scales = _by_key(keys, scales)
         ctx.data = df
         return ctx
 
 
-class MaskOutliers(Step):
+class MaskOutliers(InstrumentedStep):
     name = "mask_outliers"
 
     def __init__(self) -> None:
@@ -115,7 +176,8 @@ class MaskOutliers(Step):
 
         mask = pd.Series(False, index=df.index)
 
-        for group_key, group_df in self._iter_groups(df):
+        groups = self._iter_groups(df, role_index(ctx), ctx.group_by)
+        for group_key, group_df in groups:
             vals = group_df["signal"].to_numpy(float)
             idxs = group_df.index
             if len(vals) < 2:
@@ -127,23 +189,28 @@ class MaskOutliers(Step):
         ctx.data = df
         return ctx
 
-    def _iter_groups(self, df: pd.DataFrame) -> Iterable[tuple[str, pd.DataFrame]]:
+    def _iter_groups(
+        self, df: pd.DataFrame, roles: RoleIndex, by: str | None = None
+    ) -> Iterable[tuple[str, pd.DataFrame]]:
         """
-        Yields (name, group_df) for each relevant replicate group.
+        Yields (name, group_df) for each relevant replicate group, split
+        further by the `by` column (e.g. per plate) when given.
         """
-        std_mask = df["sample_type"] == "calibration_standard"
-        qc_mask = df["sample_type"] == "quality_control"
-
-        if std_mask.any():
-            for _, g in df[std_mask].groupby("level_idx"):
+        std_rows = roles.rows(SampleType.CALIBRATION_STANDARD)
+        if len(std_rows):
+            keys = ["level_idx"] if by is None else [by, "level_idx"]
+            for _, g in df.iloc[std_rows].groupby(keys, observed=True):
                 yield "cal_std", g
 
-        if qc_mask.any():
-            for _, g in df[qc_mask].groupby("qc_level"):
+        for rows in roles.by_qc_level.values():
+            if by is None:
+                yield "qc", df.iloc[rows]
+                continue
+            for _, g in df.iloc[rows].groupby(by, observed=True):
                 yield "qc", g
 
 
-class Preprocess(Step):
+class Preprocess(InstrumentedStep):
     name = "preprocess"
 
     def __init__(self) -> None:
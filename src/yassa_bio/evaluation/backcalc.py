@@ -0,0 +1,28 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from yassa_bio.evaluation.context import LBAContext
+
+# Column of `ctx.data` holding each well's back-calculated x.
+BACK_CALC = "back_calc"
+
+
+def back_calc(ctx: LBAContext) -> np.ndarray:
+    """
+    `ctx.data["back_calc"]`: every row's x read off the fitted curve, from one
+    call to `ctx.curve_back` (dispatched per group when `curve_fit.fit_by` is
+    set). Recomputed only when the column is missing or was computed with a
+    different curve (`ctx.back_calc_curve`).
+    """
+    df = ctx.data
+    if ctx.back_calc_curve is not ctx.curve_back or BACK_CALC not in df:
+        y = df["y"].to_numpy(float)
+        by = ctx.analysis_config.curve_fit.fit_by
+        values = ctx.curve_back(y) if by is None else ctx.curve_back(y, df[by])
+        df = df.assign(**{BACK_CALC: np.asarray(values, dtype=float)})
+        ctx.data = df
+        ctx.back_calc_curve = ctx.curve_back
+    return df[BACK_CALC].to_numpy(float)
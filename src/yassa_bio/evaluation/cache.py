@@ -0,0 +1,122 @@
+from __future__ import annotations
+import abc
+import contextlib
+import hashlib
+import os
+import pickle
+import sqlite3
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from yassa_bio.io.utils import as_path
+from yassa_bio.schema.layout.batch import BatchData
+from yassa_bio.schema.layout.plate import PlateData
+from yassa_bio.schema.analysis.config import LBAAnalysisConfig
+from yassa_bio.schema.acceptance.analytical.spec import LBAAnalyticalAcceptanceCriteria
+
+# Bump whenever the pipeline changes what it stores for identical inputs.
+CACHE_VERSION = 1
+
+
+def _file_digest(path: Path) -> str:
+    with open(path, "rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+def result_key(
+    batch_data: BatchData | PlateData,
+    analysis_config: LBAAnalysisConfig,
+    acceptance_criteria: LBAAnalyticalAcceptanceCriteria,
+) -> str:
+    """
+    Content hash of everything a run depends on: the raw bytes of every source
+    file, every plate layout, the analysis config and the acceptance criteria.
+    """
+    plates = batch_data.plates if isinstance(batch_data, BatchData) else [batch_data]
+    digests: dict[Path, str] = {}
+
+    h = hashlib.sha256(f"yassa_bio-result-v{CACHE_VERSION}".encode())
+    for p in plates:
+        path = p.source_file.path
+        if path not in digests:
+            digests[path] = _file_digest(path)
+        h.update(p.plate_id.encode())
+        h.update(digests[path].encode())
+        h.update(p.layout.model_dump_json().encode())
+        h.update(f"{p.row_offset},{p.col_offset}".encode())
+    h.update(analysis_config.model_dump_json().encode())
+    h.update(type(acceptance_criteria).__name__.encode())
+    h.update(acceptance_criteria.model_dump_json().encode())
+    return h.hexdigest()
+
+
+class ResultCache(abc.ABC):
+    """
+    Key/value store for run results, keyed by `result_key`.
+
+    Subclass and implement `get` / `put` to plug in another backend.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> dict[str, Any] | None: ...
+
+    @abc.abstractmethod
+    def put(self, key: str, payload: dict[str, Any]) -> None: ...
+
+
+class SQLiteResultCache(ResultCache):
+    """All results in one SQLite file; safe to share between threads."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = as_path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as con:
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, payload BLOB NOT NULL)"
+            )
+
+    def _connect(self) -> contextlib.closing[sqlite3.Connection]:
+        return contextlib.closing(sqlite3.connect(self.path))
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._connect() as con:
+            row = con.execute(
+                "SELECT payload FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        blob = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._connect() as con, con:
+            con.execute(
+                "INSERT OR REPLACE INTO results (key, payload) VALUES (?, ?)",
+                (key, blob),
+            )
+
+
+class DirectoryResultCache(ResultCache):
+    """One pickle file per result under `root/<key[:2]>/<key>.pkl`."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = as_path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        try:
+            with open(self._path(key), "rb") as fh:
+                return pickle.load(fh)
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
@@ -1,10 +1,13 @@
-from typing import Callable, Any
+from typing import Any
 import numpy as np
 import pandas as pd
 from pydantic import Field
 from pydantic.config import ConfigDict
 
 from lilpipe.models import PipelineContext
+from yassa_bio.evaluation.analysis.engine.model import Curve, FitDiagnostics
+from yassa_bio.evaluation.instrument import StepHook
+from yassa_bio.evaluation.roles import RoleIndex
 from yassa_bio.schema.layout.batch import BatchData
 from yassa_bio.schema.layout.plate import PlateData
 from yassa_bio.schema.analysis.config import LBAAnalysisConfig
@@ -25,20 +28,38 @@ class LBAContext(PipelineContext):
     analysis_config: LBAAnalysisConfig
     acceptance_criteria: LBAAnalyticalAcceptanceCriteria
 
+    # Group-wise runs (see yassa_bio.evaluation.grouped)
+    group_by: str | None = None
+    groups: dict[str, "LBAContext"] = Field(default_factory=dict)
+
     # Preprocess
     data: pd.DataFrame | None = None
     excluded_data: pd.DataFrame | None = None
+    role_index: RoleIndex | None = None
     blank_used: float | None = None
+    blank_values: dict[str, float] = Field(default_factory=dict)
     norm_span: float | None = None
+    norm_scales: dict[str, float] = Field(default_factory=dict)
 
     # Curve fit
     calib_df: pd.DataFrame | None = None
-    curve_fwd: Callable[[np.ndarray], np.ndarray] | None = None
-    curve_back: Callable[[np.ndarray], np.ndarray] | None = None
+    curve_fwd: Curve | None = None
+    curve_back: Curve | None = None
+    back_calc_curve: Curve | None = None
     curve_params: np.ndarray | None = None
+    curve_params_by_group: dict[str, np.ndarray] = Field(default_factory=dict)
+    fit_failures: dict[str, str] = Field(default_factory=dict)
+    fit_diagnostics: dict[str, FitDiagnostics] = Field(default_factory=dict)
+    model_selection: dict[str, dict[str, Any]] = Field(default_factory=dict)
     dropped_cal_wells: pd.DataFrame | None = None
+    dropped_cal_levels: list[float] = Field(default_factory=list)
 
     # Acceptance
     acceptance_results: dict[str, dict[str, Any]] = Field(default_factory=dict)
     acceptance_history: list[dict[str, dict[str, Any]]] = Field(default_factory=list)
     acceptance_pass: bool | None = None
+
+    # Instrumentation
+    pass_idx: int = 0
+    step_metrics: list[dict[str, Any]] = Field(default_factory=list)
+    step_hooks: list[StepHook] = Field(default_factory=list)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pandas as pd
+from lilpipe.engine import Pipeline
+
+from yassa_bio.evaluation.context import LBAContext
+from yassa_bio.evaluation.instrument import InstrumentedStep
+from yassa_bio.utils.group import group_codes, group_rows
+
+
+def _rows_of(df: pd.DataFrame | None, by: str, key) -> pd.DataFrame | None:
+    if df is None or by not in df:
+        return df
+    return df[(df[by] == key).to_numpy(bool)].reset_index(drop=True)
+
+
+class PerGroup(InstrumentedStep):
+    """
+    Run `pipeline` once per `ctx.group_by` group and collect the finished child
+    contexts in `ctx.groups` (keyed by the group value as a string).
+
+    The parent's `acceptance_results` holds, per spec, the overall pass and
+    each group's result under `per_group`; `acceptance_pass` is True only if
+    every group passes. Child step metrics are appended to the parent's with
+    the group key under "group".
+    """
+
+    name = "per_group"
+
+    def __init__(self, pipeline: Pipeline) -> None:
+        super().__init__(name=self.name)
+        self.pipeline = pipeline
+
+    def logic(self, ctx: LBAContext) -> LBAContext:
+        by = ctx.group_by
+        df: pd.DataFrame = ctx.data
+        if by is None or by not in df:
+            raise ValueError(f"group_by column '{by}' is not in the data")
+
+        codes, keys = group_codes(df[by])
+        groups: dict[str, LBAContext] = {}
+        for key, rows in zip(keys, group_rows(codes, len(keys))):
+            child = LBAContext(
+                batch_data=ctx.batch_data,
+                analysis_config=ctx.analysis_config,
+                acceptance_criteria=ctx.acceptance_criteria,
+                data=df.iloc[rows].reset_index(drop=True),
+                excluded_data=_rows_of(ctx.excluded_data, by, key),
+                blank_used=ctx.blank_values.get(str(key), ctx.blank_used),
+                norm_span=ctx.norm_scales.get(str(key), ctx.norm_span),
+                step_hooks=ctx.step_hooks,
+            )
+            child = self.pipeline.run(child)
+            for record in child.step_metrics:
+                record["group"] = str(key)
+            ctx.step_metrics.extend(child.step_metrics)
+            groups[str(key)] = child
+
+        specs = dict.fromkeys(
+            name for child in groups.values() for name in child.acceptance_results
+        )
+        ctx.acceptance_results = {
+            spec: {
+                "pass": all(
+                    bool(c.acceptance_results.get(spec, {}).get("pass"))
+                    for c in groups.values()
+                ),
+                "per_group": {
+                    key: c.acceptance_results.get(spec) for key, c in groups.items()
+                },
+            }
+            for spec in specs
+        }
+        ctx.acceptance_history.append(ctx.acceptance_results)
+        ctx.acceptance_pass = bool(groups) and all(
+            c.acceptance_pass for c in groups.values()
+        )
+        ctx.groups = groups
+        return ctx
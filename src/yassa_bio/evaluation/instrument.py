@@ -0,0 +1,102 @@
+from __future__ import annotations
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Sequence
+
+import pandas as pd
+from lilpipe.engine import Pipeline
+from lilpipe.models import PipelineContext
+from lilpipe.step import Step
+
+StepHook = Callable[[dict[str, Any]], None]
+
+_local = threading.local()
+
+
+def _peak_stack() -> list[int]:
+    stack = getattr(_local, "peaks", None)
+    if stack is None:
+        stack = _local.peaks = []
+    return stack
+
+
+def _rows(ctx: PipelineContext) -> int | None:
+    df = getattr(ctx, "data", None)
+    return len(df) if isinstance(df, pd.DataFrame) else None
+
+
+class InstrumentedStep(Step):
+    """
+    Step that appends one metrics record to `ctx.step_metrics` per run and
+    passes it to every callable in `ctx.step_hooks`.
+
+    Record keys: step, depth, pass, status, wall_s, cpu_s (calling thread),
+    peak_bytes (None unless `tracemalloc` is tracing), rows_in, rows_out.
+    """
+
+    def run(self, ctx: PipelineContext, depth: int = 1) -> PipelineContext:
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            # Keep the enclosing step's peak so far before resetting the peak.
+            base, peak = tracemalloc.get_traced_memory()
+            stack = _peak_stack()
+            if stack:
+                stack[-1] = max(stack[-1], peak)
+            tracemalloc.reset_peak()
+            stack.append(0)
+
+        rows_in = _rows(ctx)
+        status = "error"
+        wall0, cpu0 = time.perf_counter(), time.thread_time()
+        try:
+            ctx = super().run(ctx, depth)
+            status = "ok"
+            return ctx
+        finally:
+            record = {
+                "step": self.name,
+                "depth": depth,
+                "pass": getattr(ctx, "pass_idx", None),
+                "status": status,
+                "wall_s": time.perf_counter() - wall0,
+                "cpu_s": time.thread_time() - cpu0,
+                "peak_bytes": None,
+                "rows_in": rows_in,
+                "rows_out": _rows(ctx),
+            }
+            if tracing:
+                # Children reset the global peak, so fold theirs back into ours.
+                stack = _peak_stack()
+                peak = max(tracemalloc.get_traced_memory()[1], stack.pop())
+                if stack:
+                    stack[-1] = max(stack[-1], peak)
+                record["peak_bytes"] = peak - base
+
+            getattr(ctx, "step_metrics", []).append(record)
+            for hook in getattr(ctx, "step_hooks", []):
+                hook(record)
+
+
+class _CountPass(Step):
+    def __init__(self) -> None:
+        super().__init__(name="count_pass")
+
+    def logic(self, ctx: PipelineContext) -> PipelineContext:
+        ctx.pass_idx = getattr(ctx, "pass_idx", 0) + 1
+        return ctx
+
+
+class InstrumentedPipeline(Pipeline):
+    """Pipeline that counts passes in `ctx.pass_idx` (1-based)."""
+
+    def __init__(
+        self, steps: Sequence[Step], name: str = "pipeline", max_passes: int = 3
+    ) -> None:
+        # Every pass runs the step list from the top, so a leading step sees
+        # the start of each pass.
+        super().__init__([_CountPass(), *steps], name=name, max_passes=max_passes)
+
+    def run(self, ctx: PipelineContext) -> PipelineContext:
+        ctx.pass_idx = 0
+        return super().run(ctx)
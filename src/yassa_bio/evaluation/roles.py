@@ -0,0 +1,92 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from yassa_bio.schema.layout.enum import SampleType
+from yassa_bio.utils.category import enum_value
+from yassa_bio.utils.group import group_codes, group_rows
+
+if TYPE_CHECKING:
+    from yassa_bio.evaluation.context import LBAContext
+
+_EMPTY = np.empty(0, dtype=np.intp)
+
+
+def _positions(values: pd.Series) -> dict[Any, np.ndarray]:
+    codes, keys = group_codes(values)
+    return {enum_value(k): rows for k, rows in zip(keys, group_rows(codes, len(keys)))}
+
+
+class RoleIndex:
+    """
+    Positional row indices into `ctx.data` by role: per sample type, per QC
+    level (QC rows only) and per calibration concentration (standards only).
+    Every array is sorted ascending. Built once after `ExcludeData` and tied to
+    the row index (`index`) of the frame it was built from.
+    """
+
+    def __init__(
+        self,
+        index: pd.Index,
+        by_type: dict[str, np.ndarray],
+        by_qc_level: dict[str, np.ndarray],
+        by_cal_level: dict[float, np.ndarray],
+    ) -> None:
+        self.index = index
+        self.by_type = by_type
+        self.by_qc_level = by_qc_level
+        self.by_cal_level = by_cal_level
+
+    @classmethod
+    def build(cls, df: pd.DataFrame) -> RoleIndex:
+        by_type = _positions(df["sample_type"])
+
+        by_qc_level: dict[str, np.ndarray] = {}
+        qc = by_type.get(SampleType.QUALITY_CONTROL.value, _EMPTY)
+        if "qc_level" in df and len(qc):
+            sub = _positions(df["qc_level"].iloc[qc])
+            by_qc_level = {k: qc[v] for k, v in sub.items()}
+
+        by_cal_level: dict[float, np.ndarray] = {}
+        cal = by_type.get(SampleType.CALIBRATION_STANDARD.value, _EMPTY)
+        if "concentration" in df and len(cal):
+            sub = _positions(df["concentration"].iloc[cal])
+            by_cal_level = {float(k): cal[v] for k, v in sub.items()}
+
+        return cls(df.index, by_type, by_qc_level, by_cal_level)
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.index)
+
+    def matches(self, df: pd.DataFrame) -> bool:
+        """Whether `df` has the rows this index was built from, in order."""
+        return df.index is self.index or df.index.equals(self.index)
+
+    def rows(self, sample_type: SampleType | str) -> np.ndarray:
+        return self.by_type.get(enum_value(sample_type), _EMPTY)
+
+    def qc_rows(self, level: Any) -> np.ndarray:
+        return self.by_qc_level.get(enum_value(level), _EMPTY)
+
+    def cal_rows(self, concentration: float) -> np.ndarray:
+        return self.by_cal_level.get(float(concentration), _EMPTY)
+
+    def mask(self, sample_type: SampleType | str) -> np.ndarray:
+        m = np.zeros(self.n_rows, dtype=bool)
+        m[self.rows(sample_type)] = True
+        return m
+
+
+def role_index(ctx: LBAContext) -> RoleIndex:
+    """
+    `ctx.role_index`, (re)built from `ctx.data` when missing or built for a frame
+    with different rows (dropped, added or reordered).
+    """
+    idx = ctx.role_index
+    if idx is None or not idx.matches(ctx.data):
+        idx = RoleIndex.build(ctx.data)
+        ctx.role_index = idx
+    return idx
@@ -1,18 +1,39 @@
+import asyncio
 import logging
+import tracemalloc
+from concurrent.futures import Executor
+from functools import partial
+from typing import Iterable, Sequence
 
-from lilpipe.engine import Pipeline
 from yassa_bio.evaluation.context import LBAContext
+from yassa_bio.evaluation.instrument import InstrumentedPipeline, StepHook
 from yassa_bio.evaluation.analysis.step.preprocess import Preprocess
 from yassa_bio.evaluation.analysis.step.fit import CurveFit
 from yassa_bio.evaluation.acceptance.step.router import Acceptance
 from yassa_bio.evaluation.acceptance.step.analytical import Analytical
+from yassa_bio.evaluation.cache import ResultCache, result_key
+from yassa_bio.evaluation.grouped import PerGroup
 from yassa_bio.schema.layout.batch import BatchData
 from yassa_bio.schema.layout.plate import PlateData
 from yassa_bio.schema.analysis.config import LBAAnalysisConfig
 from yassa_bio.schema.acceptance.analytical.spec import LBAAnalyticalAcceptanceCriteria
 
+# Importing the engine modules registers their plug-ins.
+from yassa_bio.evaluation.analysis.engine import (  # noqa: F401
+    blank,
+    model,
+    normalize,
+    outlier,
+    transform,
+    weighting,
+)
+from yassa_bio.evaluation.acceptance.engine.analytical import (  # noqa: F401
+    calibration,
+    qc,
+)
+
 
-pipe = Pipeline(
+pipe = InstrumentedPipeline(
     name="LBA Analysis Pipeline",
     steps=[
         Preprocess(),
@@ -26,11 +47,53 @@ pipe = Pipeline(
     max_passes=3,
 )
 
+# Group-wise mode: preprocess the whole batch once, then fit and accept each
+# group on its own child context (with its own reruns).
+group_pipe = InstrumentedPipeline(
+    name="LBA Group-wise Analysis Pipeline",
+    steps=[
+        Preprocess(),
+        PerGroup(
+            InstrumentedPipeline(
+                name="LBA Group Pipeline",
+                steps=[
+                    CurveFit(),
+                    Acceptance(
+                        criteria={
+                            LBAAnalyticalAcceptanceCriteria: Analytical(),
+                        }
+                    ),
+                ],
+                max_passes=3,
+            )
+        ),
+    ],
+    max_passes=1,
+)
+
+_CACHED_FIELDS = ("acceptance_results", "acceptance_history", "acceptance_pass")
+
+
+def _run_pipe(ctx: LBAContext, trace_memory: bool) -> LBAContext:
+    pipeline = pipe if ctx.group_by is None else group_pipe
+    started = trace_memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        return pipeline.run(ctx)
+    finally:
+        if started:
+            tracemalloc.stop()
+
 
 def run(
     batch_data: BatchData | PlateData,
     analysis_config: LBAAnalysisConfig,
     acceptance_criteria: LBAAnalyticalAcceptanceCriteria,
+    cache: ResultCache | None = None,
+    hooks: Sequence[StepHook] | None = None,
+    trace_memory: bool = False,
+    group_by: str | None = None,
 ) -> LBAContext:
     """
     Run the full LBA analysis and acceptance pipeline.
@@ -49,6 +112,29 @@ def run(
         Which type of acceptance criteria to use:
         - Use `LBAAnalyticalAcceptanceCriteria` for routine analytical runs
 
+    cache : ResultCache, optional
+        Result store keyed by a content hash of the raw files, layouts and
+        configs. On a hit the stored acceptance results are returned without
+        running the pipeline; on a miss they are stored after the run.
+
+    hooks : sequence of callables, optional
+        Called with each step's metrics record as soon as the step finishes.
+        The same records are collected in `ctx.step_metrics`.
+
+    trace_memory : bool, default False
+        Trace allocations with `tracemalloc` for the duration of the run so the
+        metrics records carry `peak_bytes`. Adds noticeable overhead. Tracing
+        is process-wide: if it is already on, the run leaves it on, and peaks
+        of runs in other threads of the same process are not separated.
+
+    group_by : str, optional
+        Evaluate each group of this data column (typically ``"plate_id"``)
+        on its own within one invocation: the batch is loaded and
+        preprocessed once with per-group blank/normalization/outliers, then
+        every group is fitted and accepted separately. The per-group contexts
+        are in `ctx.groups`; `ctx.acceptance_results[spec]["per_group"]`
+        holds each group's result.
+
     Returns
     -------
     LBAContext
@@ -62,6 +148,8 @@ def run(
     - Logging is enabled at INFO level by default.
     - The pipeline will automatically dispatch to the appropriate acceptance steps
       depending on the type of criteria passed in.
+    - A context served from `cache` only carries the acceptance fields
+      (`acceptance_results`, `acceptance_history`, `acceptance_pass`).
 
     Example
     -------
@@ -71,11 +159,114 @@ def run(
     ```
     """
     logging.basicConfig(level=logging.INFO)
-    ctx = pipe.run(
-        LBAContext(
-            batch_data=batch_data,
-            analysis_config=analysis_config,
-            acceptance_criteria=acceptance_criteria,
-        )
+    ctx = LBAContext(
+        batch_data=batch_data,
+        analysis_config=analysis_config,
+        acceptance_criteria=acceptance_criteria,
+        step_hooks=list(hooks or []),
+        group_by=group_by,
     )
+    if cache is None:
+        return _run_pipe(ctx, trace_memory)
+
+    key = result_key(batch_data, analysis_config, acceptance_criteria)
+    if group_by is not None:
+        key = f"{key}-by-{group_by}"
+    payload = cache.get(key)
+    if payload is not None:
+        for field in _CACHED_FIELDS:
+            setattr(ctx, field, payload[field])
+        ctx.step_meta["result_cache"] = {"status": "hit", "key": key}
+        return ctx
+
+    ctx = _run_pipe(ctx, trace_memory)
+    cache.put(key, {field: getattr(ctx, field) for field in _CACHED_FIELDS})
+    ctx.step_meta["result_cache"] = {"status": "miss", "key": key}
     return ctx
+
+
+def _load(batch_data: BatchData | PlateData) -> None:
+    batch_data.df  # reads the raw files and caches the frame on the object
+
+
+async def arun(
+    batch_data: BatchData | PlateData,
+    analysis_config: LBAAnalysisConfig,
+    acceptance_criteria: LBAAnalyticalAcceptanceCriteria,
+    *,
+    executor: Executor | None = None,
+    cache: ResultCache | None = None,
+    hooks: Sequence[StepHook] | None = None,
+    trace_memory: bool = False,
+    group_by: str | None = None,
+) -> LBAContext:
+    """
+    Async version of `run` that keeps the event loop free.
+
+    The plate files are read in the default thread pool (`asyncio.to_thread`);
+    the pipeline itself runs in `executor`, or the loop's default executor when
+    None. Pass a `ProcessPoolExecutor` to take CPU-bound fitting off the GIL;
+    inputs and the returned context are pickled across the process boundary and
+    `hooks` then run in the worker process.
+    """
+    await asyncio.to_thread(_load, batch_data)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        partial(
+            run,
+            batch_data,
+            analysis_config,
+            acceptance_criteria,
+            cache=cache,
+            hooks=hooks,
+            trace_memory=trace_memory,
+            group_by=group_by,
+        ),
+    )
+
+
+async def arun_many(
+    inputs: Iterable[BatchData | PlateData],
+    analysis_config: LBAAnalysisConfig,
+    acceptance_criteria: LBAAnalyticalAcceptanceCriteria,
+    *,
+    executor: Executor | None = None,
+    max_concurrency: int = 4,
+    return_exceptions: bool = False,
+    cache: ResultCache | None = None,
+    hooks: Sequence[StepHook] | None = None,
+    trace_memory: bool = False,
+    group_by: str | None = None,
+) -> list[LBAContext | BaseException]:
+    """
+    Run `arun` over `inputs` with at most `max_concurrency` runs in flight.
+
+    Results come back in input order. With `return_exceptions=True` a failed
+    run yields its exception in place of a context, as in `asyncio.gather`.
+    The remaining keyword arguments are passed to every `run`. `tracemalloc`
+    is process-wide, so with `trace_memory=True` and a thread (default)
+    executor the `peak_bytes` of concurrent runs include each other's
+    allocations; use a `ProcessPoolExecutor` or `max_concurrency=1` for
+    per-run peaks.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def one(data: BatchData | PlateData) -> LBAContext:
+        async with sem:
+            return await arun(
+                data,
+                analysis_config,
+                acceptance_criteria,
+                executor=executor,
+                cache=cache,
+                hooks=hooks,
+                trace_memory=trace_memory,
+                group_by=group_by,
+            )
+
+    return await asyncio.gather(
+        *(one(data) for data in inputs), return_exceptions=return_exceptions
+    )
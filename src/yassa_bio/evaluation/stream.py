@@ -0,0 +1,211 @@
+from __future__ import annotations
+import asyncio
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+)
+
+from yassa_bio.evaluation.cache import ResultCache
+from yassa_bio.evaluation.context import LBAContext
+from yassa_bio.evaluation.run import run
+from yassa_bio.io.utils import as_path
+from yassa_bio.schema.layout.batch import BatchData
+from yassa_bio.schema.layout.plate import PlateData
+from yassa_bio.schema.analysis.config import LBAAnalysisConfig
+from yassa_bio.schema.acceptance.analytical.spec import LBAAnalyticalAcceptanceCriteria
+
+StreamItem = BatchData | PlateData | str | Path
+LayoutResolver = Callable[[Path], BatchData | PlateData]
+
+
+class StreamResult(NamedTuple):
+    """One evaluated input: `ctx` on success, `error` when the run raised."""
+
+    source: StreamItem
+    ctx: LBAContext | None
+    error: BaseException | None
+
+
+def _evaluate(
+    item: StreamItem,
+    analysis_config: LBAAnalysisConfig,
+    acceptance_criteria: LBAAnalyticalAcceptanceCriteria,
+    layout_resolver: LayoutResolver | None,
+    cache: ResultCache | None,
+) -> StreamResult:
+    try:
+        data = item
+        if not isinstance(item, (BatchData, PlateData)):
+            if layout_resolver is None:
+                raise TypeError(
+                    f"Got path {item!s} but no layout_resolver to map it to "
+                    "PlateData / BatchData"
+                )
+            data = layout_resolver(as_path(item))
+        ctx = run(data, analysis_config, acceptance_criteria, cache=cache)
+        return StreamResult(item, ctx, None)
+    except Exception as exc:
+        return StreamResult(item, None, exc)
+
+
+_DONE = object()
+
+
+def stream(
+    source: Iterable[StreamItem],
+    analysis_config: LBAAnalysisConfig,
+    acceptance_criteria: LBAAnalyticalAcceptanceCriteria,
+    *,
+    layout_resolver: LayoutResolver | None = None,
+    max_workers: int = 4,
+    max_pending: int | None = None,
+    cache: ResultCache | None = None,
+) -> Iterator[StreamResult]:
+    """
+    Evaluate plates / batches / file paths as `source` produces them and yield
+    a `StreamResult` for each one as soon as its run finishes.
+
+    `source` is consumed on a background thread, so a source that blocks while
+    waiting for new files does not hold back finished results. At most
+    `max_pending` inputs (default ``2 * max_workers``) are in flight or waiting
+    to be consumed; beyond that the source is not pulled (back-pressure).
+    Paths are turned into inputs by `layout_resolver` on the worker thread.
+    """
+    max_pending = max_pending or 2 * max_workers
+    slots = threading.Semaphore(max_pending)
+    results: queue.Queue = queue.Queue()
+    stop = threading.Event()
+
+    def feed(pool: ThreadPoolExecutor) -> None:
+        n = 0
+        try:
+            for item in source:
+                while not slots.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                fut = pool.submit(
+                    _evaluate,
+                    item,
+                    analysis_config,
+                    acceptance_criteria,
+                    layout_resolver,
+                    cache,
+                )
+                fut.add_done_callback(results.put)
+                n += 1
+        except BaseException as exc:
+            results.put(exc)
+        results.put((_DONE, n))
+
+    pool = ThreadPoolExecutor(max_workers, thread_name_prefix="yassa-stream")
+    feeder = threading.Thread(target=feed, args=(pool,), daemon=True)
+    feeder.start()
+
+    total, seen = None, 0
+    try:
+        while total is None or seen < total:
+            msg: Any = results.get()
+            if isinstance(msg, BaseException):
+                raise msg
+            if isinstance(msg, tuple) and msg[0] is _DONE:
+                total = msg[1]
+                continue
+            fut: Future = msg
+            seen += 1
+            slots.release()
+            yield fut.result()
+    finally:
+        # The daemon feeder may be blocked inside `source`; it exits on its
+        # own once the source yields again, so it is not joined here.
+        stop.set()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def _aiter_any(
+    source: AsyncIterable[StreamItem] | Iterable[StreamItem],
+) -> AsyncIterator[StreamItem]:
+    if isinstance(source, AsyncIterable):
+        async for item in source:
+            yield item
+    else:
+        # Pull sync sources on a worker thread: they may block (e.g. a
+        # directory watcher) and must not stall the event loop.
+        it = iter(source)
+        while (item := await asyncio.to_thread(next, it, _DONE)) is not _DONE:
+            yield item
+
+
+async def astream(
+    source: AsyncIterable[StreamItem] | Iterable[StreamItem],
+    analysis_config: LBAAnalysisConfig,
+    acceptance_criteria: LBAAnalyticalAcceptanceCriteria,
+    *,
+    layout_resolver: LayoutResolver | None = None,
+    max_workers: int = 4,
+    max_pending: int | None = None,
+    cache: ResultCache | None = None,
+) -> AsyncIterator[StreamResult]:
+    """
+    Async counterpart of `stream` for (async) iterables. Runs are executed in a
+    thread pool and sync sources are pulled on a worker thread, so the event
+    loop stays free; results are yielded in completion order while the next
+    input is awaited concurrently.
+    """
+    max_pending = max_pending or 2 * max_workers
+    loop = asyncio.get_running_loop()
+    items = _aiter_any(source)
+    pending: set[asyncio.Future] = set()
+    next_item: asyncio.Future | None = None
+    exhausted = False
+
+    with ThreadPoolExecutor(max_workers, thread_name_prefix="yassa-astream") as pool:
+        try:
+            while True:
+                if next_item is None and not exhausted and len(pending) < max_pending:
+                    next_item = asyncio.ensure_future(anext(items))
+                waiting = pending | ({next_item} if next_item else set())
+                if not waiting:
+                    return
+
+                done, _ = await asyncio.wait(
+                    waiting, return_when=asyncio.FIRST_COMPLETED
+                )
+                if next_item in done:
+                    try:
+                        item = next_item.result()
+                    except StopAsyncIteration:
+                        exhausted = True
+                    else:
+                        pending.add(
+                            loop.run_in_executor(
+                                pool,
+                                _evaluate,
+                                item,
+                                analysis_config,
+                                acceptance_criteria,
+                                layout_resolver,
+                                cache,
+                            )
+                        )
+                    next_item = None
+
+                for fut in done & pending:
+                    pending.discard(fut)
+                    yield fut.result()
+        finally:
+            if next_item is not None:
+                next_item.cancel()
+                # Let the cancelled `anext` unwind before closing the generator.
+                await asyncio.wait({next_item})
+            await items.aclose()
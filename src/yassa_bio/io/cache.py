@@ -0,0 +1,45 @@
+from __future__ import annotations
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+
+def _stem(path: Path, sheet_index: int) -> str:
+    digest = hashlib.sha256(str(path).encode()).hexdigest()[:32]
+    return f"{digest}-s{sheet_index}"
+
+
+def grid_cache_path(cache_dir: Path, path: Path, sheet_index: int) -> Path:
+    """
+    Cache entry for one parsed sheet. The name embeds the source file's
+    mtime (ns) and size, so any rewrite of the source misses the entry.
+    """
+    st = path.stat()
+    return cache_dir / f"{_stem(path, sheet_index)}-{st.st_mtime_ns}-{st.st_size}.npy"
+
+
+def load_grid(cache_dir: Path, path: Path, sheet_index: int) -> np.ndarray | None:
+    """Memory-map the cached grid for `path`/`sheet_index`, or None on a miss."""
+    entry = grid_cache_path(cache_dir, path, sheet_index)
+    try:
+        return np.load(entry, mmap_mode="r", allow_pickle=False)
+    except (FileNotFoundError, ValueError, OSError):
+        return None
+
+
+def save_grid(cache_dir: Path, path: Path, sheet_index: int, grid: np.ndarray) -> Path:
+    """Atomically write `grid` and drop older entries for the same sheet."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    entry = grid_cache_path(cache_dir, path, sheet_index)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    with os.fdopen(fd, "wb") as fh:
+        np.save(fh, np.ascontiguousarray(grid, dtype=float), allow_pickle=False)
+    os.replace(tmp, entry)
+
+    for old in cache_dir.glob(f"{_stem(path, sheet_index)}-*.npy"):
+        if old != entry:
+            old.unlink(missing_ok=True)
+    return entry
@@ -0,0 +1,37 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Iterable, Mapping, Sequence
+
+from yassa_bio.io.reader import read_grids
+from yassa_bio.schema.layout.plate import PlateData
+
+
+def group_by_file(plates: Iterable[PlateData]) -> dict[Path, list[PlateData]]:
+    """Plates keyed by source file path, in first-appearance order."""
+    groups: dict[Path, list[PlateData]] = {}
+    for p in plates:
+        groups.setdefault(p.source_file.path, []).append(p)
+    return groups
+
+
+def load_file_group(plates: Sequence[PlateData], mtimes: Mapping[str, float]) -> None:
+    """
+    Fill the `df` cache of every plate in `plates`, which must all share one
+    source file: the file is parsed (or memory-mapped from its cache) once and
+    each plate's wells are indexed out of the grid at its row/col offsets.
+    `mtimes` maps plate_id to the file mtime recorded with the cached frame.
+    """
+    path = plates[0].source_file.path
+    sheets = list(dict.fromkeys(p.layout.sheet_index for p in plates))
+    try:
+        grids = read_grids(path, sheets, plates[0].source_file.cache_dir)
+    except Exception:
+        # Re-read sheet by sheet so the error names the plate that owns the
+        # sheet that failed.
+        grids = {}
+        for p in plates:
+            if p.layout.sheet_index not in grids:
+                grids[p.layout.sheet_index] = p._read_grid()
+
+    for p in plates:
+        p._build_df(grids[p.layout.sheet_index], mtimes[p.plate_id])
@@ -1,8 +1,11 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from typing import Optional, Sequence
 
-from yassa_bio.core.registry import register
+from yassa_bio.core.registry import get, register
+from yassa_bio.io.cache import load_grid, save_grid
 
 
 def _infer_format(path: Path) -> str:
@@ -14,6 +17,12 @@ def _infer_format(path: Path) -> str:
     raise ValueError(f"Cannot infer reader for {ext!s}")
 
 
+def to_numeric_grid(raw: pd.DataFrame) -> np.ndarray:
+    """Whole sheet as a float matrix; non-numeric cells become NaN."""
+    flat = pd.to_numeric(pd.Series(raw.to_numpy().ravel()), errors="coerce")
+    return flat.to_numpy(float).reshape(raw.shape)
+
+
 @register("reader", "csv")
 def read_csv(path: Path, **kwargs) -> pd.DataFrame:
     header = kwargs.get("header", None)
@@ -31,3 +40,39 @@ def read_excel(path: Path, **kwargs) -> pd.DataFrame:
     return pd.read_excel(
         path, sheet_name=sheet_index, header=header, dtype=dtype, engine=engine
     )
+
+
+def read_grids(
+    path: Path, sheets: Sequence[int], cache_dir: Optional[Path] = None
+) -> dict[int, np.ndarray]:
+    """
+    Parse `path` once and return a numeric grid per requested sheet.
+
+    Workbooks are opened a single time for all sheets; single-sheet formats
+    (csv / txt) are read once and shared by every sheet index. With
+    `cache_dir`, sheets with an up-to-date binary entry are memory-mapped
+    instead of parsed, and freshly parsed sheets are written back.
+    """
+    grids: dict[int, np.ndarray] = {}
+    if cache_dir is not None:
+        for s in sheets:
+            grid = load_grid(cache_dir, path, s)
+            if grid is not None:
+                grids[s] = grid
+    missing = [s for s in sheets if s not in grids]
+    if not missing:
+        return grids
+
+    format = _infer_format(path)
+    reader = get("reader", format)
+    if format == "excel":
+        raw = reader(path=path, sheet_index=missing)
+        parsed = {s: to_numeric_grid(raw[s]) for s in missing}
+    else:
+        grid = to_numeric_grid(reader(path=path))
+        parsed = {s: grid for s in missing}
+
+    if cache_dir is not None:
+        for s, grid in parsed.items():
+            save_grid(cache_dir, path, s, grid)
+    return {**grids, **parsed}
@@ -0,0 +1,231 @@
+from __future__ import annotations
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Mapping, Optional, Sequence
+
+import pandas as pd
+
+from yassa_bio.evaluation.analysis.step.fit import BATCH_FIT
+from yassa_bio.evaluation.cache import result_key
+from yassa_bio.evaluation.context import LBAContext
+from yassa_bio.io.utils import as_path
+from yassa_bio.schema.layout.batch import BatchData
+
+PARTITIONS: dict[str, list[str]] = {
+    "wells": ["study", "plate_id", "run_date"],
+    "levels": ["study", "run_date"],
+    "params": ["study", "run_date"],
+    "runs": ["study", "run_date"],
+}
+
+_WELL_FRAMES = {
+    "data": "used",
+    "excluded_data": "excluded",
+    "dropped_cal_wells": "dropped_calibration",
+}
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(
+            "Parquet export needs pyarrow: pip install 'yassa-bio[parquet]'"
+        ) from exc
+    return pa, ds, pq
+
+
+def _plates(ctx: LBAContext):
+    data = ctx.batch_data
+    return data.plates if isinstance(data, BatchData) else [data]
+
+
+def _run_date(ctx: LBAContext) -> Optional[str]:
+    dates = [p.source_file.run_date for p in _plates(ctx) if p.source_file.run_date]
+    return min(dates).date().isoformat() if dates else None
+
+
+def _level_records(results: Mapping[str, Any], group: Optional[str]) -> list[dict]:
+    records = []
+    for spec, res in results.items():
+        for level, vals in (res.get("per_level") or {}).items():
+            records.append({"spec": spec, "group": group, "level": str(level), **vals})
+        for key, sub in (res.get("per_group") or {}).items():
+            records += _level_records({spec: sub or {}}, key)
+    return records
+
+
+def _param_records(ctx: LBAContext, group: Optional[str]) -> list[dict]:
+    """One record per fitted (or failed) curve, recursing into `ctx.groups`."""
+
+    def record(fit_group: Optional[str], params, key: str) -> dict:
+        selected = ctx.model_selection.get(key, {}).get("selected")
+        return {
+            "group": group,
+            "fit_group": fit_group,
+            "curve_model": selected or ctx.analysis_config.curve_fit.model.value,
+            "curve_params": None if params is None else list(map(float, params)),
+            "fit_failure": ctx.fit_failures.get(key),
+        }
+
+    records = []
+    if ctx.curve_params is not None or BATCH_FIT in ctx.fit_failures:
+        records.append(record(None, ctx.curve_params, BATCH_FIT))
+    fit_groups = dict.fromkeys([*ctx.curve_params_by_group, *ctx.fit_failures])
+    fit_groups.pop(BATCH_FIT, None)
+    for key in fit_groups:
+        records.append(record(key, ctx.curve_params_by_group.get(key), key))
+    for key, child in ctx.groups.items():
+        records += _param_records(child, key)
+    return records
+
+
+def results_tables(
+    ctx: LBAContext, run_id: str, study: Optional[str] = None
+) -> dict[str, pd.DataFrame]:
+    """
+    Flatten a finished context into the `wells`, `levels`, `params` and `runs`
+    frames written by `export_results`. In group-wise runs the `levels` and
+    `params` rows of each group carry its key in `group`.
+    """
+    run_date = _run_date(ctx)
+    plate_dates = {
+        p.plate_id: (
+            p.source_file.run_date.date().isoformat()
+            if p.source_file.run_date
+            else None
+        )
+        for p in _plates(ctx)
+    }
+
+    frames = []
+    for attr, status in _WELL_FRAMES.items():
+        df = getattr(ctx, attr)
+        if df is not None and not df.empty:
+            frames.append(df.assign(well_status=status))
+    wells = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    if "plate_id" not in wells:
+        wells["plate_id"] = pd.Series(dtype=object)
+    for col in wells.select_dtypes(include="object").columns:
+        wells[col] = wells[col].map(lambda v: v.value if hasattr(v, "value") else v)
+    wells = wells.assign(
+        run_id=run_id,
+        study=study,
+        run_date=wells["plate_id"].map(plate_dates),
+    )
+
+    levels = pd.DataFrame.from_records(_level_records(ctx.acceptance_results, None))
+    levels = levels.assign(run_id=run_id, study=study, run_date=run_date)
+
+    params = pd.DataFrame.from_records(_param_records(ctx, None))
+    params = params.assign(run_id=run_id, study=study, run_date=run_date)
+
+    run: dict[str, Any] = {
+        "run_id": run_id,
+        "study": study,
+        "run_date": run_date,
+        "plate_ids": [p.plate_id for p in _plates(ctx)],
+        "acceptance_pass": ctx.acceptance_pass,
+        "num_passes": len(ctx.acceptance_history),
+        "curve_model": (
+            ctx.model_selection.get(BATCH_FIT, {}).get("selected")
+            or ctx.analysis_config.curve_fit.model.value
+        ),
+        "curve_params": (
+            None if ctx.curve_params is None else list(map(float, ctx.curve_params))
+        ),
+        "exported_at": datetime.now(timezone.utc),
+    }
+    for spec, res in ctx.acceptance_results.items():
+        run[f"{spec}_pass"] = bool(res.get("pass"))
+        run[f"{spec}_error"] = res.get("error")
+    runs = pd.DataFrame.from_records([run])
+
+    return {"wells": wells, "levels": levels, "params": params, "runs": runs}
+
+
+def export_results(
+    ctx: LBAContext,
+    root: str | Path,
+    *,
+    run_id: Optional[str] = None,
+    study: Optional[str] = None,
+) -> str:
+    """
+    Append one run's results to the Parquet datasets under `root` and return
+    its `run_id`. Each table is a hive-partitioned dataset in its own
+    subdirectory (partition columns in `PARTITIONS`), and every row carries
+    `run_id` so the tables join on it. Requires the optional ``pyarrow``
+    dependency (``pip install 'yassa-bio[parquet]'``). The default id is the
+    run's content hash (`result_key`, suffixed with the `group_by` column as in
+    the result cache), so exporting the same run twice overwrites rather than
+    duplicates it.
+    """
+    pa, _, pq = _pyarrow()
+    root = as_path(root)
+    if run_id is None:
+        run_id = result_key(
+            ctx.batch_data, ctx.analysis_config, ctx.acceptance_criteria
+        )
+        if ctx.group_by is not None:
+            run_id = f"{run_id}-by-{ctx.group_by}"
+
+    for name, df in results_tables(ctx, run_id, study).items():
+        if df.empty:
+            continue
+        parts = PARTITIONS[name]
+        df = df.astype({c: object for c in parts})
+        pq.write_to_dataset(
+            pa.Table.from_pandas(df, preserve_index=False),
+            root_path=root / name,
+            partition_cols=parts,
+            basename_template=f"{run_id}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+    return run_id
+
+
+def read_results(
+    root: str | Path,
+    table: str = "wells",
+    *,
+    filters: Optional[Mapping[str, Any]] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Load one exported table as a DataFrame.
+
+    `filters` maps column → value (or list of values) and is pushed down to
+    the partition and row-group level, e.g. ``{"study": "S1", "plate_id":
+    ["P1", "P2"]}``. Columns added in later exports are filled with nulls for
+    older runs.
+    """
+    pa, ds, _ = _pyarrow()
+    if table not in PARTITIONS:
+        raise ValueError(f"Unknown table {table!r}; expected one of {list(PARTITIONS)}")
+
+    path = as_path(root) / table
+    if not path.exists():
+        return pd.DataFrame()
+
+    partitioning = ds.partitioning(
+        pa.schema([(c, pa.string()) for c in PARTITIONS[table]]), flavor="hive"
+    )
+    files = ds.dataset(path, format="parquet", partitioning=partitioning)
+    schema = pa.unify_schemas(
+        [f.physical_schema for f in files.get_fragments()] + [files.schema],
+        promote_options="permissive",
+    )
+    dataset = ds.dataset(
+        path, format="parquet", partitioning=partitioning, schema=schema
+    )
+
+    expr = None
+    for col, value in (filters or {}).items():
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        term = ds.field(col).isin(list(values))
+        expr = term if expr is None else expr & term
+
+    return dataset.to_table(filter=expr, columns=columns).to_pandas()
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, PositiveFloat
-from typing import List
+from typing import List, Optional
 
 from yassa_bio.core.typing import Percent, Fraction01
 from yassa_bio.schema.layout.enum import SampleType, QCLevel
@@ -37,3 +37,28 @@ class AnalyticalQCSpec(BaseModel):
         0.50,
         description="Fraction of wells at every QC level that must pass.",
     )
+    cv_tol_pct: Optional[PositiveFloat] = Percent(
+        None,
+        description=(
+            "Per-level precision tolerance (CV % of the back-calculated "
+            "replicates). Opt-in: None (the default) skips the check."
+        ),
+    )
+    cv_tol_pct_edge: Optional[PositiveFloat] = Percent(
+        None,
+        description="CV tolerance (%) for LLOQ and ULOQ QCs; None uses cv_tol_pct.",
+    )
+    total_error_tol_pct: Optional[PositiveFloat] = Percent(
+        None,
+        description=(
+            "Per-level total error tolerance (|mean bias| + CV, %). "
+            "Opt-in: None (the default) skips the check."
+        ),
+    )
+    total_error_tol_pct_edge: Optional[PositiveFloat] = Percent(
+        None,
+        description=(
+            "Total error tolerance (%) for LLOQ and ULOQ QCs; "
+            "None uses total_error_tol_pct."
+        ),
+    )
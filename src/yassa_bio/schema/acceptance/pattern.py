@@ -3,6 +3,7 @@ from typing import Optional
 import pandas as pd
 
 from yassa_bio.schema.layout.enum import SampleType, QCLevel
+from yassa_bio.utils.category import eq_mask
 
 
 class RequiredWellPattern(BaseModel):
@@ -10,12 +11,12 @@ class RequiredWellPattern(BaseModel):
     qc_level: Optional[QCLevel] = None
 
     def mask(self, df: pd.DataFrame) -> pd.Series:
-        m = df["sample_type"] == self.sample_type.value
+        m = eq_mask(df["sample_type"], self.sample_type)
 
         if self.qc_level is not None:
-            m &= df["qc_level"] == self.qc_level.value
+            m &= eq_mask(df["qc_level"], self.qc_level)
 
-        return m
+        return pd.Series(m, index=df.index)
 
     def present(self, df: pd.DataFrame) -> bool:
         return self.mask(df).any()
@@ -6,6 +6,26 @@ class CurveModel(StrEnum):
     FOUR_PL = "4PL"
     FIVE_PL = "5PL"
     LINEAR = "linear"
+    AUTO = "auto"
+
+
+class SelectionCriterion(StrEnum):
+    AIC = "aic"
+    BIC = "bic"
+    RESIDUAL_SD = "residual_sd"
+
+
+class SolverMethod(StrEnum):
+    LM = "lm"
+    TRF = "trf"
+    DOGBOX = "dogbox"
+
+
+class SolverLoss(StrEnum):
+    LINEAR = "linear"
+    SOFT_L1 = "soft_l1"
+    HUBER = "huber"
+    CAUCHY = "cauchy"
 
 
 class Weighting(StrEnum):
@@ -43,3 +63,5 @@ class NormRule(StrEnum):
     NONE = "none"
     SPAN = "span"
     MAX = "max"
+    PERCENT_MAX = "percent_max"
+    B_B0 = "b_b0"
@@ -1,15 +1,123 @@
 from __future__ import annotations
-from pydantic import Field
+from typing import Optional
+
+from pydantic import Field, PositiveFloat, PositiveInt, model_validator
 
 from yassa_bio.core.model import SchemaModel
+from yassa_bio.core.typing import Fraction01
 from yassa_bio.schema.analysis.enum import (
     CurveModel,
+    SelectionCriterion,
+    SolverLoss,
+    SolverMethod,
     Weighting,
     Transformation,
 )
 from yassa_bio.core.enum import enum_examples
 
 
+class SolverOptions(SchemaModel):
+    """
+    Settings for the nonlinear least-squares solver behind the 4PL/5PL fits.
+    """
+
+    method: SolverMethod = Field(
+        SolverMethod.TRF,
+        description=(
+            "Solver algorithm: Levenberg-Marquardt (lm, unbounded, linear loss "
+            "only), trust-region reflective (trf) or dogleg (dogbox)."
+        ),
+        examples=enum_examples(SolverMethod),
+    )
+    max_nfev: Optional[PositiveInt] = Field(
+        None,
+        description=(
+            "Maximum number of function evaluations before the fit is reported "
+            "as failed. None uses the solver default."
+        ),
+    )
+    ftol: PositiveFloat = Field(
+        1e-8, description="Tolerance on the relative change of the cost function."
+    )
+    xtol: PositiveFloat = Field(
+        1e-8, description="Tolerance on the relative change of the parameters."
+    )
+    gtol: PositiveFloat = Field(1e-8, description="Tolerance on the gradient norm.")
+    loss: SolverLoss = Field(
+        SolverLoss.LINEAR,
+        description=(
+            "Residual loss; soft_l1, huber and cauchy down-weight outlying standards."
+        ),
+        examples=enum_examples(SolverLoss),
+    )
+    f_scale: PositiveFloat = Field(
+        1.0,
+        description=(
+            "Residual size (in weighted units) where robust losses start to "
+            "down-weight; ignored for the linear loss."
+        ),
+    )
+    bounded: bool = Field(
+        True,
+        description=(
+            "Constrain parameters to physical ranges derived from the standards: "
+            "positive slope and asymmetry, EC50 within 1000x of the "
+            "concentration range, asymptotes within 10 signal spans."
+        ),
+    )
+
+    @model_validator(mode="after")
+    def _lm_is_unbounded_least_squares(self):
+        if self.method is SolverMethod.LM and (
+            self.bounded or self.loss is not SolverLoss.LINEAR
+        ):
+            raise ValueError(
+                "method 'lm' supports neither bounds nor robust losses; "
+                "set bounded=False and loss='linear'"
+            )
+        return self
+
+
+class ModelSelection(SchemaModel):
+    """
+    How `model="auto"` chooses among candidate curve models fitted to the
+    same calibration data.
+    """
+
+    candidates: list[CurveModel] = Field(
+        [CurveModel.FOUR_PL, CurveModel.FIVE_PL, CurveModel.LINEAR],
+        min_length=1,
+        description="Models fitted and compared.",
+        examples=[["4PL", "5PL"]],
+    )
+    criterion: SelectionCriterion = Field(
+        SelectionCriterion.AIC,
+        description=(
+            "Score minimized to pick the model: AIC, BIC or the weighted "
+            "residual standard deviation."
+        ),
+        examples=enum_examples(SelectionCriterion),
+    )
+    lack_of_fit_alpha: float = Fraction01(
+        0.05,
+        description=(
+            "Significance level of the replicate-based lack-of-fit F-test. "
+            "Models that fail it are only chosen if every candidate fails."
+        ),
+    )
+    max_workers: int = Field(
+        1,
+        ge=1,
+        description="Threads used to fit the candidates concurrently.",
+    )
+
+    @model_validator(mode="after")
+    def _candidates_are_concrete(self):
+        if CurveModel.AUTO in self.candidates:
+            raise ValueError("'auto' cannot be a selection candidate")
+        return self
+
+
 class CurveFit(SchemaModel):
     """
     Parameters defining the mathematical model used for fitting the
@@ -36,3 +144,14 @@ class CurveFit(SchemaModel):
         description="Weighting scheme applied to curve fit residuals.",
         examples=enum_examples(Weighting),
     )
+    solver: SolverOptions = SolverOptions()
+    selection: ModelSelection = ModelSelection()
+    fit_by: Optional[str] = Field(
+        None,
+        description=(
+            "Data column whose groups each get their own fitted curve, e.g. "
+            "'plate_id' when every plate carries its own standards. None fits "
+            "one curve over all calibration wells in the batch."
+        ),
+        examples=["plate_id"],
+    )
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from typing import Optional
 
 from pydantic import Field, PositiveFloat
 
@@ -50,9 +51,22 @@ class Preprocess(SchemaModel):
         description="Subtract blank well signal from all sample measurements.",
         examples=enum_examples(BlankRule),
     )
+    blank_by: Optional[str] = Field(
+        None,
+        description="Column to pool blank wells by; None pools the whole batch.",
+        examples=["plate_id"],
+    )
     norm_rule: NormRule = Field(
         NormRule.NONE,
-        description="Normalize each sample signal to the calibration standard range.",
+        description=(
+            "Normalize each sample signal to the calibration standards "
+            "(concentration span or max, percent of top signal, or B/B0)."
+        ),
         examples=enum_examples(NormRule),
     )
+    norm_by: Optional[str] = Field(
+        None,
+        description="Column to normalize within, e.g. 'plate_id' for a per-plate B0.",
+        examples=["plate_id"],
+    )
     outliers: OutlierParams = OutlierParams()
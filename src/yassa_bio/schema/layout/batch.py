@@ -1,10 +1,21 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from pydantic import Field, PrivateAttr
+import numpy as np
 import pandas as pd
 
 from yassa_bio.core.model import SchemaModel
+from yassa_bio.io.group import group_by_file, load_file_group
 from yassa_bio.schema.layout.plate import PlateData
+from yassa_bio.utils.category import as_categorical
+
+
+def _repeat_categorical(values: list[str], lengths: list[int]) -> pd.Categorical:
+    """`values[i]` repeated `lengths[i]` times, as codes into the distinct values."""
+    categories = list(dict.fromkeys(values))
+    codes = np.array([categories.index(v) for v in values], dtype=np.int32)
+    return pd.Categorical.from_codes(np.repeat(codes, lengths), categories)
 
 
 class BatchData(SchemaModel):
@@ -20,6 +31,14 @@ class BatchData(SchemaModel):
     plates: List[PlateData] = Field(
         ..., description="All plates whose results will be combined for acceptance."
     )
+    max_workers: int = Field(
+        1,
+        ge=1,
+        description=(
+            "Threads used to read and parse plate files. 1 loads sequentially; "
+            "higher values help when files live on slow or network storage."
+        ),
+    )
 
     _df: Optional[pd.DataFrame] = PrivateAttr(None)
     _mtimes: Optional[dict[str, float]] = PrivateAttr(None)
@@ -32,11 +51,39 @@ class BatchData(SchemaModel):
         if self._df is not None and self._mtimes == current_mtimes:
             return self._df
 
-        frames: list[pd.DataFrame] = []
-        for p in self.plates:
-            df_plate = p.df.copy()
-            frames.append(df_plate)
+        self._load_stale(current_mtimes)
+        frames = [p.df for p in self.plates]
+        lengths = [len(f) for f in frames]
+
+        df = pd.concat(frames, ignore_index=True)
+        df["plate_id"] = _repeat_categorical([p.plate_id for p in self.plates], lengths)
+        df["source_file"] = _repeat_categorical(
+            [str(p.source_file.path) for p in self.plates], lengths
+        )
 
-        self._df = pd.concat(frames, ignore_index=True)
+        self._df = as_categorical(df)
         self._mtimes = current_mtimes
         return self._df
+
+    def _load_stale(self, mtimes: dict[str, float]) -> None:
+        """
+        Load every stale plate, parsing each source file once for all plates
+        that reference it, on up to `max_workers` threads. The first failure
+        in plate order is re-raised.
+        """
+        groups = group_by_file(
+            p for p in self.plates if not p._is_fresh(mtimes[p.plate_id])
+        )
+
+        if self.max_workers == 1 or len(groups) <= 1:
+            for plates in groups.values():
+                load_file_group(plates, mtimes)
+            return
+
+        with ThreadPoolExecutor(min(self.max_workers, len(groups))) as pool:
+            futures = [
+                pool.submit(load_file_group, plates, mtimes)
+                for plates in groups.values()
+            ]
+            for fut in futures:
+                fut.result()
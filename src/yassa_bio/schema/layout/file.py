@@ -43,3 +43,15 @@ class PlateReaderFile(FileRef):
         None,
         description="Initials or user ID of analyst.",
     )
+    cache_dir: Optional[Path] = Field(
+        None,
+        description=(
+            "Directory for a binary cache of the parsed signal grid. Later loads "
+            "memory-map it instead of re-parsing while the source is unchanged."
+        ),
+    )
+
+    @field_validator("cache_dir", mode="before")
+    @classmethod
+    def _norm_cache_dir(cls, v):
+        return None if v is None else as_path(v)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import List, Optional
 from pydantic import Field, model_validator, PrivateAttr
+import numpy as np
 import pandas as pd
 
 from yassa_bio.schema.layout.file import PlateReaderFile
@@ -10,8 +11,8 @@ from yassa_bio.schema.layout.standard import StandardSeries
 from yassa_bio.core.model import SchemaModel
 from yassa_bio.core.enum import enum_examples
 from yassa_bio.utils.standard import series_concentration_map
-from yassa_bio.core.registry import get
-from yassa_bio.io.reader import _infer_format
+from yassa_bio.utils.category import as_categorical
+from yassa_bio.io.reader import read_grids
 
 
 class PlateData(SchemaModel):
@@ -35,50 +36,69 @@ class PlateData(SchemaModel):
     layout: PlateLayout = Field(
         ..., description="Map defining well roles and nominal values."
     )
+    row_offset: int = Field(
+        0,
+        ge=0,
+        description=(
+            "Added to every well's file_row, so one layout can address several "
+            "plate blocks stacked in the same sheet."
+        ),
+    )
+    col_offset: int = Field(
+        0,
+        ge=0,
+        description="Added to every well's file_col (side-by-side plate blocks).",
+    )
 
     _df: Optional[pd.DataFrame] = PrivateAttr(None)
     _mtime: Optional[float] = PrivateAttr(None)
 
     @property
     def df(self) -> pd.DataFrame:
-        path = self.source_file.path
+        mtime = self._current_mtime()
+        if not self._is_fresh(mtime):
+            self._build_df(self._read_grid(), mtime)
+        return self._df
 
+    def _load_error(self, exc: Exception) -> ValueError:
+        return ValueError(
+            f"While loading plate '{self.plate_id}' "
+            f"from {self.source_file.path!s} (sheet {self.layout.sheet_index}): "
+            f"{type(exc).__name__}: {exc}"
+        )
+
+    def _current_mtime(self) -> float:
         try:
-            current_mtime = path.stat().st_mtime
+            return self.source_file.path.stat().st_mtime
         except Exception as exc:
-            raise ValueError(
-                f"While loading plate '{self.plate_id}' "
-                f"from {path!s} (sheet {self.layout.sheet_index}): "
-                f"{type(exc).__name__}: {exc}"
-            ) from exc
-
-        if self._df is None or self._mtime != current_mtime:
-            try:
-                format = _infer_format(path)
-                reader = get("reader", format)
-                raw = reader(
-                    path=path,
-                    sheet_index=self.layout.sheet_index,
-                )
-            except Exception as exc:
-                raise ValueError(
-                    f"While loading plate '{self.plate_id}' "
-                    f"from {path!s} (sheet {self.layout.sheet_index}): "
-                    f"{type(exc).__name__}: {exc}"
-                ) from exc
-
-            records = [
-                {
-                    **w.record,
-                    "signal": pd.to_numeric(
-                        raw.iat[w.file_row, w.file_col], errors="coerce"
-                    ),
-                }
-                for w in self.layout.wells
-            ]
-            self._df = pd.DataFrame.from_records(records)
-            self._mtime = current_mtime
+            raise self._load_error(exc) from exc
 
+    def _is_fresh(self, mtime: float) -> bool:
+        return self._df is not None and self._mtime == mtime
+
+    def _read_grid(self) -> np.ndarray:
+        """Numeric cell grid of the sheet this plate lives on."""
+        sheet = self.layout.sheet_index
+        try:
+            grids = read_grids(
+                self.source_file.path, [sheet], self.source_file.cache_dir
+            )
+        except Exception as exc:
+            raise self._load_error(exc) from exc
+        return grids[sheet]
+
+    def _build_df(self, grid: np.ndarray, mtime: float) -> pd.DataFrame:
+        """Pull this plate's wells out of the sheet's numeric `grid` and cache."""
+        frame, rows, cols = self.layout.compiled()
+        try:
+            signal = grid[rows + self.row_offset, cols + self.col_offset]
+        except IndexError as exc:
+            raise self._load_error(exc) from exc
+        df = frame.copy()
+        df["signal"] = signal
+        df["plate_id"] = self.plate_id
+        self._df = df
+        self._mtime = mtime
         return self._df
 
 
@@ -113,6 +133,23 @@ class PlateLayout(SchemaModel):
         ),
     )
 
+    _compiled: Optional[tuple] = PrivateAttr(None)
+
+    def compiled(self) -> tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+        """
+        Well records as a frame (role columns categorical) plus file_row /
+        file_col index arrays, cached until any well's field values change.
+        """
+        key = tuple(tuple(w.__dict__.values()) for w in self.wells)
+        if self._compiled is None or self._compiled[0] != key:
+            frame = as_categorical(
+                pd.DataFrame.from_records([w.record for w in self.wells])
+            )
+            rows = np.fromiter((w.file_row for w in self.wells), int, len(self.wells))
+            cols = np.fromiter((w.file_col for w in self.wells), int, len(self.wells))
+            self._compiled = (key, frame, rows, cols)
+        return self._compiled[1:]
+
     @model_validator(mode="after")
     def _resolve_standard_concs(self):
         if self.standards is None:
@@ -0,0 +1,62 @@
+from __future__ import annotations
+from enum import Enum
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+from yassa_bio.schema.layout.enum import QCLevel, SampleType
+
+SAMPLE_TYPE_DTYPE = pd.CategoricalDtype([e.value for e in SampleType])
+QC_LEVEL_DTYPE = pd.CategoricalDtype([e.value for e in QCLevel])
+
+CATEGORY_DTYPES: dict[str, pd.CategoricalDtype] = {
+    "sample_type": SAMPLE_TYPE_DTYPE,
+    "qc_level": QC_LEVEL_DTYPE,
+}
+
+
+def enum_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def as_categorical(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return `df` with its role columns (`CATEGORY_DTYPES`) as fixed-category
+    Categoricals so frames from different plates concatenate without falling
+    back to object. Values outside the enum are appended as extra categories.
+    `df` itself is returned untouched when nothing needs converting.
+    """
+    updates = {}
+    for col, dtype in CATEGORY_DTYPES.items():
+        if col not in df or df[col].dtype == dtype:
+            continue
+        values = df[col].map(enum_value) if df[col].dtype == object else df[col]
+        extra = pd.Index(values.dropna().unique()).difference(dtype.categories)
+        if len(extra):
+            dtype = pd.CategoricalDtype(dtype.categories.append(extra))
+        updates[col] = values.astype(dtype)
+    return df.assign(**updates) if updates else df
+
+
+def _codes(values: pd.Series, options: Iterable[Any]) -> list[int]:
+    cats = values.cat.categories
+    return [cats.get_loc(v) for v in map(enum_value, options) if v in cats]
+
+
+def eq_mask(values: pd.Series, value: Any) -> np.ndarray:
+    """`values == value` as a bool array, on integer codes when categorical."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = _codes(values, [value])
+        if not codes:
+            return np.zeros(len(values), dtype=bool)
+        return values.cat.codes.to_numpy() == codes[0]
+    return (values == enum_value(value)).to_numpy(bool)
+
+
+def isin_mask(values: pd.Series, options: Iterable[Any]) -> np.ndarray:
+    """`values.isin(options)` as a bool array, on integer codes when categorical."""
+    options = list(options)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return np.isin(values.cat.codes.to_numpy(), _codes(values, options))
+    return values.isin([enum_value(o) for o in options]).to_numpy(bool)
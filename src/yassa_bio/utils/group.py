@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def group_codes(values: pd.Series) -> tuple[np.ndarray, pd.Index]:
+    """Integer group code per row (-1 where the key is missing) and the keys."""
+    codes, keys = pd.factorize(values, sort=True)
+    return codes.astype(np.intp), pd.Index(keys)
+
+
+def group_stat(
+    values: np.ndarray,
+    mask: np.ndarray,
+    codes: np.ndarray,
+    n_groups: int,
+    how: str,
+) -> np.ndarray:
+    """
+    Per-group `how` ("mean", "median", "min", "max") of the finite
+    `values[mask]`, in one groupby pass (a bincount for "mean"). Groups
+    without rows are NaN.
+    """
+    keep = mask & np.isfinite(values) & (codes >= 0)
+    if how == "mean":
+        counts = np.bincount(codes[keep], minlength=n_groups)
+        sums = np.bincount(codes[keep], weights=values[keep], minlength=n_groups)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts > 0, sums / counts, np.nan)
+    out = np.full(n_groups, np.nan)
+    if keep.any():
+        stat = pd.Series(values[keep]).groupby(codes[keep], sort=False).agg(how)
+        out[stat.index.to_numpy()] = stat.to_numpy()
+    return out
+
+
+def group_moments(
+    values: np.ndarray, codes: np.ndarray, n_groups: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-group count, mean and sample standard deviation (ddof=1) of the
+    finite `values`, from bincounts. Mean is NaN without rows, SD with fewer
+    than two.
+    """
+    keep = np.isfinite(values) & (codes >= 0)
+    c, v = codes[keep], values[keep]
+    count = np.bincount(c, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.bincount(c, weights=v, minlength=n_groups) / count
+        ss = np.bincount(c, weights=(v - mean[c]) ** 2, minlength=n_groups)
+        sd = np.where(count > 1, np.sqrt(ss / (count - 1)), np.nan)
+    return count, mean, sd
+
+
+def group_rows(codes: np.ndarray, n_groups: int) -> list[np.ndarray]:
+    """Sorted positional rows of each group, from one stable argsort."""
+    order = np.argsort(codes, kind="stable")
+    order = order[codes[order] >= 0]
+    counts = np.bincount(codes[order], minlength=n_groups)
+    return np.split(order.astype(np.intp), np.cumsum(counts)[:-1])
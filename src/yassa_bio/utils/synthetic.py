@@ -0,0 +1,309 @@
+from __future__ import annotations
+import string
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+from pydantic import Field, NonNegativeFloat, PositiveFloat, model_validator
+
+from yassa_bio.core.model import SchemaModel
+from yassa_bio.core.typing import Fraction01
+from yassa_bio.core.enum import enum_examples
+from yassa_bio.evaluation.analysis.engine.model import _4pl, _5pl, _linear
+from yassa_bio.schema.analysis.enum import CurveModel
+from yassa_bio.schema.layout.batch import BatchData
+from yassa_bio.schema.layout.enum import PlateFormat, SampleType, QCLevel
+from yassa_bio.schema.layout.file import PlateReaderFile
+from yassa_bio.schema.layout.plate import PlateData, PlateLayout
+from yassa_bio.schema.layout.standard import StandardSeries
+from yassa_bio.schema.layout.well import WellTemplate
+from yassa_bio.utils.standard import series_concentration_map
+
+PLATE_SHAPES: dict[PlateFormat, tuple[int, int]] = {
+    PlateFormat.FMT_6: (2, 3),
+    PlateFormat.FMT_12: (3, 4),
+    PlateFormat.FMT_24: (4, 6),
+    PlateFormat.FMT_48: (6, 8),
+    PlateFormat.FMT_96: (8, 12),
+    PlateFormat.FMT_384: (16, 24),
+    PlateFormat.FMT_1536: (32, 48),
+    PlateFormat.FMT_3456: (48, 72),
+}
+
+_MODELS = {
+    CurveModel.FOUR_PL: _4pl,
+    CurveModel.FIVE_PL: _5pl,
+    CurveModel.LINEAR: _linear,
+}
+_N_PARAMS = {CurveModel.FOUR_PL: 4, CurveModel.FIVE_PL: 5, CurveModel.LINEAR: 2}
+_META = {
+    "Instrument": "yassa_bio synthetic",
+    "Read Time": "2025-01-01 00:00:00",
+    "User": "synthetic",
+    "Wavelength": "450 nm",
+    "Protocol": "synthetic LBA",
+}
+
+
+class SyntheticDesign(SchemaModel):
+    """
+    Plate design and ground-truth curve for synthetic reader exports.
+
+    Wells are filled row-major: calibration standards, blanks, QCs, then
+    samples (log-uniform between LLOQ and ULOQ) in every remaining well.
+    """
+
+    plate_format: PlateFormat = Field(
+        PlateFormat.FMT_96,
+        description="Well count of the plate.",
+        examples=enum_examples(PlateFormat),
+    )
+    model: CurveModel = Field(
+        CurveModel.FOUR_PL,
+        description="Ground-truth model mapping concentration to signal.",
+        examples=enum_examples(CurveModel),
+    )
+    params: List[float] = Field(
+        [0.05, 1.2, 120.0, 3.0],
+        description="True model parameters, in the order the model function takes.",
+    )
+    standards: StandardSeries = Field(
+        StandardSeries(
+            start_concentration=1000,
+            dilution_factor=2,
+            num_levels=8,
+            concentration_units="ng/mL",
+        ),
+        description="Calibration series placed on every plate.",
+    )
+    std_replicates: int = Field(2, ge=1, description="Wells per standard level.")
+    n_blanks: int = Field(2, ge=0, description="Number of blank wells.")
+    qc_levels: List[QCLevel] = Field(
+        [QCLevel.LOW, QCLevel.MID, QCLevel.HIGH],
+        description="QC levels placed on every plate.",
+        examples=enum_examples(QCLevel),
+    )
+    qc_replicates: int = Field(2, ge=1, description="Wells per QC level.")
+    noise_cv: NonNegativeFloat = Field(
+        0.03, description="Proportional (multiplicative) signal noise, as a fraction."
+    )
+    noise_sd: NonNegativeFloat = Field(
+        0.0, description="Additive signal noise in signal units."
+    )
+    outlier_fraction: float = Fraction01(
+        0.0, description="Fraction of wells whose signal is scaled by outlier_scale."
+    )
+    outlier_scale: PositiveFloat = Field(
+        3.0, description="Multiplier applied to outlier wells."
+    )
+
+    @model_validator(mode="after")
+    def _params_match_model(self):
+        if self.model not in _N_PARAMS:
+            raise ValueError(f"{self.model} is not a ground-truth model")
+        if len(self.params) != _N_PARAMS[self.model]:
+            raise ValueError(
+                f"{self.model} takes {_N_PARAMS[self.model]} params, "
+                f"got {len(self.params)}"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def _fixed_wells_fit_plate(self):
+        if self.n_fixed_wells > int(self.plate_format):
+            raise ValueError(
+                f"{self.n_fixed_wells} standard/blank/QC wells do not fit on a "
+                f"{int(self.plate_format)}-well plate"
+            )
+        return self
+
+    @property
+    def n_fixed_wells(self) -> int:
+        return (
+            self.standards.num_levels * self.std_replicates
+            + self.n_blanks
+            + len(self.qc_levels) * self.qc_replicates
+        )
+
+    def qc_concentration(self, level: QCLevel) -> float:
+        levels = series_concentration_map(self.standards).values()
+        lloq, uloq = min(levels), max(levels)
+        return {
+            QCLevel.LLOQ: lloq,
+            QCLevel.LOW: 3 * lloq,
+            QCLevel.MID: float(np.sqrt(lloq * uloq)),
+            QCLevel.HIGH: 0.75 * uloq,
+            QCLevel.ULOQ: uloq,
+        }[level]
+
+    def signal(self, concentration: np.ndarray) -> np.ndarray:
+        return _MODELS[self.model](concentration, *self.params)
+
+
+class SyntheticBatch(NamedTuple):
+    """
+    Written batch plus its ground truth, as (n_plates, n_wells) arrays in layout
+    well order: true concentration (0 for blanks) and the outlier mask.
+    """
+
+    batch: BatchData
+    concentration: np.ndarray
+    outlier: np.ndarray
+
+
+def row_label(i: int) -> str:
+    """0 → 'A', 25 → 'Z', 26 → 'AA', …"""
+    letters = string.ascii_uppercase
+    label = ""
+    i += 1
+    while i:
+        i, rem = divmod(i - 1, 26)
+        label = letters[rem] + label
+    return label
+
+
+def make_layout(design: SyntheticDesign) -> PlateLayout:
+    """
+    Layout for `design` with file coordinates matching `write_csv` / `write_excel`
+    (7 header lines, row labels in column 0).
+    """
+    n_rows, n_cols = PLATE_SHAPES[design.plate_format]
+    units = design.standards.concentration_units
+
+    roles: list[dict] = []
+    for lvl in range(1, design.standards.num_levels + 1):
+        roles += [
+            {"sample_type": SampleType.CALIBRATION_STANDARD, "level_idx": lvl}
+        ] * design.std_replicates
+    roles += [{"sample_type": SampleType.BLANK}] * design.n_blanks
+    for qc in design.qc_levels:
+        roles += [
+            {
+                "sample_type": SampleType.QUALITY_CONTROL,
+                "qc_level": qc,
+                "concentration": design.qc_concentration(qc),
+                "concentration_units": units,
+            }
+        ] * design.qc_replicates
+
+    wells = []
+    for i in range(n_rows * n_cols):
+        r, c = divmod(i, n_cols)
+        role = roles[i] if i < len(roles) else {"sample_type": SampleType.SAMPLE}
+        wells.append(
+            WellTemplate(
+                well=f"{row_label(r)}{c + 1}",
+                file_row=len(_META) + 2 + r,
+                file_col=1 + c,
+                **role,
+            )
+        )
+    return PlateLayout(
+        plate_format=design.plate_format, wells=wells, standards=design.standards
+    )
+
+
+def simulate(
+    design: SyntheticDesign,
+    layout: PlateLayout,
+    n_plates: int,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (signal, concentration, outlier) arrays of shape (n_plates, n_wells)."""
+    n_wells = len(layout.wells)
+    types = np.array([w.sample_type.value for w in layout.wells])
+    nominal = np.array(
+        [w.concentration if w.concentration is not None else 0.0 for w in layout.wells]
+    )
+
+    conc = np.broadcast_to(nominal, (n_plates, n_wells)).copy()
+    is_sample = types == SampleType.SAMPLE.value
+    levels = list(series_concentration_map(design.standards).values())
+    lo, hi = np.log(min(levels)), np.log(max(levels))
+    conc[:, is_sample] = np.exp(rng.uniform(lo, hi, (n_plates, int(is_sample.sum()))))
+
+    signal = design.signal(conc)
+    signal *= 1 + design.noise_cv * rng.standard_normal(signal.shape)
+    signal += design.noise_sd * rng.standard_normal(signal.shape)
+
+    outlier = rng.random(signal.shape) < design.outlier_fraction
+    signal[outlier] *= design.outlier_scale
+    return signal, conc, outlier
+
+
+def _header(n_cols: int) -> list[str]:
+    pad = "," * (n_cols - 1)
+    meta = [f"{k},{v}{pad}" for k, v in _META.items()]
+    return meta + ["," * n_cols, "Row," + ",".join(map(str, range(1, n_cols + 1)))]
+
+
+def write_csv(path: Path, signal: np.ndarray) -> None:
+    """Write one (n_rows, n_cols) plate as a reader-style CSV export."""
+    n_rows, n_cols = signal.shape
+    cells = np.char.mod("%.6g", signal)
+    body = [row_label(r) + "," + ",".join(cells[r].tolist()) for r in range(n_rows)]
+    path.write_text("\n".join(_header(n_cols) + body) + "\n")
+
+
+def write_excel(path: Path, signals: np.ndarray) -> None:
+    """Write (n_plates, n_rows, n_cols) plates as one sheet per plate."""
+    _, n_rows, n_cols = signals.shape
+    head = [line.split(",") for line in _header(n_cols)]
+    with pd.ExcelWriter(path, engine="openpyxl") as xls:
+        for i, plate in enumerate(signals):
+            rows = head + [[row_label(r), *plate[r].tolist()] for r in range(n_rows)]
+            pd.DataFrame(rows).to_excel(
+                xls, sheet_name=f"Plate{i + 1}", header=False, index=False
+            )
+
+
+def generate_batch(
+    design: SyntheticDesign,
+    out_dir: str | Path,
+    n_plates: int = 1,
+    *,
+    file_format: str = "csv",
+    seed: Optional[int] = None,
+    layout: Optional[PlateLayout] = None,
+) -> SyntheticBatch:
+    """
+    Simulate `n_plates` plates and write them as reader exports under `out_dir`.
+
+    CSV writes one file per plate. Excel writes a single workbook with one
+    sheet per plate. The returned batch references the written files. Pass a
+    `layout` from `make_layout(design)` to reuse it across calls.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    layout = layout or make_layout(design)
+    n_rows, n_cols = PLATE_SHAPES[design.plate_format]
+
+    rng = np.random.default_rng(seed)
+    signal, conc, outlier = simulate(design, layout, n_plates, rng)
+    grids = signal.reshape(n_plates, n_rows, n_cols)
+
+    plates = []
+    if file_format == "csv":
+        for i in range(n_plates):
+            path = out_dir / f"plate_{i:05d}.csv"
+            write_csv(path, grids[i])
+            plates.append(_plate(path, i, layout))
+    elif file_format == "excel":
+        path = out_dir / "plates.xlsx"
+        write_excel(path, grids)
+        for i in range(n_plates):
+            sheet = layout.model_copy(update={"sheet_index": i})
+            plates.append(_plate(path, i, sheet))
+    else:
+        raise ValueError(f"Unsupported file_format: {file_format!r}")
+
+    return SyntheticBatch(BatchData(plates=plates), conc, outlier)
+
+
+def _plate(path: Path, i: int, layout: PlateLayout) -> PlateData:
+    return PlateData(
+        source_file=PlateReaderFile(path=path, instrument="yassa_bio synthetic"),
+        plate_id=f"SYN-{i:05d}",
+        layout=layout,
+    )
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
@@ -167,3 +168,52 @@ class TestEvalCalibration:
         assert out["pass"] is False
         assert "missing_patterns" in out
         assert "calibration pattern" in out["error"]
+
+    def test_unresolved_back_calc_fails_level(self):
+        ctx = make_ctx(
+            concs=[1, 1, 2, 3, 4, 5, 6],
+            signals=[1, 1, 2, 3, 4, 5, 6],
+            sample_type=SampleType.CALIBRATION_STANDARD,
+            back_calc_fn=lambda y: np.where(np.asarray(y) == 2, np.nan, y),
+        )
+        spec = AnalyticalCalibrationSpec()
+
+        out = eval_calibration(ctx, spec)
+        assert out["failing_levels"] == [2]
+        assert np.isnan(out["per_level"][2]["acc_pct"])
+        assert out["per_level"][1] == {"acc_pct": 0.0, "pass": True}
+
+    def test_edge_tolerance_applies_to_lowest_and_highest_only(self):
+        def ctx_for(signals):
+            return make_ctx(
+                concs=[1, 2, 3, 4, 5, 6],
+                signals=signals,
+                sample_type=SampleType.CALIBRATION_STANDARD,
+                back_calc_fn=lambda y: y,
+            )
+
+        spec = AnalyticalCalibrationSpec()
+
+        ctx = ctx_for([1.22, 2, 3, 4, 5, 6 * 1.22])
+        assert eval_calibration(ctx, spec)["pass"] is True
+        ctx = ctx_for([1.22, 2, 3 * 1.22, 4, 5, 6 * 1.22])
+        assert eval_calibration(ctx, spec)["failing_levels"] == [3]
+
+    def test_reads_shared_back_calc_column(self):
+        calls = []
+        ctx = make_ctx(
+            concs=[1, 2, 3, 4, 5, 6],
+            signals=[1, 2, 3, 4, 5, 6],
+            sample_type=SampleType.CALIBRATION_STANDARD,
+            back_calc_fn=lambda y: calls.append(len(y)) or np.asarray(y),
+        )
+        spec = AnalyticalCalibrationSpec()
+
+        eval_calibration(ctx, spec)
+        eval_calibration(ctx, spec)
+        assert calls == [6]
+        np.testing.assert_array_equal(ctx.data["back_calc"], [1, 2, 3, 4, 5, 6])
+
+        ctx.curve_back = lambda y: np.asarray(y) * 2.0
+        assert eval_calibration(ctx, spec)["num_pass"] == 0
+        np.testing.assert_array_equal(ctx.data["back_calc"], [2, 4, 6, 8, 10, 12])
@@ -1,3 +1,5 @@
+import numpy as np
+import pytest
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
@@ -197,3 +199,99 @@ class TestEvalQC:
         out = eval_qc(ctx, spec)
         assert out["pass"] is False
         assert out["error"] is not None
+
+    def test_unresolved_back_calc_fails_well(self):
+        ctx = make_ctx(
+            concs=[10, 20, 30, 10, 20, 30],
+            signals=[10, 20, 30, 11, 20, 30],
+            sample_type=SampleType.QUALITY_CONTROL,
+            level_idx=None,
+            qc_levels=[QCLevel.LOW, QCLevel.MID, QCLevel.HIGH] * 2,
+            back_calc_fn=lambda y: np.where(np.asarray(y) == 11, np.nan, y),
+        )
+
+        out = eval_qc(ctx, AnalyticalQCSpec())
+        assert out["num_pass"] == 5
+        assert out["failing_wells"] == [3]
+        assert out["pass"] is True
+
+    def test_reports_every_level_present_in_level_order(self):
+        ctx = make_ctx(
+            concs=[10, 20, 30, 5, 50, 40, 50],
+            signals=[10, 20, 30, 5, 50, 80, 80],
+            sample_type=SampleType.QUALITY_CONTROL,
+            level_idx=None,
+            qc_levels=[QCLevel.LOW] * 7,
+            back_calc_fn=lambda y: y,
+        )
+        ctx.data["qc_level"] = ["high", "mid", "low", "lloq", "uloq", "dil", "dil"]
+
+        out = eval_qc(ctx, AnalyticalQCSpec())
+        assert list(out["per_level"]) == ["lloq", "low", "mid", "high", "uloq", "dil"]
+        dil = out["per_level"]["dil"]
+        assert (dil["n"], dil["num_pass"], dil["pass_frac"]) == (2, 0, 0.0)
+        assert dil["meets_level_fraction"] is False
+        assert out["per_level"]["lloq"]["num_pass"] == 1
+        assert out["failing_wells"] == [5, 6]
+        assert out["pass"] is False
+
+    def test_precision_and_total_error_per_level(self):
+        ctx = make_ctx(
+            concs=[10.0] * 3 + [100.0] * 3,
+            signals=[9.0, 10.0, 11.0, 108.0, 110.0, 112.0],
+            sample_type=SampleType.QUALITY_CONTROL,
+            level_idx=None,
+            qc_levels=[QCLevel.LOW] * 3 + [QCLevel.HIGH] * 3,
+            back_calc_fn=lambda y: y,
+        )
+        spec = AnalyticalQCSpec(
+            required_well_patterns=[], cv_tol_pct=5, total_error_tol_pct=11
+        )
+
+        out = eval_qc(ctx, spec)
+        low, high = out["per_level"]["low"], out["per_level"]["high"]
+        assert low["mean_bias_pct"] == pytest.approx(0.0)
+        assert low["cv_pct"] == pytest.approx(10.0)
+        assert high["mean_bias_pct"] == pytest.approx(10.0)
+        assert high["cv_pct"] == pytest.approx(2 / 110 * 100)
+        assert high["total_error_pct"] == pytest.approx(10 + 2 / 110 * 100)
+        assert (low["meets_precision"], high["meets_precision"]) == (False, True)
+        assert (low["meets_total_error"], high["meets_total_error"]) == (True, False)
+        assert out["num_pass"] == 6
+        assert out["pass"] is False
+
+    def test_edge_levels_and_disabled_checks(self):
+        ctx = make_ctx(
+            concs=[10.0] * 3,
+            signals=[8.0, 10.0, 12.0],
+            sample_type=SampleType.QUALITY_CONTROL,
+            level_idx=None,
+            qc_levels=[QCLevel.LLOQ] * 3,
+            back_calc_fn=lambda y: y,
+        )
+        edge = AnalyticalQCSpec(
+            required_well_patterns=[], cv_tol_pct=20, cv_tol_pct_edge=25
+        )
+        off = AnalyticalQCSpec(required_well_patterns=[])
+        strict = AnalyticalQCSpec(
+            required_well_patterns=[], cv_tol_pct=20, cv_tol_pct_edge=15
+        )
+
+        assert eval_qc(ctx, edge)["pass"] is True  # CV 20% <= 25% at LLOQ
+        assert eval_qc(ctx, off)["pass"] is True
+        assert eval_qc(ctx, strict)["per_level"]["lloq"]["meets_precision"] is False
+
+    def test_single_replicate_has_no_precision(self):
+        ctx = make_ctx(
+            concs=[10, 20, 30],
+            signals=[10, 20, 30],
+            sample_type=SampleType.QUALITY_CONTROL,
+            level_idx=None,
+            qc_levels=[QCLevel.LOW, QCLevel.MID, QCLevel.HIGH],
+            back_calc_fn=lambda y: y,
+        )
+
+        out = eval_qc(ctx, AnalyticalQCSpec(cv_tol_pct=20))
+        assert np.isnan(out["per_level"]["mid"]["cv_pct"])
+        assert out["per_level"]["mid"]["meets_precision"] is True
+        assert out["pass"] is True
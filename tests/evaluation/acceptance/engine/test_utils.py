@@ -9,7 +9,10 @@ from yassa_bio.evaluation.acceptance.engine.utils import (
     get_calibration_concentration_for_level,
     compute_relative_pct_scalar,
     compute_relative_pct_vectorized,
+    relative_pct,
+    back_calculate,
 )
+from yassa_bio.schema.analysis.config import LBAAnalysisConfig
 from yassa_bio.schema.acceptance.pattern import RequiredWellPattern
 from yassa_bio.schema.layout.enum import SampleType, QCLevel, CalibrationLevel
 
@@ -143,3 +146,77 @@ class TestComputeRelativePctVectorized:
         dens = np.array([0, None])
         result = compute_relative_pct_vectorized(nums, dens)
         assert result.tolist() == [None, None]
+
+
+class TestRelativePct:
+    def test_float_with_nan_for_invalid_denominator(self):
+        result = relative_pct(pd.Series([30, 0, 10, 5]), [60, 20, np.nan, 0])
+        assert result.dtype == np.float64
+        np.testing.assert_array_equal(result, [50.0, 0.0, np.nan, np.nan])
+
+    def test_object_denominator_with_none(self):
+        result = relative_pct(np.array([25, 50]), np.array([50, None]))
+        np.testing.assert_array_equal(result, [50.0, np.nan])
+
+    def test_masked_output(self):
+        result = relative_pct([50, 1, np.nan], [100, 0, 10], masked=True)
+        assert isinstance(result, np.ma.MaskedArray)
+        assert result.mask.tolist() == [False, True, True]
+        assert result.sum() == 50.0
+
+    def test_scalar_broadcast(self):
+        np.testing.assert_array_equal(relative_pct([1.0, 2.0], 4.0), [25.0, 50.0])
+
+
+class TestBackCalculate:
+    @staticmethod
+    def make_ctx(calls: list):
+        class Ctx:
+            data = pd.DataFrame({"y": [1.0, 2.0, 3.0, 4.0]})
+            analysis_config = LBAAnalysisConfig()
+            back_calc_curve = None
+
+            @staticmethod
+            def curve_back(y):
+                calls.append(len(y))
+                return np.asarray(y) * 10
+
+        return Ctx()
+
+    def test_row_positions_read_shared_column(self):
+        calls = []
+        ctx = self.make_ctx(calls)
+
+        rows = np.array([3, 1])
+        sub = ctx.data.iloc[rows]
+        np.testing.assert_array_equal(back_calculate(ctx, sub, rows), [40, 20])
+        everything = np.arange(4)
+        np.testing.assert_array_equal(
+            back_calculate(ctx, ctx.data, everything), [10, 20, 30, 40]
+        )
+        assert calls == [4]
+
+    def test_duplicate_labels_and_equal_y_use_positions(self):
+        calls = []
+        ctx = self.make_ctx(calls)
+        ctx.data = pd.DataFrame({"y": [2.0, 2.0, 3.0]}, index=[0, 0, 1])
+        ctx.curve_back = lambda y: calls.append(len(y)) or np.array([5.0, 6.0, 7.0])
+
+        rows = np.array([1, 2])
+        out = back_calculate(ctx, ctx.data.iloc[rows], rows)
+
+        np.testing.assert_array_equal(out, [6.0, 7.0])
+        assert calls == [3]
+
+    def test_rejects_positions_of_wrong_length(self):
+        ctx = self.make_ctx([])
+        with pytest.raises(ValueError, match="row positions"):
+            back_calculate(ctx, ctx.data, np.array([0]))
+
+    def test_foreign_frame_with_matching_labels_is_computed_directly(self):
+        calls = []
+        ctx = self.make_ctx(calls)
+        other = pd.DataFrame({"y": [100.0, 200.0]})
+
+        np.testing.assert_array_equal(back_calculate(ctx, other), [1000, 2000])
+        assert calls == [2]
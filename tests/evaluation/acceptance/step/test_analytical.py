@@ -6,6 +6,7 @@ from lilpipe.enums import PipelineSignal
 
 from yassa_bio.evaluation.acceptance.step.analytical import CheckRerun, Analytical
 from yassa_bio.evaluation.context import LBAContext
+from yassa_bio.evaluation.roles import role_index
 from yassa_bio.schema.analysis.config import LBAAnalysisConfig
 from yassa_bio.schema.acceptance.analytical.spec import (
     LBAAnalyticalAcceptanceCriteria,
@@ -102,6 +103,24 @@ class TestCheckRerun:
         assert out.dropped_cal_wells["concentration"].tolist() == [1]
         assert out.data["concentration"].tolist() == [2, 3]
         assert out.data.reset_index(drop=True).equals(out.data)
+        assert out.dropped_cal_levels == [1]
+        roles = role_index(out)
+        assert roles.n_rows == 2
+        assert roles.rows("calibration_standard").tolist() == [1]
+        assert roles.rows("sample").tolist() == [0]
+
+    def test_accumulates_drops_across_passes(self):
+        df = pd.DataFrame(
+            {"concentration": [1, 2, 3], "sample_type": "calibration_standard"}
+        )
+        ctx = make_ctx(df, {"pass": False, "can_refit": True, "failing_levels": [1]})
+        CheckRerun().run(ctx)
+        ctx.acceptance_results["calibration"]["failing_levels"] = [3]
+        out = CheckRerun().run(ctx)
+
+        assert out.dropped_cal_levels == [1, 3]
+        assert out.dropped_cal_wells["concentration"].tolist() == [1, 3]
+        assert out.data["concentration"].tolist() == [2]
 
     def test_handles_no_matching_rows(self):
         df = pd.DataFrame(
@@ -20,10 +20,13 @@ class TestBlankMean:
     def test_mean_one_value(self):
         assert _blank_mean(np.array([5.0]), np.array([True])) == 5.0
 
-    def test_mean_with_nans(self):
+    def test_mean_skips_nans(self):
         vals = np.array([np.nan, 2.0, 4.0])
         mask = np.array([True, True, False])
-        assert np.isnan(_blank_mean(vals, mask))
+        assert _blank_mean(vals, mask) == 2.0
+
+    def test_mean_all_nan_is_none(self):
+        assert _blank_mean(np.array([np.nan, np.inf]), np.array([True, True])) is None
 
     def test_mean_all_same(self):
         assert (
@@ -62,11 +65,37 @@ class TestBlankMin:
     def test_min_single(self):
         assert _blank_min(np.array([10.0]), np.array([True])) == 10.0
 
-    def test_min_with_nans(self):
+    def test_min_skips_nans(self):
         vals = np.array([np.nan, 1.0])
         mask = np.array([True, True])
-        result = _blank_min(vals, mask)
-        assert np.isnan(result) or result == 1.0
+        assert _blank_min(vals, mask) == 1.0
+
+
+class TestBlankGrouped:
+    def test_mean_per_group(self):
+        vals = np.array([1.0, 3.0, 9.0, 10.0, 20.0])
+        mask = np.array([True, True, False, True, False])
+        groups = np.array([0, 0, 0, 1, 1])
+        np.testing.assert_array_equal(_blank_mean(vals, mask, groups), [2.0, 10.0])
+
+    def test_median_and_min_per_group(self):
+        vals = np.array([1.0, 2.0, 9.0, 4.0, 6.0])
+        mask = np.ones(5, dtype=bool)
+        groups = np.array([0, 0, 0, 1, 1])
+        np.testing.assert_array_equal(_blank_median(vals, mask, groups), [2.0, 5.0])
+        np.testing.assert_array_equal(_blank_min(vals, mask, groups), [1.0, 4.0])
+
+    def test_group_without_blanks_is_nan(self):
+        vals = np.array([1.0, 5.0])
+        out = _blank_mean(vals, np.array([True, False]), np.array([0, 1]))
+        assert out[0] == 1.0 and np.isnan(out[1])
+
+    def test_nans_skipped_like_ungrouped(self):
+        vals = np.array([np.nan, 2.0, 4.0, np.nan])
+        mask = np.ones(4, dtype=bool)
+        groups = np.zeros(4, dtype=np.intp)
+        for fn in (_blank_mean, _blank_median, _blank_min):
+            assert fn(vals, mask, groups)[0] == fn(vals, mask)
 
 
 class TestBlankNone:
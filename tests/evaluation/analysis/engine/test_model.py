@@ -1,5 +1,6 @@
 import numpy as np
 import pytest
+from scipy.optimize import curve_fit
 
 from yassa_bio.evaluation.analysis.engine.model import (
     fit_4pl,
@@ -13,6 +14,7 @@ from yassa_bio.evaluation.analysis.engine.model import (
     _linear,
 )
 from yassa_bio.schema.analysis.enum import CurveModel
+from yassa_bio.schema.analysis.fit import SolverOptions
 
 
 rng = np.random.default_rng(42)
@@ -60,7 +62,9 @@ class TestModel:
         y = _noisy(f_true(x, *params_true))
         w = 1 / y
 
-        f_fit, params_est = FIT_FUNCS[model](x, y, weights=w)
+        res = FIT_FUNCS[model](x, y, weights=w)
+        assert res.ok
+        f_fit, params_est = res.fwd, res.params
 
         y_pred = f_fit(x)
         assert np.allclose(y_pred, y, rtol=0.05, atol=0.05)
@@ -72,9 +76,154 @@ class TestModel:
         x = np.array([0.0, 10.0])
         y = 3.0 * x + 7.0  # y = 3x + 7
 
-        f_fit, coef = fit_linear(x, y)
+        res = fit_linear(x, y)
+        f_fit, coef = res.fwd, res.params
         m, b = coef
+        assert res.ok
 
         assert pytest.approx(m, rel=1e-12) == 3.0
         assert pytest.approx(b, rel=1e-12) == 7.0
         assert np.allclose(f_fit(x), y)
+
+
+class TestSolverOptions:
+    x = np.linspace(1, 100, 40)
+
+    @pytest.mark.parametrize(
+        "solver",
+        [
+            SolverOptions(method="lm", bounded=False),
+            SolverOptions(method="dogbox"),
+            SolverOptions(loss="soft_l1", f_scale=0.1),
+            SolverOptions(bounded=False),
+        ],
+    )
+    def test_fits_with_solver_settings(self, solver):
+        params = SYNTH_PARAMS[CurveModel.FOUR_PL]
+        y = _4pl(self.x, *params)
+
+        res = fit_4pl(self.x, y, weights=np.ones_like(y), solver=solver)
+
+        assert res.ok
+        np.testing.assert_allclose(res.fwd(self.x), y, atol=1e-3)
+
+    def test_robust_loss_resists_an_outlier(self):
+        params = SYNTH_PARAMS[CurveModel.FOUR_PL]
+        y = _4pl(self.x, *params)
+        y[5] *= 3
+        w = np.ones_like(y)
+
+        plain = fit_4pl(self.x, y, weights=w)
+        robust = fit_4pl(
+            self.x, y, weights=w, solver=SolverOptions(loss="cauchy", f_scale=0.01)
+        )
+
+        err = np.abs(robust.params - params).max()
+        assert err < np.abs(plain.params - params).max()
+        assert err < 0.05
+
+    def test_bounded_fit_keeps_slope_positive_for_falling_curve(self):
+        y = _4pl(self.x, 0.1, 1.2, 50.0, 1.5)  # competitive: signal falls
+
+        res = fit_4pl(self.x, y, weights=np.ones_like(y))
+
+        assert res.ok
+        assert res.params[1] > 0
+        np.testing.assert_allclose(back_4pl(y[10:30], res.params), self.x[10:30])
+
+    @pytest.mark.parametrize("method", ["trf", "lm"])
+    def test_non_convergence_is_reported_not_raised(self, method):
+        y = _4pl(self.x, *SYNTH_PARAMS[CurveModel.FOUR_PL])
+        solver = SolverOptions(method=method, bounded=method != "lm", max_nfev=2)
+
+        res = fit_4pl(self.x, y, weights=np.ones_like(y), solver=solver)
+
+        assert not res.ok
+        assert res.fwd is None and res.params is None
+        assert "RuntimeError" in res.message
+
+    def test_degenerate_input_is_reported(self):
+        res = fit_5pl(np.ones(3), np.array([1.0, np.nan, 2.0]), weights=np.ones(3))
+
+        assert not res.ok
+        assert res.message
+
+    def test_too_few_points_is_reported(self):
+        res = fit_4pl(np.array([1.0, 2.0]), np.array([1.0, 2.0]), np.ones(2))
+
+        assert not res.ok
+        assert res.message == "2 points for 4 parameters"
+
+
+class TestDiagnostics:
+    x = np.linspace(1, 100, 40)
+
+    def test_4pl_matches_an_independent_recomputation(self):
+        local = np.random.default_rng(0)
+        params = SYNTH_PARAMS[CurveModel.FOUR_PL]
+        y = _4pl(self.x, *params) * (1 + 0.02 * local.standard_normal(self.x.size))
+        w = 1 / y
+
+        res = fit_4pl(self.x, y, weights=w)
+        d = res.diagnostics
+
+        resid = np.sqrt(w) * (y - res.fwd(self.x))
+        np.testing.assert_allclose(d.residuals, resid, atol=1e-10)
+        ybar = np.average(y, weights=w)
+        r2 = 1 - resid @ resid / (w @ (y - ybar) ** 2)
+        assert d.r_squared == pytest.approx(r2)
+        assert d.aic == pytest.approx(40 * np.log(resid @ resid / 40) + 8)
+        assert d.bic == pytest.approx(40 * np.log(resid @ resid / 40) + 4 * np.log(40))
+
+        _, pcov = curve_fit(
+            _4pl, self.x, y, p0=res.params, sigma=1 / np.sqrt(w), absolute_sigma=False
+        )
+        np.testing.assert_allclose(d.std_errors, np.sqrt(np.diag(pcov)), rtol=0.05)
+        assert d.covariance.shape == (4, 4)
+        assert d.nfev > 0
+        assert d.solver_message
+
+    def test_linear_closed_form(self):
+        y = 2.0 * self.x + 5.0 + np.where(np.arange(40) % 2, 0.1, -0.1)
+
+        res = fit_linear(self.x, y)
+        d = res.diagnostics
+
+        A = np.vstack([self.x, np.ones_like(self.x)]).T
+        _, cov = np.polyfit(self.x, y, 1, cov=True)
+        np.testing.assert_allclose(d.covariance, cov)
+        np.testing.assert_allclose(d.residuals, y - A @ res.params, atol=1e-12)
+        assert 0.999 < d.r_squared < 1.0
+        assert d.nfev is None
+
+    @pytest.mark.parametrize(
+        "model, noise",
+        [(CurveModel.FOUR_PL, 0.01), (CurveModel.LINEAR, 0.5)],
+    )
+    def test_std_errors_match_monte_carlo(self, model, noise):
+        local = np.random.default_rng(3)
+        params = SYNTH_PARAMS[model]
+        truth = FWD_FUNCS[model](self.x, *params)
+        fits, ses = [], []
+        for _ in range(200):
+            y = truth + noise * local.standard_normal(self.x.size)
+            res = FIT_FUNCS[model](self.x, y, weights=np.full(self.x.size, 4.0))
+            fits.append(res.params)
+            ses.append(res.diagnostics.std_errors)
+
+        np.testing.assert_allclose(
+            np.mean(ses, axis=0), np.std(fits, axis=0, ddof=1), rtol=0.25
+        )
+
+    def test_aic_prefers_the_true_model(self):
+        y = _4pl(self.x, *SYNTH_PARAMS[CurveModel.FOUR_PL])
+        w = np.ones_like(y)
+        y = y + 0.001 * np.sin(self.x)
+
+        assert fit_4pl(self.x, y, w).diagnostics.aic < (
+            fit_linear(self.x, y, w).diagnostics.aic
+        )
+
+    def test_failed_fit_has_no_diagnostics(self):
+        res = fit_4pl(np.array([1.0, 2.0]), np.array([1.0, 2.0]), np.ones(2))
+        assert res.diagnostics is None
@@ -1,99 +1,130 @@
-import pandas as pd
+import numpy as np
 
 from yassa_bio.evaluation.analysis.engine.normalize import (
     _norm_span,
     _norm_max,
+    _norm_percent_max,
+    _norm_b_b0,
     _norm_none,
 )
 
+ALL = np.ones(3, dtype=bool)
+NONE = np.zeros(3, dtype=bool)
+
 
 class TestNormSpan:
     def test_span_typical(self):
-        df = pd.DataFrame(
-            {
-                "sample_type": ["calibration_standard"] * 3,
-                "concentration": [10, 20, 30],
-                "signal": [15, 25, 35],
-            }
-        )
-        normalized, span = _norm_span(df)
-        expected = (df["signal"] - 10) / 20
-        pd.testing.assert_series_equal(normalized, expected)
+        signal = np.array([15.0, 25.0, 35.0])
+        normalized, span = _norm_span(signal, np.array([10.0, 20.0, 30.0]), ALL, NONE)
+        np.testing.assert_allclose(normalized, (signal - 10) / 20)
         assert span == 20
 
     def test_span_empty_calibration(self):
-        df = pd.DataFrame(
-            {
-                "sample_type": ["sample"] * 3,
-                "concentration": [0, 0, 0],
-                "signal": [1, 2, 3],
-            }
-        )
-        normalized, span = _norm_span(df)
-        pd.testing.assert_series_equal(normalized, df["signal"])
+        signal = np.array([1.0, 2.0, 3.0])
+        normalized, span = _norm_span(signal, np.zeros(3), NONE, NONE)
+        np.testing.assert_array_equal(normalized, signal)
         assert span is None
 
     def test_span_zero_span(self):
-        df = pd.DataFrame(
-            {
-                "sample_type": ["calibration_standard"] * 3,
-                "concentration": [5, 5, 5],
-                "signal": [2, 3, 4],
-            }
-        )
-        normalized, span = _norm_span(df)
-        pd.testing.assert_series_equal(normalized, df["signal"])
+        signal = np.array([2.0, 3.0, 4.0])
+        normalized, span = _norm_span(signal, np.full(3, 5.0), ALL, NONE)
+        np.testing.assert_array_equal(normalized, signal)
         assert span is None
 
+    def test_span_ignores_nan_concentration(self):
+        signal = np.array([0.0, 5.0, 10.0])
+        conc = np.array([0.0, np.nan, 10.0])
+        normalized, span = _norm_span(signal, conc, ALL, NONE)
+        np.testing.assert_allclose(normalized, [0.0, 0.5, 1.0])
+        assert span == 10
+
 
 class TestNormMax:
     def test_max_typical(self):
-        df = pd.DataFrame(
-            {
-                "sample_type": ["calibration_standard"] * 3,
-                "concentration": [5, 10, 20],
-                "signal": [1, 2, 3],
-            }
-        )
-        normalized, maxv = _norm_max(df)
-        expected = df["signal"] / 20
-        pd.testing.assert_series_equal(normalized, expected)
+        signal = np.array([1.0, 2.0, 3.0])
+        normalized, maxv = _norm_max(signal, np.array([5.0, 10.0, 20.0]), ALL, NONE)
+        np.testing.assert_allclose(normalized, signal / 20)
         assert maxv == 20
 
     def test_max_empty_calibration(self):
-        df = pd.DataFrame(
-            {
-                "sample_type": ["sample"] * 3,
-                "concentration": [1, 2, 3],
-                "signal": [4, 5, 6],
-            }
-        )
-        normalized, maxv = _norm_max(df)
-        pd.testing.assert_series_equal(normalized, df["signal"])
+        signal = np.array([4.0, 5.0, 6.0])
+        normalized, maxv = _norm_max(signal, np.array([1.0, 2.0, 3.0]), NONE, NONE)
+        np.testing.assert_array_equal(normalized, signal)
         assert maxv is None
 
     def test_max_zero(self):
-        df = pd.DataFrame(
-            {
-                "sample_type": ["calibration_standard"] * 3,
-                "concentration": [0, 0, 0],
-                "signal": [4, 5, 6],
-            }
-        )
-        normalized, maxv = _norm_max(df)
-        pd.testing.assert_series_equal(normalized, df["signal"])
+        signal = np.array([4.0, 5.0, 6.0])
+        normalized, maxv = _norm_max(signal, np.zeros(3), ALL, NONE)
+        np.testing.assert_array_equal(normalized, signal)
         assert maxv is None
 
 
+class TestNormPercentMax:
+    def test_percent_of_top_standard(self):
+        signal = np.array([0.5, 2.0, 1.0])
+        cal = np.array([True, True, False])
+        normalized, maxv = _norm_percent_max(signal, np.zeros(3), cal, NONE)
+        np.testing.assert_allclose(normalized, [25.0, 100.0, 50.0])
+        assert maxv == 2.0
+
+    def test_no_standards_keeps_signal(self):
+        signal = np.array([1.0, 2.0, 3.0])
+        normalized, maxv = _norm_percent_max(signal, np.zeros(3), NONE, NONE)
+        np.testing.assert_array_equal(normalized, signal)
+        assert maxv is None
+
+
+class TestNormBB0:
+    def test_divides_by_mean_zero_standard(self):
+        signal = np.array([2.0, 4.0, 1.5])
+        zero = np.array([True, True, False])
+        normalized, b0 = _norm_b_b0(signal, np.zeros(3), NONE, zero)
+        np.testing.assert_allclose(normalized, [2 / 3, 4 / 3, 0.5])
+        assert b0 == 3.0
+
+    def test_no_zero_standard_keeps_signal(self):
+        signal = np.array([1.0, 2.0, 3.0])
+        normalized, b0 = _norm_b_b0(signal, np.zeros(3), ALL, NONE)
+        np.testing.assert_array_equal(normalized, signal)
+        assert b0 is None
+
+
+class TestGrouped:
+    def test_b_b0_per_group(self):
+        signal = np.array([4.0, 2.0, 10.0, 5.0])
+        zero = np.array([True, False, True, False])
+        groups = np.array([0, 0, 1, 1])
+        normalized, b0 = _norm_b_b0(signal, np.zeros(4), ~zero, zero, groups=groups)
+        np.testing.assert_allclose(normalized, [1.0, 0.5, 1.0, 0.5])
+        np.testing.assert_array_equal(b0, [4.0, 10.0])
+
+    def test_group_without_reference_keeps_signal(self):
+        signal = np.array([4.0, 2.0, 7.0])
+        zero = np.array([True, False, False])
+        groups = np.array([0, 0, 1])
+        normalized, b0 = _norm_b_b0(signal, np.zeros(3), zero, zero, groups=groups)
+        np.testing.assert_allclose(normalized, [1.0, 0.5, 7.0])
+        assert np.isnan(b0[1])
+
+    def test_missing_group_key_keeps_signal(self):
+        signal = np.array([1.0, 2.0, 4.0])
+        cal = np.array([True, True, False])
+        groups = np.array([0, 0, -1])
+        normalized, maxv = _norm_percent_max(signal, np.zeros(3), cal, cal, groups)
+        np.testing.assert_allclose(normalized, [50.0, 100.0, 4.0])
+        np.testing.assert_array_equal(maxv, [2.0])
+
+    def test_span_per_group(self):
+        conc = np.array([0.0, 10.0, 0.0, 20.0])
+        groups = np.array([0, 0, 1, 1])
+        normalized, span = _norm_span(conc, conc, np.ones(4, bool), NONE, groups)
+        np.testing.assert_allclose(normalized, [0.0, 1.0, 0.0, 1.0])
+        np.testing.assert_array_equal(span, [10.0, 20.0])
+
+
 class TestNormNone:
     def test_none_passthrough(self):
-        df = pd.DataFrame(
-            {
-                "sample_type": ["sample"] * 3,
-                "concentration": [0, 0, 0],
-                "signal": [7, 8, 9],
-            }
-        )
-        normalized, flag = _norm_none(df)
-        pd.testing.assert_series_equal(normalized, df["signal"])
+        signal = np.array([7.0, 8.0, 9.0])
+        normalized, flag = _norm_none(signal, np.zeros(3), NONE, NONE)
+        np.testing.assert_array_equal(normalized, signal)
         assert flag is None
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+# Importing the model module registers the curve_model plug-ins.
+import yassa_bio.evaluation.analysis.engine.model  # noqa: F401
+from yassa_bio.evaluation.analysis.engine.model import _4pl, _linear
+from yassa_bio.evaluation.analysis.engine.select import lack_of_fit_p, select_model
+from yassa_bio.schema.analysis.enum import CurveModel, SelectionCriterion
+from yassa_bio.schema.analysis.fit import ModelSelection
+
+
+X = np.repeat(np.arange(1.0, 9.0), 3)
+NOISE = np.random.default_rng(7).normal(scale=0.01, size=X.size)
+
+
+def _sigmoid() -> np.ndarray:
+    return _4pl(X, 0.1, 4.0, 4.0, 1.5) + NOISE
+
+
+class TestLackOfFit:
+    def test_straight_line_through_sigmoid_fails(self):
+        y = _sigmoid()
+        A = np.vstack([X, np.ones_like(X)]).T
+        resid = y - A @ np.linalg.lstsq(A, y, rcond=None)[0]
+        assert lack_of_fit_p(resid, y, X, 2) < 0.001
+
+    def test_true_model_passes(self):
+        y = _linear(X, 2.0, 1.0) + NOISE
+        A = np.vstack([X, np.ones_like(X)]).T
+        resid = y - A @ np.linalg.lstsq(A, y, rcond=None)[0]
+        assert lack_of_fit_p(resid, y, X, 2) > 0.05
+
+    def test_without_replicates_is_nan(self):
+        x = np.arange(5.0)
+        assert np.isnan(lack_of_fit_p(np.zeros(5), x, x, 2))
+
+
+class TestSelectModel:
+    def test_rejects_line_for_sigmoid(self):
+        sel = select_model(X, _sigmoid(), np.ones_like(X), ModelSelection())
+
+        assert sel.model in {CurveModel.FOUR_PL, CurveModel.FIVE_PL}
+        assert sel.result.ok
+        cands = sel.comparison["candidates"]
+        assert set(cands) == {"4PL", "5PL", "linear"}
+        assert cands["linear"]["lack_of_fit_pass"] is False
+        assert cands["4PL"]["score"] == pytest.approx(cands["4PL"]["aic"])
+        assert sel.comparison["selected"] == sel.model.value
+
+    def test_bic_prefers_fewer_parameters(self):
+        sel = select_model(
+            X,
+            _sigmoid(),
+            np.ones_like(X),
+            ModelSelection(criterion=SelectionCriterion.BIC),
+        )
+        assert sel.model is CurveModel.FOUR_PL
+
+    def test_picks_linear_for_line(self):
+        y = _linear(X, 2.0, 1.0) + NOISE
+        sel = select_model(
+            X,
+            y,
+            np.ones_like(X),
+            ModelSelection(criterion=SelectionCriterion.BIC),
+        )
+
+        assert sel.model is CurveModel.LINEAR
+        np.testing.assert_allclose(sel.result.params, [2.0, 1.0], atol=0.02)
+
+    def test_parallel_matches_serial(self):
+        y = _sigmoid()
+        serial = select_model(X, y, np.ones_like(X), ModelSelection())
+        threaded = select_model(X, y, np.ones_like(X), ModelSelection(max_workers=3))
+
+        assert threaded.model is serial.model
+        np.testing.assert_allclose(threaded.result.params, serial.result.params)
+
+    def test_all_failures(self):
+        x = np.array([0.0, 1.0])
+        sel = select_model(
+            x,
+            x,
+            np.ones(2),
+            ModelSelection(candidates=[CurveModel.FOUR_PL, CurveModel.FIVE_PL]),
+        )
+
+        assert sel.model is None
+        assert not sel.result.ok
+        assert "4PL" in sel.result.message
+        assert sel.comparison["selected"] is None
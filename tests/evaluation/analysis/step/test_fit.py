@@ -5,12 +5,14 @@ from datetime import datetime
 from pathlib import Path
 import tempfile
 
+from yassa_bio.evaluation.analysis.engine.model import Curve
 from yassa_bio.evaluation.analysis.step.fit import (
     SelectCalibrationData,
     ApplyTransforms,
     ComputeWeights,
     FitCalibrationData,
     CurveFit,
+    GroupedCurve,
 )
 from yassa_bio.evaluation.analysis.step.preprocess import LoadData
 from yassa_bio.schema.analysis.enum import Transformation, Weighting, CurveModel
@@ -31,6 +33,7 @@ def make_ctx(
     transformation_y: Transformation = Transformation.IDENTITY,
     weighting: Weighting = Weighting.ONE,
     model: CurveModel = CurveModel.LINEAR,
+    fit_by: str | None = None,
 ) -> LBAContext:
     cfg = LBAAnalysisConfig(
         preprocess={},
@@ -39,6 +42,7 @@ def make_ctx(
             "transformation_y": transformation_y,
             "weighting": weighting,
             "model": model,
+            "fit_by": fit_by,
         },
     )
     with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as tmp:
@@ -160,6 +164,9 @@ class TestFitCalibrationData:
         assert callable(ctx.curve_fwd)
         assert callable(ctx.curve_back)
         assert isinstance(ctx.curve_params, np.ndarray)
+        diag = ctx.fit_diagnostics["batch"]
+        assert diag.r_squared == pytest.approx(1.0)
+        assert diag.residuals.shape == (2,)
 
         assert np.isclose(
             ctx.curve_fwd(ctx.calib_df["x"][0]),
@@ -171,6 +178,159 @@ class TestFitCalibrationData:
             ctx.calib_df["x"][1],
             atol=1e-6,  # transformed
         )
+        assert isinstance(ctx.curve_back, Curve)
+        np.testing.assert_allclose(
+            ctx.curve_back([4.0], ["ignored"]), ctx.curve_back([4.0])
+        )
+
+
+class TestFitByGroup:
+    def test_fits_one_curve_per_group(self):
+        df = pd.DataFrame(
+            {
+                "signal": [2.0, 4.0, 3.0, 6.0],
+                "concentration": [1.0, 2.0, 1.0, 2.0],
+                "sample_type": ["calibration_standard"] * 4,
+                "run": ["R1", "R1", "R2", "R2"],
+            }
+        )
+        ctx = LoadData().run(
+            make_ctx(df, transformation_x=Transformation.IDENTITY, fit_by="run")
+        )
+        ctx = CurveFit().run(ctx)
+
+        assert ctx.curve_params is None
+        assert list(ctx.fit_diagnostics) == ["R1", "R2"]
+        assert ctx.fit_diagnostics["R2"].r_squared == pytest.approx(1.0)
+        np.testing.assert_allclose(
+            ctx.curve_params_by_group["R1"], [2.0, 0.0], atol=1e-9
+        )
+        np.testing.assert_allclose(
+            ctx.curve_params_by_group["R2"], [3.0, 0.0], atol=1e-9
+        )
+        np.testing.assert_allclose(
+            ctx.curve_back([4.0, 6.0, 6.0], ["R1", "R2", "R9"]), [2.0, 2.0, np.nan]
+        )
+        np.testing.assert_allclose(ctx.curve_fwd([1.0, 1.0], ["R2", "R1"]), [3, 2])
+        with pytest.raises(ValueError, match="fitted per group"):
+            ctx.curve_back([4.0])
+
+    def test_unknown_column_raises(self):
+        df = pd.DataFrame(
+            {
+                "signal": [2.0, 4.0],
+                "concentration": [1.0, 2.0],
+                "sample_type": ["calibration_standard"] * 2,
+            }
+        )
+        ctx = LoadData().run(make_ctx(df, fit_by="nope"))
+        with pytest.raises(ValueError, match="fit_by"):
+            CurveFit().run(ctx)
+
+
+class TestFitFailure:
+    def test_batch_fit_failure_is_recorded(self):
+        df = pd.DataFrame(
+            {
+                "signal": [2.0, 4.0],
+                "concentration": [1.0, 2.0],
+                "sample_type": ["calibration_standard"] * 2,
+            }
+        )
+        ctx = LoadData().run(make_ctx(df, model=CurveModel.FOUR_PL))
+        ctx = CurveFit().run(ctx)
+
+        assert set(ctx.fit_failures) == {"batch"}
+        assert ctx.fit_diagnostics == {}
+        assert ctx.curve_params is None
+        assert np.isnan(ctx.curve_back(np.array([3.0]))).all()
+
+    def test_failed_group_does_not_stop_the_others(self):
+        x = [1.0, 2.0, 4.0, 8.0, 16.0, 32.0]
+        df = pd.DataFrame(
+            {
+                "signal": [1.0, 2.0, 3.5, 5.0, 6.0, 6.5, 1.0, 2.0],
+                "concentration": x + [1.0, 2.0],
+                "sample_type": ["calibration_standard"] * 8,
+                "run": ["R1"] * 6 + ["R2"] * 2,
+            }
+        )
+        ctx = LoadData().run(
+            make_ctx(
+                df,
+                transformation_x=Transformation.IDENTITY,
+                model=CurveModel.FOUR_PL,
+                fit_by="run",
+            )
+        )
+        ctx = CurveFit().run(ctx)
+
+        assert list(ctx.fit_failures) == ["R2"]
+        assert list(ctx.curve_params_by_group) == ["R1"]
+        back = ctx.curve_back([3.5, 1.0], ["R1", "R2"])
+        assert back[0] == pytest.approx(4.0, rel=0.05)
+        assert np.isnan(back[1])
+
+
+class TestAutoModel:
+    @staticmethod
+    def _frame(signal, run=None) -> pd.DataFrame:
+        conc = np.repeat([1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0, 128.0], 2)
+        signal = np.asarray(signal, dtype=float)
+        conc = np.tile(conc, len(signal) // len(conc))
+        df = pd.DataFrame(
+            {
+                "signal": signal,
+                "concentration": conc,
+                "sample_type": ["calibration_standard"] * len(signal),
+            }
+        )
+        if run is not None:
+            df["run"] = run
+        return df
+
+    def test_selects_and_back_calculates_with_chosen_model(self):
+        x = np.log10(np.repeat([1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0, 128.0], 2))
+        noise = np.tile([0.005, -0.005], 8)
+        df = self._frame(2.0 * x + 1.0 + noise)
+        ctx = LoadData().run(make_ctx(df, model=CurveModel.AUTO))
+        ctx = CurveFit().run(ctx)
+
+        sel = ctx.model_selection["batch"]
+        assert sel["selected"] == "linear"
+        assert set(sel["candidates"]) == {"4PL", "5PL", "linear"}
+        assert len(ctx.curve_params) == 2
+        np.testing.assert_allclose(ctx.curve_back([2.0 * x[4] + 1.0]), [x[4]])
+
+    def test_selects_per_group(self):
+        x = np.log10(np.repeat([1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0, 128.0], 2))
+        noise = np.tile([0.005, -0.005], 8)
+        line = 2.0 * x + 1.0 + noise
+        sigmoid = 0.1 + 1.4 / (1 + (10**x / 20.0) ** -1.5) + noise
+        df = self._frame(np.concatenate([line, sigmoid]), run=["R1"] * 16 + ["R2"] * 16)
+        ctx = LoadData().run(make_ctx(df, model=CurveModel.AUTO, fit_by="run"))
+        ctx = CurveFit().run(ctx)
+
+        assert ctx.model_selection["R1"]["selected"] == "linear"
+        assert ctx.model_selection["R2"]["selected"] in {"4PL", "5PL"}
+        assert len(ctx.curve_params_by_group["R1"]) == 2
+        back = ctx.curve_back([line[6], sigmoid[6]], ["R1", "R2"])
+        np.testing.assert_allclose(back, [x[6], x[6]], atol=0.02)
+
+    def test_fixed_model_records_no_selection(self):
+        df = self._frame(np.arange(16.0))
+        ctx = CurveFit().run(LoadData().run(make_ctx(df)))
+        assert ctx.model_selection == {}
+
+
+class TestGroupedCurve:
+    def test_dispatches_categorical_groups(self):
+        curve = GroupedCurve({"A": lambda v: v + 1, "B": lambda v: v * 10})
+        groups = pd.Series(["B", "A", None, "B"], dtype="category")
+
+        out = curve(np.array([1.0, 2.0, 3.0, 4.0]), groups)
+
+        np.testing.assert_allclose(out, [10.0, 3.0, np.nan, 40.0])
 
 
 class TestCurveFit:
@@ -58,14 +58,18 @@ def make_ctx(
     df: pd.DataFrame,
     *,
     blank_rule: BlankRule = BlankRule.MEAN,
+    blank_by: str | None = None,
     norm_rule: NormRule = NormRule.SPAN,
+    norm_by: str | None = None,
     outlier_rule: OutlierRule = OutlierRule.ZSCORE,
     z_threshold: float = 1.0,
 ) -> LBAContext:
     """Creates LBAContext with configurable preprocessing rules and df."""
     preprocess_cfg = {
         "blank_rule": blank_rule,
+        "blank_by": blank_by,
         "norm_rule": norm_rule,
+        "norm_by": norm_by,
         "outliers": {
             "rule": outlier_rule,
             "z_threshold": z_threshold,
@@ -73,8 +77,16 @@ def make_ctx(
     }
 
     cfg = LBAAnalysisConfig(preprocess=preprocess_cfg)
-    plate = make_plate(df)
-    batch = BatchData(plates=[plate])
+    if "plate_id" in df:
+        # One plate per distinct plate_id so the batch frame keeps the split.
+        plates = []
+        for plate_id, sub in df.groupby("plate_id", sort=False):
+            plate = make_plate(sub.drop(columns="plate_id"))
+            plate.plate_id = plate_id
+            plates.append(plate)
+        batch = BatchData(plates=plates)
+    else:
+        batch = BatchData(plates=[make_plate(df)])
 
     return LBAContext(
         batch_data=batch,
@@ -93,7 +105,10 @@ class TestLoadData:
         ctx = make_ctx(df)
         ctx = LoadData().run(ctx)
 
-        assert ctx.data.equals(df)
+        assert ctx.data[df.columns].equals(df)
+        assert ctx.data["plate_id"].tolist() == ["P1"]
+        assert isinstance(ctx.data["plate_id"].dtype, pd.CategoricalDtype)
+        assert isinstance(ctx.data["source_file"].dtype, pd.CategoricalDtype)
 
     def test_load_data_missing_df_attr(self):
         df = pd.DataFrame({"signal": [1], "concentration": [1]})
@@ -187,6 +202,26 @@ class TestExcludeData:
         assert len(out.data) == 2
         assert len(out.excluded_data) == 0
 
+    def test_builds_role_index_and_redrops_dropped_levels(self):
+        df = pd.DataFrame(
+            {
+                "signal": [1.0, 2.0, 3.0, 4.0],
+                "concentration": [1.0, 2.0, 1.0, 2.0],
+                "sample_type": ["calibration_standard"] * 3 + ["quality_control"],
+                "exclude": [False, False, True, False],
+            }
+        )
+
+        ctx = LoadData().run(make_ctx(df))
+        ctx.dropped_cal_levels = [2.0]
+        out = ExcludeData().run(ctx)
+
+        assert out.data["signal"].tolist() == [1.0, 4.0]
+        assert len(out.excluded_data) == 1
+        assert out.role_index.n_rows == 2
+        assert out.role_index.rows("calibration_standard").tolist() == [0]
+        assert out.role_index.rows("quality_control").tolist() == [1]
+
 
 class TestSubtractBlank:
     def test_subtracts_mean_blank(self):
@@ -236,6 +271,43 @@ class TestSubtractBlank:
         assert np.isclose(out.blank_used, 5.0)
         assert np.isclose(out.data.loc[2, "signal"], 5.0)
 
+    def test_subtracts_blank_per_plate(self):
+        df = pd.DataFrame(
+            {
+                "signal": [1.0, 3.0, 10.0, 5.0, 15.0, 7.0],
+                "concentration": [np.nan] * 6,
+                "sample_type": [
+                    SampleType.BLANK,
+                    SampleType.BLANK,
+                    "sample",
+                    SampleType.BLANK,
+                    "sample",
+                    "sample",
+                ],
+                "plate_id": ["P1", "P1", "P1", "P2", "P2", "P3"],
+                "exclude": False,
+            }
+        )
+        ctx = LoadData().run(make_ctx(df, blank_by="plate_id"))
+        out = SubtractBlank().run(ctx)
+
+        assert out.data["signal"].tolist() == [-1.0, 1.0, 8.0, 0.0, 10.0, 7.0]
+        assert out.blank_values == {"P1": 2.0, "P2": 5.0}
+        assert out.blank_used is None
+
+    def test_unknown_blank_by_column_raises(self):
+        df = pd.DataFrame(
+            {
+                "signal": [1.0],
+                "concentration": [1],
+                "sample_type": [SampleType.BLANK],
+                "exclude": False,
+            }
+        )
+        ctx = LoadData().run(make_ctx(df, blank_by="nope"))
+        with pytest.raises(ValueError, match="blank_by"):
+            SubtractBlank().run(ctx)
+
 
 class TestNormalizeSignal:
     def test_span_normalises_and_sets_span(self):
@@ -329,6 +401,84 @@ class TestNormalizeSignal:
         assert out.data["signal"].tolist() == [6.0, 9.0]
         assert out.norm_span is None
 
+    def test_percent_max_uses_top_standard_signal(self):
+        df = pd.DataFrame(
+            {
+                "signal": [1.0, 4.0, 2.0],
+                "concentration": [5, 10, np.nan],
+                "sample_type": [
+                    SampleType.CALIBRATION_STANDARD,
+                    SampleType.CALIBRATION_STANDARD,
+                    "sample",
+                ],
+                "exclude": False,
+            }
+        )
+
+        ctx = LoadData().run(make_ctx(df, norm_rule=NormRule.PERCENT_MAX))
+        out = NormalizeSignal().run(ctx)
+
+        assert out.data["signal"].tolist() == [25.0, 100.0, 50.0]
+        assert out.norm_span == 4.0
+
+    def test_b_b0_divides_by_zero_standard(self):
+        df = pd.DataFrame(
+            {
+                "signal": [8.0, 12.0, 5.0],
+                "concentration": [0, 0, np.nan],
+                "sample_type": [
+                    SampleType.ZERO_STANDARD,
+                    SampleType.ZERO_STANDARD,
+                    "sample",
+                ],
+                "exclude": False,
+            }
+        )
+
+        ctx = LoadData().run(make_ctx(df, norm_rule=NormRule.B_B0))
+        out = NormalizeSignal().run(ctx)
+
+        assert out.data["signal"].tolist() == [0.8, 1.2, 0.5]
+        assert out.norm_span == 10.0
+
+    def test_b_b0_per_plate(self):
+        df = pd.DataFrame(
+            {
+                "signal": [10.0, 5.0, 20.0, 5.0, 3.0],
+                "concentration": [0, np.nan, 0, np.nan, np.nan],
+                "sample_type": [
+                    SampleType.ZERO_STANDARD,
+                    "sample",
+                    SampleType.ZERO_STANDARD,
+                    "sample",
+                    "sample",
+                ],
+                "plate_id": ["P1", "P1", "P2", "P2", "P3"],
+                "exclude": False,
+            }
+        )
+
+        ctx = LoadData().run(make_ctx(df, norm_rule=NormRule.B_B0, norm_by="plate_id"))
+        out = NormalizeSignal().run(ctx)
+
+        assert out.data["signal"].tolist() == [1.0, 0.5, 1.0, 0.25, 3.0]
+        assert out.norm_scales == {"P1": 10.0, "P2": 20.0}
+        assert out.norm_span is None
+
+    def test_unknown_norm_by_column_raises(self):
+        df = pd.DataFrame(
+            {
+                "signal": [1.0],
+                "concentration": [0],
+                "sample_type": [SampleType.ZERO_STANDARD],
+                "exclude": False,
+            }
+        )
+
+        ctx = LoadData().run(make_ctx(df, norm_rule=NormRule.B_B0, norm_by="nope"))
+        with pytest.raises(ValueError, match="norm_by"):
+            NormalizeSignal().run(ctx)
+
 
 class TestMaskOutliers:
     def test_zscore_flags_outlier_within_each_group(self):
@@ -349,6 +499,26 @@ class TestMaskOutliers:
         assert out.data.loc[2, "is_outlier"]
         assert out.data.loc[[3, 4], "is_outlier"].eq(False).all()
 
+    def test_group_by_splits_replicate_groups_per_plate(self):
+        df = pd.DataFrame(
+            {
+                "signal": [1.0, 1.0, 1.0, 9.0, 20.0, 21.0],
+                "concentration": np.nan,
+                "sample_type": "quality_control",
+                "qc_level": "mid",
+                "plate_id": ["P1", "P1", "P1", "P1", "P2", "P2"],
+                "exclude": False,
+            }
+        )
+
+        ctx = LoadData().run(make_ctx(df, z_threshold=1.0))
+        pooled = MaskOutliers().run(ctx.model_copy(deep=True))
+        ctx.group_by = "plate_id"
+        split = MaskOutliers().run(ctx)
+
+        assert pooled.data["is_outlier"].tolist()[4:] == [True, True]
+        assert split.data["is_outlier"].tolist() == [False] * 3 + [True, False, False]
+
     def test_group_with_single_point_is_never_flagged(self):
         df = pd.DataFrame(
             {
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+from yassa_bio.evaluation.backcalc import back_calc
+from yassa_bio.schema.analysis.config import LBAAnalysisConfig
+
+
+def make_ctx(fit_by=None):
+    class Ctx:
+        data = pd.DataFrame({"y": [1.0, 2.0, 3.0], "run": ["A", "B", "A"]})
+        analysis_config = LBAAnalysisConfig(curve_fit={"fit_by": fit_by})
+        curve_back = None
+        back_calc_curve = None
+
+    return Ctx()
+
+
+class TestBackCalc:
+    def test_computed_once_per_curve(self):
+        calls = []
+        ctx = make_ctx()
+        ctx.curve_back = lambda y: calls.append(len(y)) or y * 10
+
+        np.testing.assert_array_equal(back_calc(ctx), [10, 20, 30])
+        np.testing.assert_array_equal(back_calc(ctx), [10, 20, 30])
+        assert calls == [3]
+        assert "back_calc" in ctx.data
+
+        ctx.curve_back = lambda y: y + 1
+        np.testing.assert_array_equal(back_calc(ctx), [2, 3, 4])
+        np.testing.assert_array_equal(ctx.data["back_calc"], [2, 3, 4])
+
+    def test_grouped_curve_gets_group_column(self):
+        ctx = make_ctx(fit_by="run")
+        ctx.curve_back = lambda y, g: np.where(np.asarray(g) == "A", y, -y)
+
+        np.testing.assert_array_equal(back_calc(ctx), [1, -2, 3])
+
+    def test_recomputed_when_column_dropped(self):
+        ctx = make_ctx()
+        ctx.curve_back = lambda y: y
+        back_calc(ctx)
+        ctx.data = ctx.data.drop(columns="back_calc").iloc[1:]
+
+        np.testing.assert_array_equal(back_calc(ctx), [2, 3])
@@ -0,0 +1,135 @@
+from __future__ import annotations
+from datetime import datetime
+from pathlib import Path
+import pytest
+
+from yassa_bio.evaluation.cache import (
+    result_key,
+    ResultCache,
+    SQLiteResultCache,
+    DirectoryResultCache,
+)
+from yassa_bio.evaluation.context import LBAContext
+from yassa_bio.evaluation import run as run_mod
+from yassa_bio.schema.layout.batch import BatchData
+from yassa_bio.schema.layout.plate import PlateData, PlateLayout
+from yassa_bio.schema.layout.file import PlateReaderFile
+from yassa_bio.schema.layout.enum import PlateFormat, SampleType
+from yassa_bio.schema.layout.well import WellTemplate
+from yassa_bio.schema.analysis.config import LBAAnalysisConfig
+from yassa_bio.schema.acceptance.analytical.spec import LBAAnalyticalAcceptanceCriteria
+
+
+def make_batch(tmp_path: Path, content: str = "1.0,2.0\n") -> BatchData:
+    fpath = tmp_path / "plate.csv"
+    fpath.write_text(content)
+    plate = PlateData(
+        source_file=PlateReaderFile(path=fpath, run_date=datetime(2025, 1, 1, 12)),
+        plate_id="P1",
+        layout=PlateLayout(
+            plate_format=PlateFormat.FMT_96,
+            wells=[
+                WellTemplate(
+                    well="A1", file_row=0, file_col=0, sample_type=SampleType.BLANK
+                )
+            ],
+        ),
+    )
+    return BatchData(plates=[plate])
+
+
+class TestResultKey:
+    def test_stable_for_identical_inputs(self, tmp_path: Path):
+        batch = make_batch(tmp_path)
+        cfg = LBAAnalysisConfig()
+        crit = LBAAnalyticalAcceptanceCriteria()
+
+        assert result_key(batch, cfg, crit) == result_key(batch, cfg, crit)
+        assert result_key(batch, cfg, crit) == result_key(batch.plates[0], cfg, crit)
+
+    def test_changes_with_file_bytes(self, tmp_path: Path):
+        cfg = LBAAnalysisConfig()
+        crit = LBAAnalyticalAcceptanceCriteria()
+
+        k1 = result_key(make_batch(tmp_path, "1.0,2.0\n"), cfg, crit)
+        k2 = result_key(make_batch(tmp_path, "1.0,2.5\n"), cfg, crit)
+        assert k1 != k2
+
+    def test_changes_with_config(self, tmp_path: Path):
+        batch = make_batch(tmp_path)
+        crit = LBAAnalyticalAcceptanceCriteria()
+
+        k1 = result_key(batch, LBAAnalysisConfig(), crit)
+        k2 = result_key(batch, LBAAnalysisConfig(curve_fit={"model": "5PL"}), crit)
+        assert k1 != k2
+
+    def test_changes_with_plate_offset(self, tmp_path: Path):
+        batch = make_batch(tmp_path)
+        cfg = LBAAnalysisConfig()
+        crit = LBAAnalyticalAcceptanceCriteria()
+
+        k1 = result_key(batch, cfg, crit)
+        batch.plates[0].row_offset = 1
+        assert result_key(batch, cfg, crit) != k1
+
+
+@pytest.mark.parametrize("cache_cls", [SQLiteResultCache, DirectoryResultCache])
+class TestBackends:
+    def test_round_trip(self, tmp_path: Path, cache_cls):
+        cache = cache_cls(tmp_path / "cache.db")
+        payload = {"acceptance_results": {"qc": {"pass": True}}, "n": 1.5}
+
+        assert cache.get("abc") is None
+        cache.put("abc", payload)
+        assert cache.get("abc") == payload
+
+    def test_put_overwrites(self, tmp_path: Path, cache_cls):
+        cache = cache_cls(tmp_path / "cache.db")
+        cache.put("abc", {"v": 1})
+        cache.put("abc", {"v": 2})
+        assert cache.get("abc") == {"v": 2}
+
+
+class TestResultCache:
+    def test_incomplete_backend_fails_at_construction(self):
+        class GetOnly(ResultCache):
+            def get(self, key):
+                return None
+
+        with pytest.raises(TypeError, match="put"):
+            GetOnly()
+
+
+class TestRunWithCache:
+    def test_hit_skips_pipeline(self, tmp_path: Path, mocker):
+        batch = make_batch(tmp_path)
+        cfg = LBAAnalysisConfig()
+        crit = LBAAnalyticalAcceptanceCriteria()
+        cache = SQLiteResultCache(tmp_path / "cache.db")
+
+        def fake_run(ctx: LBAContext) -> LBAContext:
+            ctx.acceptance_results = {"calibration": {"pass": True}}
+            ctx.acceptance_history = [ctx.acceptance_results]
+            ctx.acceptance_pass = True
+            return ctx
+
+        spy = mocker.patch.object(run_mod.pipe, "run", side_effect=fake_run)
+
+        first = run_mod.run(batch, cfg, crit, cache=cache)
+        second = run_mod.run(batch, cfg, crit, cache=cache)
+
+        assert spy.call_count == 1
+        assert first.step_meta["result_cache"]["status"] == "miss"
+        assert second.step_meta["result_cache"]["status"] == "hit"
+        assert second.acceptance_results == {"calibration": {"pass": True}}
+        assert second.acceptance_pass is True
+        assert second.data is None
+
+    def test_no_cache_always_runs(self, tmp_path: Path, mocker):
+        batch = make_batch(tmp_path)
+        spy = mocker.patch.object(run_mod.pipe, "run", side_effect=lambda ctx: ctx)
+
+        run_mod.run(batch, LBAAnalysisConfig(), LBAAnalyticalAcceptanceCriteria())
+        run_mod.run(batch, LBAAnalysisConfig(), LBAAnalyticalAcceptanceCriteria())
+
+        assert spy.call_count == 2
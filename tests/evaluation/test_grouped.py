@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from yassa_bio.evaluation.run import run
+from yassa_bio.schema.layout.batch import BatchData
+from yassa_bio.schema.analysis.config import LBAAnalysisConfig
+from yassa_bio.schema.acceptance.analytical.spec import LBAAnalyticalAcceptanceCriteria
+from yassa_bio.utils.synthetic import SyntheticDesign, generate_batch, write_csv
+
+
+CFG = LBAAnalysisConfig()
+CRIT = LBAAnalyticalAcceptanceCriteria()
+
+
+@pytest.fixture
+def batch(tmp_path: Path):
+    return generate_batch(SyntheticDesign(noise_cv=0.01), tmp_path, 3, seed=1).batch
+
+
+class TestGroupedRun:
+    def test_one_child_per_plate_matching_single_plate_runs(self, batch):
+        ctx = run(batch, CFG, CRIT, group_by="plate_id")
+
+        assert list(ctx.groups) == [p.plate_id for p in batch.plates]
+        assert ctx.acceptance_pass is True
+        for plate in batch.plates:
+            child = ctx.groups[plate.plate_id]
+            ref = run(BatchData(plates=[plate]), CFG, CRIT)
+            np.testing.assert_allclose(child.curve_params, ref.curve_params)
+            assert child.blank_used == pytest.approx(ref.blank_used)
+            assert (child.data["plate_id"] == plate.plate_id).all()
+
+    def test_results_are_reported_per_group(self, batch):
+        ctx = run(batch, CFG, CRIT, group_by="plate_id")
+
+        for spec, res in ctx.acceptance_results.items():
+            assert res["pass"] is True
+            assert set(res["per_group"]) == set(ctx.groups)
+            for key, child in ctx.groups.items():
+                assert res["per_group"][key] == child.acceptance_results[spec]
+        assert ctx.pass_idx == 1
+
+    def test_reruns_only_the_failing_group(self, tmp_path: Path):
+        design = SyntheticDesign(noise_cv=0.0)
+        out = generate_batch(design, tmp_path, 2, seed=0)
+        signal = design.signal(out.concentration[1])
+        signal[14:16] *= 3  # both replicates of plate 2's lowest standard
+        write_csv(out.batch.plates[1].source_file.path, signal.reshape(8, 12))
+
+        ctx = run(out.batch, CFG, CRIT, group_by="plate_id")
+
+        first, second = (ctx.groups[p.plate_id] for p in out.batch.plates)
+        assert ctx.acceptance_pass is True
+        assert (first.pass_idx, second.pass_idx) == (1, 2)
+        assert first.dropped_cal_levels == []
+        assert min(second.dropped_cal_levels) == 7.8125
+
+    def test_child_metrics_are_collected(self, batch):
+        ctx = run(batch, CFG, CRIT, group_by="plate_id")
+
+        steps = [m["step"] for m in ctx.step_metrics]
+        assert steps.count("preprocess") == 1
+        assert steps.count("fit_calibration_data") == len(batch.plates)
+        assert steps[-1] == "per_group"
+        fits = [m for m in ctx.step_metrics if m["step"] == "fit_calibration_data"]
+        assert [m["group"] for m in fits] == [p.plate_id for p in batch.plates]
+        assert "group" not in ctx.step_metrics[-1]
+
+    def test_unknown_column_raises(self, batch):
+        with pytest.raises(ValueError, match="group_by"):
+            run(batch, CFG, CRIT, group_by="nope")
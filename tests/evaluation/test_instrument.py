@@ -0,0 +1,173 @@
+import tracemalloc
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import datetime
+from pathlib import Path
+import tempfile
+
+from yassa_bio.evaluation.instrument import InstrumentedStep, InstrumentedPipeline
+from yassa_bio.evaluation.analysis.step.preprocess import Preprocess, LoadData
+from yassa_bio.evaluation.context import LBAContext
+from yassa_bio.schema.layout.batch import BatchData
+from yassa_bio.schema.layout.plate import PlateData, PlateLayout
+from yassa_bio.schema.layout.file import PlateReaderFile
+from yassa_bio.schema.layout.enum import PlateFormat, SampleType
+from yassa_bio.schema.layout.well import WellTemplate
+from yassa_bio.schema.analysis.config import LBAAnalysisConfig
+from yassa_bio.schema.acceptance.analytical.spec import LBAAnalyticalAcceptanceCriteria
+
+
+def make_ctx(df: pd.DataFrame, **kw) -> LBAContext:
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as tmp:
+        tmp_path = Path(tmp.name)
+
+    plate = PlateData(
+        source_file=PlateReaderFile(
+            path=tmp_path,
+            run_date=datetime(2025, 1, 1, 12),
+            instrument="pytest",
+            operator="pytest",
+        ),
+        plate_id="P1",
+        layout=PlateLayout(
+            plate_format=PlateFormat.FMT_96,
+            wells=[
+                WellTemplate(
+                    well="A1", file_row=0, file_col=0, sample_type=SampleType.SAMPLE
+                )
+            ],
+        ),
+    )
+    plate._df = df.copy()
+    plate._mtime = tmp_path.stat().st_mtime
+
+    return LBAContext(
+        batch_data=BatchData(plates=[plate]),
+        analysis_config=LBAAnalysisConfig(),
+        acceptance_criteria=LBAAnalyticalAcceptanceCriteria(),
+        **kw,
+    )
+
+
+def qc_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "signal": [1.0, 1.1, 1.2, 2.0],
+            "concentration": np.nan,
+            "sample_type": "quality_control",
+            "qc_level": "mid",
+            "exclude": [False, False, False, True],
+        }
+    )
+
+
+class Boom(InstrumentedStep):
+    name = "boom"
+
+    def __init__(self) -> None:
+        super().__init__(name=self.name)
+
+    def logic(self, ctx):
+        raise RuntimeError("boom")
+
+
+class AbortOnce(InstrumentedStep):
+    name = "abort_once"
+
+    def __init__(self) -> None:
+        super().__init__(name=self.name)
+
+    def logic(self, ctx):
+        if ctx.pass_idx == 1:
+            ctx.abort_pass()
+        return ctx
+
+
+class AllocThenChild(InstrumentedStep):
+    name = "alloc_then_child"
+
+    def __init__(self) -> None:
+        super().__init__(name=self.name)
+
+    def logic(self, ctx):
+        buf = np.ones(1_000_000)
+        del buf
+        return LoadData().run(ctx, depth=2)
+
+
+class TestInstrumentedStep:
+    def test_records_parent_and_children(self):
+        ctx = Preprocess().run(make_ctx(qc_frame()))
+
+        by_step = {m["step"]: m for m in ctx.step_metrics}
+        assert {"preprocess", "load_data", "exclude_data"} <= set(by_step)
+        assert by_step["preprocess"]["depth"] == 1
+        assert by_step["load_data"]["depth"] == 2
+        assert by_step["exclude_data"]["rows_in"] == 4
+        assert by_step["exclude_data"]["rows_out"] == 3
+        assert by_step["preprocess"]["rows_in"] is None
+        assert ctx.step_metrics[-1]["step"] == "preprocess"
+        for m in ctx.step_metrics:
+            assert m["status"] == "ok"
+            assert m["wall_s"] >= 0 and m["cpu_s"] >= 0
+            assert m["peak_bytes"] is None
+
+    def test_hooks_receive_each_record(self):
+        seen: list[dict] = []
+        ctx = LoadData().run(make_ctx(qc_frame(), step_hooks=[seen.append]))
+
+        assert seen == ctx.step_metrics
+        assert seen[0]["step"] == "load_data"
+
+    def test_error_is_recorded_and_reraised(self):
+        ctx = make_ctx(qc_frame())
+        with pytest.raises(RuntimeError, match="boom"):
+            Boom().run(ctx)
+
+        assert ctx.step_metrics[-1]["step"] == "boom"
+        assert ctx.step_metrics[-1]["status"] == "error"
+
+    def test_peak_bytes_when_tracing(self):
+        tracemalloc.start()
+        try:
+            ctx = Preprocess().run(make_ctx(qc_frame()))
+        finally:
+            tracemalloc.stop()
+
+        parent = ctx.step_metrics[-1]
+        children = ctx.step_metrics[:-1]
+        assert parent["peak_bytes"] > 0
+        assert parent["peak_bytes"] >= max(m["peak_bytes"] for m in children)
+
+    def test_child_keeps_parent_peak_before_it(self):
+        tracemalloc.start()
+        try:
+            ctx = AllocThenChild().run(make_ctx(qc_frame()))
+        finally:
+            tracemalloc.stop()
+
+        child, parent = ctx.step_metrics
+        assert child["step"] == "load_data"
+        assert child["peak_bytes"] < 8_000_000
+        assert parent["peak_bytes"] >= 8_000_000
+
+
+class TestInstrumentedPipeline:
+    def test_counts_passes(self):
+        pipe = InstrumentedPipeline(steps=[LoadData(), AbortOnce()], max_passes=3)
+        ctx = pipe.run(make_ctx(qc_frame()))
+
+        assert ctx.pass_idx == 2
+        passes = [(m["step"], m["pass"]) for m in ctx.step_metrics]
+        assert passes == [
+            ("load_data", 1),
+            ("abort_once", 1),
+            ("load_data", 2),
+            ("abort_once", 2),
+        ]
+
+    def test_counts_from_one_on_every_run(self):
+        pipe = InstrumentedPipeline(steps=[LoadData()])
+        ctx = pipe.run(make_ctx(qc_frame()))
+        assert pipe.run(ctx).pass_idx == 1
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+from yassa_bio.evaluation.roles import RoleIndex, role_index
+from yassa_bio.schema.layout.enum import QCLevel, SampleType
+from yassa_bio.utils.category import as_categorical
+
+
+def frame() -> pd.DataFrame:
+    return as_categorical(
+        pd.DataFrame(
+            {
+                "sample_type": [
+                    "blank",
+                    "calibration_standard",
+                    "quality_control",
+                    "calibration_standard",
+                    "quality_control",
+                    "sample",
+                    "calibration_standard",
+                ],
+                "qc_level": [None, None, "low", None, "high", None, None],
+                "concentration": [np.nan, 10.0, 3.0, 20.0, 18.0, np.nan, 10.0],
+            }
+        )
+    )
+
+
+class TestRoleIndex:
+    def test_build(self):
+        idx = RoleIndex.build(frame())
+
+        assert idx.n_rows == 7
+        assert idx.rows(SampleType.CALIBRATION_STANDARD).tolist() == [1, 3, 6]
+        assert idx.rows("blank").tolist() == [0]
+        assert idx.qc_rows(QCLevel.LOW).tolist() == [2]
+        assert idx.qc_rows("high").tolist() == [4]
+        assert idx.cal_rows(10).tolist() == [1, 6]
+        assert idx.rows("unknown").size == 0
+        assert idx.mask(SampleType.SAMPLE).tolist() == [0, 0, 0, 0, 0, 1, 0]
+
+    def test_matches_boolean_scans(self):
+        df = frame()
+        idx = RoleIndex.build(df)
+        for st in SampleType:
+            expected = np.flatnonzero(df["sample_type"] == st.value)
+            np.testing.assert_array_equal(idx.rows(st), expected)
+
+    def test_object_columns_work(self):
+        df = pd.DataFrame({"sample_type": ["sample", "blank"]})
+        assert RoleIndex.build(df).rows("blank").tolist() == [1]
+
+
+class TestLazyRoleIndex:
+    def test_builds_and_rebuilds_when_out_of_step(self):
+        class Ctx:
+            data = frame()
+            role_index = None
+
+        ctx = Ctx()
+        first = role_index(ctx)
+        assert ctx.role_index is first
+        assert role_index(ctx) is first
+
+        ctx.data = ctx.data.copy()
+        assert role_index(ctx) is first
+
+        ctx.data = ctx.data.iloc[:3]
+        assert role_index(ctx).n_rows == 3
+
+    def test_rebuilds_when_rows_reordered(self):
+        class Ctx:
+            data = frame()
+            role_index = None
+
+        ctx = Ctx()
+        first = role_index(ctx)
+        ctx.data = ctx.data.iloc[::-1]
+
+        rebuilt = role_index(ctx)
+        assert rebuilt is not first
+        assert rebuilt.rows("blank").tolist() == [6]
@@ -0,0 +1,216 @@
+import asyncio
+import pickle
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import yassa_bio.evaluation.run as run_mod
+from yassa_bio.evaluation.run import arun, arun_many
+from yassa_bio.schema.analysis.config import LBAAnalysisConfig
+from yassa_bio.schema.acceptance.analytical.spec import LBAAnalyticalAcceptanceCriteria
+from yassa_bio.utils.synthetic import SyntheticDesign, generate_batch, write_csv
+
+
+CFG = LBAAnalysisConfig()
+CRIT = LBAAnalyticalAcceptanceCriteria()
+
+
+@pytest.fixture
+def plates(tmp_path: Path):
+    return generate_batch(SyntheticDesign(noise_cv=0.0), tmp_path, 2, seed=0).batch
+
+
+class TestArun:
+    def test_matches_run(self, plates):
+        ctx = asyncio.run(arun(plates, CFG, CRIT))
+        ref = run_mod.run(plates, CFG, CRIT)
+
+        assert ctx.acceptance_pass is True
+        np.testing.assert_allclose(ctx.curve_params, ref.curve_params)
+
+    def test_process_pool(self, plates):
+        async def go():
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                return await arun(plates, CFG, CRIT, executor=pool)
+
+        ctx = asyncio.run(go())
+        assert ctx.acceptance_pass is True
+        assert np.isfinite(ctx.curve_back(np.array([1.0]))).all()
+        pickle.dumps(ctx.curve_fwd)
+
+
+class TestArunMany:
+    def test_concurrency_limit_and_order(self, mocker, plates):
+        active = peak = 0
+        lock = threading.Lock()
+
+        def fake_run(data, cfg, crit, **kw):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return data.plate_id
+
+        mocker.patch.object(run_mod, "run", side_effect=fake_run)
+        inputs = plates.plates * 4
+        out = asyncio.run(arun_many(inputs, CFG, CRIT, max_concurrency=2))
+
+        assert out == [p.plate_id for p in inputs]
+        assert peak <= 2
+
+    def test_return_exceptions(self, mocker, plates):
+        def fake_run(data, cfg, crit, **kw):
+            if data.plate_id == "SYN-00001":
+                raise ValueError("fit failed")
+            return data.plate_id
+
+        mocker.patch.object(run_mod, "run", side_effect=fake_run)
+        out = asyncio.run(arun_many(plates.plates, CFG, CRIT, return_exceptions=True))
+
+        assert out[0] == "SYN-00000"
+        assert isinstance(out[1], ValueError)
+
+    def test_forwards_run_options(self, mocker, plates):
+        seen = []
+
+        def fake_run(data, cfg, crit, **kw):
+            seen.append(kw)
+            return data.plate_id
+
+        mocker.patch.object(run_mod, "run", side_effect=fake_run)
+        hooks = [print]
+        asyncio.run(
+            arun_many(
+                plates.plates,
+                CFG,
+                CRIT,
+                hooks=hooks,
+                trace_memory=True,
+                group_by="plate_id",
+            )
+        )
+
+        assert len(seen) == 2
+        for kw in seen:
+            assert kw["hooks"] is hooks
+            assert kw["trace_memory"] is True
+            assert kw["group_by"] == "plate_id"
+
+    def test_rejects_zero_concurrency(self, plates):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            asyncio.run(arun_many(plates.plates, CFG, CRIT, max_concurrency=0))
+
+
+class TestTraceMemory:
+    def test_leaves_tracing_it_did_not_start(self, plates):
+        tracemalloc.start()
+        try:
+            ctx = run_mod.run(plates, CFG, CRIT, trace_memory=True)
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+        assert all(r["peak_bytes"] is not None for r in ctx.step_metrics)
+
+    def test_stops_tracing_it_started(self, plates):
+        run_mod.run(plates, CFG, CRIT, trace_memory=True)
+
+        assert not tracemalloc.is_tracing()
+
+
+class TestRerun:
+    def test_dropped_levels_stay_dropped_on_next_pass(self, tmp_path: Path):
+        design = SyntheticDesign(noise_cv=0.0)
+        out = generate_batch(design, tmp_path, 1, seed=0)
+        signal = design.signal(out.concentration[0])
+        signal[14:16] *= 3  # both replicates of the lowest standard
+        write_csv(out.batch.plates[0].source_file.path, signal.reshape(8, 12))
+
+        ctx = run_mod.run(out.batch, CFG, CRIT)
+
+        assert ctx.acceptance_pass is True
+        assert ctx.pass_idx == 2
+        assert min(ctx.dropped_cal_levels) == 7.8125
+        assert not ctx.calib_df["concentration"].isin(ctx.dropped_cal_levels).any()
+
+    def test_back_calc_column_follows_refit(self, tmp_path: Path):
+        design = SyntheticDesign(noise_cv=0.0)
+        out = generate_batch(design, tmp_path, 1, seed=0)
+        signal = design.signal(out.concentration[0])
+        signal[14:16] *= 3
+        write_csv(out.batch.plates[0].source_file.path, signal.reshape(8, 12))
+
+        ctx = run_mod.run(out.batch, CFG, CRIT)
+
+        assert ctx.back_calc_curve is ctx.curve_back
+        np.testing.assert_array_equal(
+            ctx.data["back_calc"], ctx.curve_back(ctx.data["y"].to_numpy(float))
+        )
+
+
+class TestFitBy:
+    def test_per_plate_curves_in_one_run(self, tmp_path: Path):
+        design = SyntheticDesign(noise_cv=0.0)
+        out = generate_batch(design, tmp_path, 2, seed=0)
+        signal = design.signal(out.concentration[1]) * 1.5  # brighter plate
+        write_csv(out.batch.plates[1].source_file.path, signal.reshape(8, 12))
+        cfg = LBAAnalysisConfig(curve_fit={"fit_by": "plate_id"})
+
+        ctx = run_mod.run(out.batch, cfg, CRIT)
+
+        params = ctx.curve_params_by_group
+        assert ctx.acceptance_pass is True
+        assert list(params) == [p.plate_id for p in out.batch.plates]
+        a0, b0, c0, d0 = params["SYN-00000"]
+        a1, b1, c1, d1 = params["SYN-00001"]
+        assert (d1 - a1) / (d0 - a0) == pytest.approx(1.5, rel=1e-3)
+        assert (b1, c1) == pytest.approx((b0, c0), rel=1e-3)
+
+
+class TestFitFailure:
+    def test_failed_fit_fails_acceptance_instead_of_raising(self, plates):
+        cfg = LBAAnalysisConfig(curve_fit={"solver": {"max_nfev": 1}})
+
+        ctx = run_mod.run(plates, cfg, CRIT)
+
+        assert ctx.acceptance_pass is False
+        assert "batch" in ctx.fit_failures
+        assert ctx.acceptance_results["calibration"]["num_pass"] == 0
+
+    def test_failed_plate_only_fails_its_group(self, tmp_path: Path):
+        out = generate_batch(SyntheticDesign(noise_cv=0.0), tmp_path, 2, seed=0)
+        write_csv(out.batch.plates[1].source_file.path, np.full((8, 12), np.nan))
+
+        ctx = run_mod.run(out.batch, CFG, CRIT, group_by="plate_id")
+
+        first, second = ctx.groups.values()
+        assert first.acceptance_pass is True
+        assert second.acceptance_pass is False
+        assert second.fit_failures
+
+    def test_failed_plate_fit_fails_batch_acceptance(self, tmp_path: Path):
+        design = SyntheticDesign(noise_cv=0.0)
+        out = generate_batch(design, tmp_path, 4, seed=0)
+        signal = design.signal(out.concentration[3])
+        signal[: design.standards.num_levels * design.std_replicates] = np.nan
+        path = out.batch.plates[3].source_file.path
+        write_csv(path, signal.reshape(8, 12))
+        path.write_text(path.read_text().replace("nan", "OVRFLW"))
+        cfg = LBAAnalysisConfig(curve_fit={"fit_by": "plate_id"})
+
+        ctx = run_mod.run(out.batch, cfg, CRIT)
+
+        assert list(ctx.fit_failures) == ["SYN-00003"]
+        assert ctx.acceptance_pass is False
+        for res in ctx.acceptance_results.values():
+            assert res["pass"] is False
+            assert list(res["fit_failures"]) == ["SYN-00003"]
+        assert ctx.acceptance_results["calibration"]["num_pass"] == 0
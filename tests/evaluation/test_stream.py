@@ -0,0 +1,191 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import yassa_bio.evaluation.stream as stream_mod
+from yassa_bio.evaluation.stream import stream, astream
+from yassa_bio.schema.analysis.config import LBAAnalysisConfig
+from yassa_bio.schema.acceptance.analytical.spec import LBAAnalyticalAcceptanceCriteria
+from yassa_bio.utils.synthetic import SyntheticDesign, generate_batch
+
+
+CFG = LBAAnalysisConfig()
+CRIT = LBAAnalyticalAcceptanceCriteria()
+
+
+@pytest.fixture
+def fake_run(mocker):
+    def _run(data, cfg, crit, cache=None):
+        if data == "bad":
+            raise ValueError("bad plate")
+        time.sleep(0.01)
+        return {"data": data}
+
+    return mocker.patch.object(stream_mod, "run", side_effect=_run)
+
+
+def resolver(path: Path):
+    return path.name
+
+
+class TestStream:
+    def test_yields_every_item(self, fake_run):
+        out = list(stream(["a", "b", "c"], CFG, CRIT, layout_resolver=resolver))
+
+        assert sorted(r.source for r in out) == ["a", "b", "c"]
+        assert sorted(r.ctx["data"] for r in out) == ["a", "b", "c"]
+        assert all(r.error is None for r in out)
+
+    def test_path_without_resolver_is_an_error(self, fake_run):
+        (res,) = stream(["a"], CFG, CRIT)
+
+        assert res.ctx is None
+        assert isinstance(res.error, TypeError)
+
+    def test_failure_does_not_stop_stream(self, fake_run):
+        out = list(stream(["a", "bad", "b"], CFG, CRIT, layout_resolver=resolver))
+        errors = {r.source: r.error for r in out}
+
+        assert isinstance(errors["bad"], ValueError)
+        assert errors["a"] is None and errors["b"] is None
+
+    def test_back_pressure(self, fake_run):
+        pulled = 0
+        lock = threading.Lock()
+
+        def source():
+            nonlocal pulled
+            for i in range(20):
+                with lock:
+                    pulled += 1
+                yield str(i)
+
+        consumed = 0
+        for _ in stream(
+            source(), CFG, CRIT, layout_resolver=resolver, max_workers=2, max_pending=3
+        ):
+            consumed += 1
+            time.sleep(0.02)
+            with lock:
+                assert pulled - consumed <= 3 + 1
+        assert consumed == 20
+
+    def test_source_error_is_raised(self, fake_run):
+        def source():
+            yield "a"
+            raise OSError("watcher died")
+
+        with pytest.raises(OSError, match="watcher died"):
+            list(stream(source(), CFG, CRIT, layout_resolver=resolver))
+
+    def test_early_close_stops_feeder(self, fake_run):
+        def source():
+            i = 0
+            while True:
+                i += 1
+                yield str(i)
+
+        gen = stream(source(), CFG, CRIT, layout_resolver=resolver, max_pending=2)
+        next(gen)
+        gen.close()
+
+    def test_early_close_does_not_wait_for_slow_source(self, fake_run):
+        def source():
+            yield "a"
+            time.sleep(5)
+            yield "b"
+
+        gen = stream(source(), CFG, CRIT, layout_resolver=resolver)
+        next(gen)
+        t0 = time.perf_counter()
+        gen.close()
+        assert time.perf_counter() - t0 < 1
+
+
+class TestAStream:
+    def test_async_source(self, fake_run):
+        async def source():
+            for name in ["a", "b", "c"]:
+                await asyncio.sleep(0)
+                yield name
+
+        async def collect():
+            return [
+                r async for r in astream(source(), CFG, CRIT, layout_resolver=resolver)
+            ]
+
+        out = asyncio.run(collect())
+        assert sorted(r.ctx["data"] for r in out) == ["a", "b", "c"]
+
+    def test_result_not_held_back_by_slow_source(self, fake_run):
+        gate = asyncio.Event()
+
+        async def source():
+            yield "a"
+            await gate.wait()
+            yield "b"
+
+        async def first():
+            agen = astream(source(), CFG, CRIT, layout_resolver=resolver)
+            res = await asyncio.wait_for(anext(agen), timeout=5)
+            gate.set()
+            rest = [r async for r in agen]
+            return res, rest
+
+        res, rest = asyncio.run(first())
+        assert res.source == "a"
+        assert [r.source for r in rest] == ["b"]
+
+    def test_early_break(self, fake_run):
+        gate = asyncio.Event()
+
+        async def source():
+            yield "a"
+            await gate.wait()
+            yield "b"
+
+        async def first():
+            agen = astream(source(), CFG, CRIT, layout_resolver=resolver)
+            res = await anext(agen)
+            await agen.aclose()  # what `break` in `async for` leads to
+            return res
+
+        assert asyncio.run(first()).source == "a"
+
+    def test_blocking_sync_source_does_not_stall_loop(self, fake_run):
+        def source():
+            yield "a"
+            time.sleep(0.3)
+            yield "b"
+
+        async def main():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            task = asyncio.create_task(ticker())
+            out = [
+                r async for r in astream(source(), CFG, CRIT, layout_resolver=resolver)
+            ]
+            task.cancel()
+            return ticks, out
+
+        ticks, out = asyncio.run(main())
+        assert sorted(r.source for r in out) == ["a", "b"]
+        assert ticks >= 10
+
+
+class TestStreamPipeline:
+    def test_real_plates(self, tmp_path: Path):
+        out = generate_batch(SyntheticDesign(noise_cv=0.0), tmp_path, 3, seed=0)
+        results = list(stream(out.batch.plates, CFG, CRIT, max_workers=2))
+
+        assert len(results) == 3
+        assert all(r.error is None and r.ctx.acceptance_pass for r in results)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import yassa_bio.io.reader as reader_mod
+from yassa_bio.io.cache import grid_cache_path, load_grid, save_grid
+from yassa_bio.io.reader import read_grids
+from yassa_bio.schema.layout.file import PlateReaderFile
+from yassa_bio.schema.layout.plate import PlateData, PlateLayout
+from yassa_bio.schema.layout.well import WellTemplate
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    path = tmp_path / "plate.csv"
+    path.write_text("h,1,2\nA,1.5,2.5\n")
+    return path
+
+
+@pytest.fixture
+def reader_calls(mocker) -> list:
+    real_get = reader_mod.get
+    calls: list = []
+
+    def counting_get(kind, name):
+        fn = real_get(kind, name)
+
+        def reader(**kw):
+            calls.append(kw)
+            return fn(**kw)
+
+        return reader
+
+    mocker.patch.object(reader_mod, "get", side_effect=counting_get)
+    return calls
+
+
+def _touch_later(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+class TestGridCache:
+    def test_round_trip_is_memory_mapped(self, tmp_path: Path, source: Path):
+        grid = np.arange(6, dtype=float).reshape(2, 3)
+        save_grid(tmp_path / "c", source, 0, grid)
+        out = load_grid(tmp_path / "c", source, 0)
+
+        assert isinstance(out, np.memmap)
+        np.testing.assert_array_equal(out, grid)
+
+    def test_miss_when_absent(self, tmp_path: Path, source: Path):
+        assert load_grid(tmp_path / "c", source, 0) is None
+
+    def test_source_rewrite_misses_and_replaces_entry(
+        self, tmp_path: Path, source: Path
+    ):
+        cache = tmp_path / "c"
+        old = save_grid(cache, source, 0, np.zeros((1, 1)))
+        _touch_later(source)
+
+        assert load_grid(cache, source, 0) is None
+        new = save_grid(cache, source, 0, np.ones((1, 1)))
+        assert new != old and not old.exists()
+        assert new == grid_cache_path(cache, source, 0)
+
+    def test_sheets_are_separate_entries(self, tmp_path: Path, source: Path):
+        cache = tmp_path / "c"
+        save_grid(cache, source, 0, np.zeros((1, 1)))
+        save_grid(cache, source, 1, np.ones((1, 1)))
+
+        assert load_grid(cache, source, 0)[0, 0] == 0
+        assert load_grid(cache, source, 1)[0, 0] == 1
+
+
+class TestReadGridsCache:
+    def test_second_read_skips_parser(
+        self, tmp_path: Path, source: Path, reader_calls: list
+    ):
+        first = read_grids(source, [0], tmp_path / "c")
+        second = read_grids(source, [0], tmp_path / "c")
+
+        assert len(reader_calls) == 1
+        np.testing.assert_array_equal(first[0], second[0])
+
+    def test_reparses_after_source_change(
+        self, tmp_path: Path, source: Path, reader_calls: list
+    ):
+        read_grids(source, [0], tmp_path / "c")
+        source.write_text("h,1,2\nA,9.0,2.5\n")
+        _touch_later(source)
+
+        assert read_grids(source, [0], tmp_path / "c")[0][1, 1] == 9.0
+        assert len(reader_calls) == 2
+
+    def test_plate_df_uses_cache(
+        self, tmp_path: Path, source: Path, reader_calls: list
+    ):
+        def plate() -> PlateData:
+            return PlateData(
+                source_file=PlateReaderFile(path=source, cache_dir=tmp_path / "c"),
+                plate_id="P1",
+                layout=PlateLayout(
+                    wells=[
+                        WellTemplate(
+                            well="A1", file_row=1, file_col=1, sample_type="sample"
+                        )
+                    ]
+                ),
+            )
+
+        assert plate().df["signal"].iloc[0] == 1.5
+        assert plate().df["signal"].iloc[0] == 1.5
+        assert len(reader_calls) == 1
@@ -0,0 +1,170 @@
+from __future__ import annotations
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import yassa_bio.io.reader as reader_mod
+from yassa_bio.io.group import group_by_file, load_file_group
+from yassa_bio.io.reader import read_grids, to_numeric_grid
+from yassa_bio.schema.layout.file import PlateReaderFile
+from yassa_bio.schema.layout.plate import PlateData, PlateLayout
+from yassa_bio.schema.layout.well import WellTemplate
+
+
+def _layout(sheet_index: int = 0) -> PlateLayout:
+    return PlateLayout(
+        sheet_index=sheet_index,
+        wells=[
+            WellTemplate(well="A1", file_row=1, file_col=1, sample_type="sample"),
+            WellTemplate(well="A2", file_row=1, file_col=2, sample_type="sample"),
+        ],
+    )
+
+
+def _plate(path: Path, plate_id: str, layout: PlateLayout, **kw) -> PlateData:
+    return PlateData(
+        source_file=PlateReaderFile(path=path), plate_id=plate_id, layout=layout, **kw
+    )
+
+
+@pytest.fixture
+def stacked_csv(tmp_path: Path) -> Path:
+    path = tmp_path / "stacked.csv"
+    path.write_text(
+        "Plate,1,2\nA,1.0,2.0\n,,\nPlate,1,2\nA,3.0,4.0\n,,\nPlate,1,2\nA,5.0,x\n"
+    )
+    return path
+
+
+@pytest.fixture
+def reader_calls(mocker) -> list:
+    real_get = reader_mod.get
+    calls: list = []
+
+    def counting_get(kind, name):
+        fn = real_get(kind, name)
+
+        def reader(**kw):
+            calls.append(kw)
+            return fn(**kw)
+
+        return reader
+
+    mocker.patch.object(reader_mod, "get", side_effect=counting_get)
+    return calls
+
+
+class TestToNumericGrid:
+    def test_coerces_text_to_nan(self):
+        raw = pd.DataFrame([["1.5", "abc"], [None, "2"]], dtype=object)
+        np.testing.assert_array_equal(
+            to_numeric_grid(raw), np.array([[1.5, np.nan], [np.nan, 2.0]])
+        )
+
+
+class TestFileGroup:
+    def test_stacked_plates_share_layout_and_one_parse(
+        self, stacked_csv: Path, reader_calls: list
+    ):
+        layout = _layout()
+        plates = [
+            _plate(stacked_csv, f"P{i}", layout, row_offset=3 * i) for i in range(3)
+        ]
+        mtime = stacked_csv.stat().st_mtime
+        load_file_group(plates, {p.plate_id: mtime for p in plates})
+
+        assert len(reader_calls) == 1
+        assert list(plates[0].df["signal"]) == [1.0, 2.0]
+        assert list(plates[1].df["signal"]) == [3.0, 4.0]
+        assert plates[2].df["signal"].iloc[0] == 5.0
+        assert np.isnan(plates[2].df["signal"].iloc[1])
+
+    def test_col_offset(self, tmp_path: Path):
+        path = tmp_path / "wide.csv"
+        path.write_text("x,1,2,x,1,2\nA,1,2,A,3,4\n")
+        plate = _plate(path, "right", _layout(), col_offset=3)
+
+        assert list(plate.df["signal"]) == [3.0, 4.0]
+
+    def test_workbook_sheets_parsed_once(self, tmp_path: Path, reader_calls: list):
+        path = tmp_path / "book.xlsx"
+        with pd.ExcelWriter(path, engine="openpyxl") as xls:
+            for i in range(2):
+                pd.DataFrame([["h", "h", "h"], ["A", i, i + 0.5]]).to_excel(
+                    xls, sheet_name=f"S{i}", header=False, index=False
+                )
+        plates = [_plate(path, f"P{i}", _layout(sheet_index=i)) for i in range(2)]
+        load_file_group(plates, {p.plate_id: 0.0 for p in plates})
+
+        assert len(reader_calls) == 1
+        assert reader_calls[0]["sheet_index"] == [0, 1]
+        assert list(plates[1].df["signal"]) == [1.0, 1.5]
+
+    def test_offset_out_of_range_raises(self, stacked_csv: Path):
+        plate = _plate(stacked_csv, "far", _layout(), row_offset=100)
+        with pytest.raises(ValueError, match="While loading plate 'far'"):
+            _ = plate.df
+
+    def test_read_error_names_first_plate(self, tmp_path: Path):
+        path = tmp_path / "plate.bad"
+        path.write_text("x")
+        plates = [_plate(path, "first", _layout()), _plate(path, "second", _layout())]
+        with pytest.raises(ValueError, match="While loading plate 'first'"):
+            load_file_group(plates, {"first": 0.0, "second": 0.0})
+
+    def test_bad_sheet_names_its_own_plate(self, tmp_path: Path):
+        path = tmp_path / "book.xlsx"
+        with pd.ExcelWriter(path, engine="openpyxl") as xls:
+            for i in range(2):
+                pd.DataFrame([["h", "h", "h"], ["A", i, i]]).to_excel(
+                    xls, sheet_name=f"S{i}", header=False, index=False
+                )
+        plates = [
+            _plate(path, "GOOD", _layout(sheet_index=0)),
+            _plate(path, "BAD", _layout(sheet_index=7)),
+        ]
+        with pytest.raises(ValueError, match=r"plate 'BAD' .*\(sheet 7\)"):
+            load_file_group(plates, {"GOOD": 0.0, "BAD": 0.0})
+
+    def test_group_by_file_keeps_order(self, stacked_csv: Path, tmp_path: Path):
+        other = tmp_path / "other.csv"
+        other.write_text("1\n")
+        plates = [
+            _plate(other, "O1", _layout()),
+            _plate(stacked_csv, "S1", _layout()),
+            _plate(other, "O2", _layout()),
+        ]
+        groups = group_by_file(plates)
+
+        assert list(groups) == [other, stacked_csv]
+        assert [p.plate_id for p in groups[other]] == ["O1", "O2"]
+
+    def test_csv_grid_shared_across_sheet_indices(self, stacked_csv: Path):
+        grids = read_grids(stacked_csv, [0, 2])
+        assert grids[0] is grids[2]
+
+
+class TestCompiledLayout:
+    def test_cached_until_wells_replaced(self):
+        layout = _layout()
+        frame, rows, cols = layout.compiled()
+
+        assert layout.compiled()[0] is frame
+        assert list(rows) == [1, 1] and list(cols) == [1, 2]
+
+        layout.wells = layout.wells[:1]
+        assert len(layout.compiled()[0]) == 1
+
+    def test_in_place_well_edit_invalidates(self):
+        layout = _layout()
+        layout.compiled()
+
+        layout.wells[1].file_row = 3
+        frame, rows, _ = layout.compiled()
+        assert list(rows) == [1, 3]
+
+        layout.wells[0].exclude_reason = "bubble"
+        layout.wells[0].exclude = True
+        assert layout.compiled()[0]["exclude"].tolist() == [True, False]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from yassa_bio.evaluation.run import run
+from yassa_bio.io.results import export_results, read_results, results_tables
+from yassa_bio.schema.analysis.config import LBAAnalysisConfig
+from yassa_bio.schema.acceptance.analytical.spec import LBAAnalyticalAcceptanceCriteria
+from yassa_bio.utils.synthetic import SyntheticDesign, generate_batch
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(scope="module")
+def ctx(tmp_path_factory):
+    out = generate_batch(
+        SyntheticDesign(noise_cv=0.0), tmp_path_factory.mktemp("raw"), 2, seed=0
+    )
+    for i, p in enumerate(out.batch.plates):
+        p.source_file.run_date = datetime(2025, 3, 1 + i, 9)
+    return run(out.batch, LBAAnalysisConfig(), LBAAnalyticalAcceptanceCriteria())
+
+
+@pytest.fixture(scope="module")
+def grouped_ctx(tmp_path_factory):
+    out = generate_batch(
+        SyntheticDesign(noise_cv=0.0), tmp_path_factory.mktemp("raw"), 2, seed=0
+    )
+    return run(
+        out.batch,
+        LBAAnalysisConfig(),
+        LBAAnalyticalAcceptanceCriteria(),
+        group_by="plate_id",
+    )
+
+
+class TestResultsTables:
+    def test_shapes_and_keys(self, ctx):
+        tables = results_tables(ctx, "r1", study="S1")
+
+        wells, levels, runs = tables["wells"], tables["levels"], tables["runs"]
+        assert len(wells) == 192
+        assert set(wells["well_status"]) == {"used"}
+        assert set(wells["plate_id"]) == {"SYN-00000", "SYN-00001"}
+        assert set(wells["run_date"]) == {"2025-03-01", "2025-03-02"}
+        assert set(levels["spec"]) == {"calibration", "qc"}
+        assert runs.loc[0, "run_date"] == "2025-03-01"
+        assert runs.loc[0, "acceptance_pass"]
+        assert {"calibration_pass", "qc_pass"} <= set(runs.columns)
+
+        params = tables["params"]
+        assert len(params) == 1
+        assert params.loc[0, "group"] is None
+        assert len(params.loc[0, "curve_params"]) == 4
+        assert levels["group"].isna().all()
+
+    def test_group_wise_run_is_flattened_per_group(self, grouped_ctx):
+        tables = results_tables(grouped_ctx, "r1")
+        keys = {"SYN-00000", "SYN-00001"}
+
+        levels, params = tables["levels"], tables["params"]
+        assert not levels.empty
+        assert set(levels["group"]) == keys
+        assert set(levels["spec"]) == {"calibration", "qc"}
+        assert sorted(params["group"]) == sorted(keys)
+        assert params["fit_failure"].isna().all()
+        assert all(len(p) == 4 for p in params["curve_params"])
+
+
+class TestParquetRoundTrip:
+    def test_export_and_read(self, ctx, tmp_path: Path):
+        run_id = export_results(ctx, tmp_path, study="S1")
+
+        wells = read_results(tmp_path, "wells")
+        runs = read_results(tmp_path, "runs")
+        assert len(wells) == 192
+        assert set(wells["run_id"]) == {run_id}
+        assert runs.loc[0, "plate_ids"].tolist() == ["SYN-00000", "SYN-00001"]
+        assert (tmp_path / "wells" / "study=S1" / "plate_id=SYN-00001").is_dir()
+        assert len(read_results(tmp_path, "params")) == 1
+
+    def test_reexport_is_idempotent(self, ctx, tmp_path: Path):
+        export_results(ctx, tmp_path, study="S1")
+        export_results(ctx, tmp_path, study="S1")
+
+        assert len(read_results(tmp_path, "runs")) == 1
+
+    def test_filters_and_columns(self, ctx, tmp_path: Path):
+        export_results(ctx, tmp_path, run_id="a", study="S1")
+        export_results(ctx, tmp_path, run_id="b", study="S2")
+
+        out = read_results(
+            tmp_path,
+            "wells",
+            filters={"study": "S2", "plate_id": ["SYN-00001"]},
+            columns=["run_id", "well", "signal"],
+        )
+        assert list(out.columns) == ["run_id", "well", "signal"]
+        assert len(out) == 96 and set(out["run_id"]) == {"b"}
+
+        levels = read_results(tmp_path, "levels")
+        assert set(levels["run_id"]) == {"a", "b"}
+
+    def test_group_wise_run_gets_its_own_id(self, ctx, grouped_ctx, tmp_path: Path):
+        assert export_results(ctx, tmp_path) != export_results(grouped_ctx, tmp_path)
+
+        params = read_results(tmp_path, "params")
+        assert len(params) == 3
+        assert set(params["group"].dropna()) == {"SYN-00000", "SYN-00001"}
+
+    def test_missing_table_is_empty(self, tmp_path: Path):
+        assert read_results(tmp_path, "runs").empty
+
+    def test_unknown_table_raises(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="Unknown table"):
+            read_results(tmp_path, "plates")
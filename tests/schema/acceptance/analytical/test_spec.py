@@ -79,3 +79,11 @@ class TestLBAAnalyticalAcceptanceValidation:
                 pass_fraction_each_level=0.5,
             )
         assert "acc_tol_pct" in str(e.value)
+
+    def test_precision_and_total_error_are_opt_in(self):
+        qc = AnalyticalQCSpec()
+        assert (qc.cv_tol_pct, qc.cv_tol_pct_edge) == (None, None)
+        assert (qc.total_error_tol_pct, qc.total_error_tol_pct_edge) == (None, None)
+        assert AnalyticalQCSpec(cv_tol_pct=20).cv_tol_pct == 20
+        with pytest.raises(ValidationError, match="total_error_tol_pct"):
+            AnalyticalQCSpec(total_error_tol_pct=150)
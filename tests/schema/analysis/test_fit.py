@@ -1,7 +1,7 @@
 from pydantic import ValidationError
 import pytest
 
-from yassa_bio.schema.analysis.fit import CurveFit
+from yassa_bio.schema.analysis.fit import CurveFit, ModelSelection, SolverOptions
 from yassa_bio.schema.analysis.enum import (
     CurveModel,
     Weighting,
@@ -56,3 +56,49 @@ class TestCurveFitDefaults:
 
         restored = CurveFit(**blob)
         assert restored == cfg
+
+
+class TestSolverOptions:
+    def test_defaults(self) -> None:
+        opts = CurveFit().solver
+        assert opts.method == "trf"
+        assert opts.loss == "linear"
+        assert opts.bounded is True
+        assert opts.max_nfev is None
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"method": "lm"}, {"method": "lm", "bounded": False, "loss": "huber"}],
+    )
+    def test_lm_rejects_bounds_and_robust_loss(self, kwargs) -> None:
+        with pytest.raises(ValidationError, match="lm"):
+            SolverOptions(**kwargs)
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"max_nfev": 0}, {"ftol": 0}, {"f_scale": -1}, {"loss": "l2"}]
+    )
+    def test_invalid_values_raise(self, kwargs) -> None:
+        with pytest.raises(ValidationError):
+            SolverOptions(**kwargs)
+
+
+class TestModelSelection:
+    def test_defaults(self) -> None:
+        sel = CurveFit(model="auto").selection
+        assert sel.candidates == ["4PL", "5PL", "linear"]
+        assert sel.criterion == "aic"
+        assert sel.lack_of_fit_alpha == 0.05
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"candidates": []},
+            {"candidates": ["4PL", "auto"]},
+            {"criterion": "r2"},
+            {"lack_of_fit_alpha": 1.5},
+            {"max_workers": 0},
+        ],
+    )
+    def test_invalid_values_raise(self, kwargs) -> None:
+        with pytest.raises(ValidationError):
+            ModelSelection(**kwargs)
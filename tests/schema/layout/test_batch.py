@@ -140,9 +140,29 @@ class TestBatchData:
         batch = BatchData(plates=[plate1, plate2])
         combined = batch.df
 
-        # shape and row order
-        assert combined.shape == (2, 3)
+        # shape and row order, plus the plate_id / source_file tags
+        assert combined.shape == (2, 5)
         assert list(combined["signal"]) == [0.1, 0.2]
+        assert list(combined["plate_id"]) == ["P1", "P2"]
+        assert list(combined["source_file"]) == [
+            str(plate1.source_file.path),
+            str(plate2.source_file.path),
+        ]
+        assert isinstance(combined["plate_id"].dtype, pd.CategoricalDtype)
+
+    def test_shared_source_file_is_one_category(self, tmp_path: Path):
+        df = pd.DataFrame({"well": ["A1", "B1"], "signal": [0.1, 0.2]})
+        plate1 = _fake_plate(tmp_path, "P1", df)
+        plate2 = _fake_plate(tmp_path, "P2", df)
+        plate2.source_file = plate1.source_file
+        plate2._mtime = plate1._mtime
+
+        combined = BatchData(plates=[plate1, plate2]).df
+
+        assert combined["source_file"].cat.categories.tolist() == [
+            str(plate1.source_file.path)
+        ]
+        assert combined["plate_id"].cat.codes.tolist() == [0, 0, 1, 1]
 
     def test_returns_cached_object_if_unchanged(self, tmp_path: Path):
         df = pd.DataFrame({"well": ["A1"], "signal": [1.23]})
@@ -170,3 +190,81 @@ class TestBatchData:
 
         assert new_df is not old_df
         pd.testing.assert_frame_equal(new_df, old_df)
+
+
+def _csv_plate(path: Path, plate_id: str, row: int = 0) -> PlateData:
+    return PlateData(
+        source_file=PlateReaderFile(path=path),
+        plate_id=plate_id,
+        layout=PlateLayout(
+            wells=[
+                WellTemplate(
+                    well="A1", file_row=row, file_col=0, sample_type=SampleType.SAMPLE
+                ),
+                WellTemplate(
+                    well="A2", file_row=row, file_col=1, sample_type=SampleType.SAMPLE
+                ),
+            ]
+        ),
+    )
+
+
+class TestBatchLoading:
+    @pytest.fixture
+    def files(self, tmp_path: Path) -> list[Path]:
+        paths = []
+        for i in range(6):
+            p = tmp_path / f"plate{i}.csv"
+            p.write_text(f"{i}.0,{i}.5\n{i}.1,{i}.6\n")
+            paths.append(p)
+        return paths
+
+    def test_parallel_matches_sequential_order(self, files):
+        seq = BatchData(plates=[_csv_plate(p, p.stem) for p in files])
+        par = BatchData(plates=[_csv_plate(p, p.stem) for p in files], max_workers=4)
+
+        pd.testing.assert_frame_equal(par.df, seq.df)
+        assert list(par.df["signal"][::2]) == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+
+    def test_shared_file_is_read_once(self, files, mocker):
+        import yassa_bio.io.reader as reader_mod
+
+        real_get = reader_mod.get
+        calls = []
+
+        def counting_get(kind, name):
+            fn = real_get(kind, name)
+
+            def reader(**kw):
+                calls.append(kw["path"])
+                return fn(**kw)
+
+            return reader
+
+        mocker.patch.object(reader_mod, "get", side_effect=counting_get)
+        batch = BatchData(
+            plates=[
+                _csv_plate(files[0], "P1", row=0),
+                _csv_plate(files[0], "P2", row=1),
+                _csv_plate(files[1], "P3"),
+            ],
+            max_workers=2,
+        )
+
+        assert list(batch.df["signal"]) == [0.0, 0.5, 0.1, 0.6, 1.0, 1.5]
+        assert sorted(calls) == [files[0], files[1]]
+
+    def test_parallel_error_message_preserved(self, files, tmp_path: Path):
+        bad = tmp_path / "bad.xyz"
+        bad.write_text("x")
+        batch = BatchData(
+            plates=[_csv_plate(files[0], "ok"), _csv_plate(bad, "broken")],
+            max_workers=2,
+        )
+
+        with pytest.raises(ValueError, match="While loading plate 'broken'"):
+            _ = batch.df
+
+    def test_max_workers_must_be_positive(self):
+        with pytest.raises(ValidationError):
+            BatchData(plates=[], max_workers=0)
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from yassa_bio.schema.layout.enum import QCLevel, SampleType
+from yassa_bio.utils.category import (
+    SAMPLE_TYPE_DTYPE,
+    QC_LEVEL_DTYPE,
+    as_categorical,
+    eq_mask,
+    isin_mask,
+)
+from yassa_bio.utils.synthetic import SyntheticDesign, generate_batch
+
+
+def frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "sample_type": [SampleType.BLANK, "calibration_standard", "sample"],
+            "qc_level": [None, None, QCLevel.LOW],
+            "signal": [0.1, 0.2, 0.3],
+        }
+    )
+
+
+class TestAsCategorical:
+    def test_converts_enums_and_strings(self):
+        out = as_categorical(frame())
+
+        assert out["sample_type"].dtype == SAMPLE_TYPE_DTYPE
+        assert out["qc_level"].dtype == QC_LEVEL_DTYPE
+        assert list(out["sample_type"]) == ["blank", "calibration_standard", "sample"]
+        assert out["qc_level"].isna().tolist() == [True, True, False]
+
+    def test_unknown_values_extend_categories(self):
+        out = as_categorical(pd.DataFrame({"sample_type": ["blank", "custom"]}))
+
+        assert list(out["sample_type"]) == ["blank", "custom"]
+        assert "custom" in out["sample_type"].cat.categories
+
+    def test_noop_returns_same_object(self):
+        df = as_categorical(frame())
+        assert as_categorical(df) is df
+
+    def test_does_not_mutate_input(self):
+        df = frame()
+        as_categorical(df)
+        assert df["sample_type"].dtype == object
+
+
+class TestMasks:
+    def test_eq_mask_categorical_and_object_agree(self):
+        df = frame()
+        cat = as_categorical(df)
+        for value in [SampleType.BLANK, "sample", SampleType.QUALITY_CONTROL]:
+            np.testing.assert_array_equal(
+                eq_mask(cat["sample_type"], value),
+                eq_mask(df["sample_type"].map(str), value),
+            )
+
+    def test_eq_mask_missing_category_is_all_false(self):
+        cat = as_categorical(frame())
+        assert not eq_mask(cat["qc_level"], "unknown").any()
+
+    def test_isin_mask(self):
+        cat = as_categorical(frame())
+        mask = isin_mask(cat["sample_type"], [SampleType.BLANK, "sample", "nope"])
+        assert mask.tolist() == [True, False, True]
+
+
+class TestLoadedFrames:
+    def test_plate_and_batch_frames_are_categorical(self, tmp_path: Path):
+        batch = generate_batch(SyntheticDesign(noise_cv=0.0), tmp_path, 2).batch
+
+        assert batch.plates[0].df["sample_type"].dtype == SAMPLE_TYPE_DTYPE
+        assert batch.df["sample_type"].dtype == SAMPLE_TYPE_DTYPE
+        assert batch.df["qc_level"].dtype == QC_LEVEL_DTYPE
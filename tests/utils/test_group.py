@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+from yassa_bio.utils.group import group_codes, group_moments, group_rows, group_stat
+
+
+class TestGroupCodes:
+    def test_sorted_keys_and_missing(self):
+        codes, keys = group_codes(pd.Series(["P2", "P1", None, "P2"]))
+        assert list(keys) == ["P1", "P2"]
+        assert codes.tolist() == [1, 0, -1, 1]
+
+    def test_categorical(self):
+        values = pd.Series(["b", "a", "b"], dtype="category")
+        codes, keys = group_codes(values)
+        assert list(keys) == ["a", "b"]
+        assert codes.tolist() == [1, 0, 1]
+
+
+class TestGroupStat:
+    def test_mean_per_group(self):
+        values = np.array([1.0, 3.0, 10.0, 99.0])
+        mask = np.array([True, True, True, False])
+        out = group_stat(values, mask, np.array([0, 0, 1, 1]), 2, "mean")
+        np.testing.assert_array_equal(out, [2.0, 10.0])
+
+    def test_empty_group_is_nan_and_nan_values_skipped(self):
+        values = np.array([np.nan, 5.0, 7.0])
+        mask = np.array([True, True, False])
+        out = group_stat(values, mask, np.array([0, 0, 2]), 3, "max")
+        assert out[0] == 5.0
+        assert np.isnan(out[1]) and np.isnan(out[2])
+
+    def test_negative_codes_ignored(self):
+        values = np.array([1.0, 2.0])
+        out = group_stat(values, np.ones(2, bool), np.array([-1, 0]), 1, "min")
+        np.testing.assert_array_equal(out, [2.0])
+
+    def test_mean_skips_non_finite_and_empty_groups(self):
+        values = np.array([1.0, np.nan, 3.0, np.inf])
+        codes = np.array([0, 0, 0, 1])
+        out = group_stat(values, np.ones(4, bool), codes, 3, "mean")
+        assert out[0] == 2.0
+        assert np.isnan(out[1]) and np.isnan(out[2])
+
+
+class TestGroupMoments:
+    def test_matches_pandas(self):
+        values = np.array([1.0, 2.0, 4.0, 10.0, np.nan, 7.0])
+        codes = np.array([0, 0, 0, 1, 1, 2])
+        count, mean, sd = group_moments(values, codes, 4)
+        ref = pd.Series(values).groupby(codes).agg(["count", "mean", "std"])
+        np.testing.assert_array_equal(count, [3, 1, 1, 0])
+        np.testing.assert_allclose(mean[:3], ref["mean"])
+        np.testing.assert_allclose(sd[:3], ref["std"])
+        assert np.isnan(mean[3]) and np.isnan(sd[3])
+
+
+class TestGroupRows:
+    def test_rows_per_group_sorted(self):
+        rows = group_rows(np.array([1, 0, -1, 1, 0]), 3)
+        assert [r.tolist() for r in rows] == [[1, 4], [0, 3], []]
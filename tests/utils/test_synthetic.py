@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+from pathlib import Path
+from pydantic import ValidationError
+
+from yassa_bio.utils.synthetic import (
+    SyntheticDesign,
+    make_layout,
+    generate_batch,
+    row_label,
+)
+from yassa_bio.evaluation.run import run
+from yassa_bio.schema.analysis.config import LBAAnalysisConfig
+from yassa_bio.schema.analysis.enum import CurveModel
+from yassa_bio.schema.acceptance.analytical.spec import LBAAnalyticalAcceptanceCriteria
+from yassa_bio.schema.layout.enum import PlateFormat, SampleType, QCLevel
+
+
+class TestRowLabel:
+    @pytest.mark.parametrize(
+        "i, expected", [(0, "A"), (25, "Z"), (26, "AA"), (47, "AV"), (701, "ZZ")]
+    )
+    def test_labels(self, i, expected):
+        assert row_label(i) == expected
+
+
+class TestSyntheticDesign:
+    def test_params_must_match_model(self):
+        with pytest.raises(ValidationError, match="takes 5 params"):
+            SyntheticDesign(model=CurveModel.FIVE_PL, params=[1, 1, 1, 1])
+
+    def test_fixed_wells_must_fit(self):
+        with pytest.raises(ValidationError, match="do not fit"):
+            SyntheticDesign(plate_format=PlateFormat.FMT_6)
+
+
+class TestMakeLayout:
+    def test_roles_and_coordinates(self):
+        design = SyntheticDesign(qc_levels=[QCLevel.LOW, QCLevel.HIGH])
+        layout = make_layout(design)
+        types = [w.sample_type for w in layout.wells]
+
+        assert len(layout.wells) == 96
+        assert types.count(SampleType.CALIBRATION_STANDARD) == 16
+        assert types.count(SampleType.BLANK) == 2
+        assert types.count(SampleType.QUALITY_CONTROL) == 4
+        assert types.count(SampleType.SAMPLE) == 96 - 22
+        assert (layout.wells[0].file_row, layout.wells[0].file_col) == (7, 1)
+        assert layout.wells[0].concentration == 1000
+        assert layout.wells[-1].well == "H12"
+
+    def test_3456_well_plate(self):
+        layout = make_layout(SyntheticDesign(plate_format=PlateFormat.FMT_3456))
+        assert len(layout.wells) == 3456
+        assert layout.wells[-1].well == "AV72"
+
+
+class TestGenerateBatch:
+    def test_csv_round_trip_matches_truth(self, tmp_path: Path):
+        design = SyntheticDesign(noise_cv=0.0)
+        out = generate_batch(design, tmp_path, 3, seed=1)
+
+        assert len(out.batch.plates) == 3
+        assert out.concentration.shape == (3, 96)
+        for i, plate in enumerate(out.batch.plates):
+            expected = design.signal(out.concentration[i])
+            np.testing.assert_allclose(plate.df["signal"], expected, rtol=1e-5)
+
+    def test_excel_one_sheet_per_plate(self, tmp_path: Path):
+        design = SyntheticDesign(noise_cv=0.0)
+        out = generate_batch(design, tmp_path, 2, seed=1, file_format="excel")
+
+        assert [p.layout.sheet_index for p in out.batch.plates] == [0, 1]
+        assert out.batch.plates[0].source_file.path == tmp_path / "plates.xlsx"
+        np.testing.assert_allclose(
+            out.batch.plates[1].df["signal"],
+            design.signal(out.concentration[1]),
+            rtol=1e-9,
+        )
+
+    def test_outliers_are_scaled(self, tmp_path: Path):
+        design = SyntheticDesign(noise_cv=0.0, outlier_fraction=0.2, outlier_scale=4)
+        out = generate_batch(design, tmp_path, 1, seed=3)
+        sig = out.batch.plates[0].df["signal"].to_numpy()
+        clean = design.signal(out.concentration[0])
+
+        assert 0 < out.outlier.sum() < 96
+        np.testing.assert_allclose(
+            sig[out.outlier[0]], 4 * clean[out.outlier[0]], rtol=1e-5
+        )
+
+    def test_unknown_format_raises(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="Unsupported file_format"):
+            generate_batch(SyntheticDesign(), tmp_path, 1, file_format="parquet")
+
+    def test_noise_free_plate_passes_pipeline(self, tmp_path: Path):
+        out = generate_batch(SyntheticDesign(noise_cv=0.0), tmp_path, 1, seed=0)
+        ctx = run(
+            out.batch,
+            LBAAnalysisConfig(),
+            LBAAnalyticalAcceptanceCriteria(),
+        )
+
+        assert ctx.acceptance_pass is True